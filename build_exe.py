@@ -25,6 +25,8 @@ def build_exe():
     main_script = os.path.join(script_dir, "main.py")
     font_path = os.path.join(script_dir, "fonts", "PressStart2P.ttf")
     data_path = os.path.join(script_dir, "data", "palavras.json")
+    perfis_path = os.path.join(script_dir, "data", "dificuldades.json")
+    mascaras_path = os.path.join(script_dir, "data", "mascaras.json")
     icon_path = os.path.join(script_dir, "icon.ico")  # opcional (Windows)
 
     # Detectar plataforma para ajustar sintaxe do PyInstaller
@@ -42,7 +44,14 @@ def build_exe():
         "--name=CacaPalavras",          # Nome do executável/app
         f"--add-data={font_path}{sep}fonts",  # Incluir fonte
         f"--add-data={data_path}{sep}data",   # Incluir palavras.json
+        f"--add-data={perfis_path}{sep}data", # Incluir dificuldades.json (perfis)
+        f"--add-data={mascaras_path}{sep}data",  # Incluir mascaras.json (formatos desenhados)
         "--clean",                      # Limpar cache antes de compilar
+        # Inicialização mais rápida do --onefile: menos bytes para extrair
+        # e nada para descomprimir com UPX a cada execução
+        "--noupx",
+        "--exclude-module=tkinter",
+        "--exclude-module=unittest",
     ]
     
     # Adicionar ícone se existir
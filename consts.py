@@ -39,6 +39,31 @@ def get_resource_path(relative_path):
         base_path = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(base_path, relative_path)
 
+def get_app_dir():
+    """
+    Retorna a pasta onde ficam os arquivos gerados pelo jogo (perfis, logs).
+
+    Returns:
+        str: Caminho absoluto da pasta da aplicação
+
+    Funcionamento:
+    - Em desenvolvimento: diretório do script atual (raiz do projeto)
+    - Em executável compilado: pasta do próprio executável, e não a pasta
+      temporária sys._MEIPASS, que é apagada quando o programa termina
+    """
+    if getattr(sys, "frozen", False):
+        return os.path.dirname(os.path.abspath(sys.executable))
+    return os.path.dirname(os.path.abspath(__file__))
+
+# ============================================================================
+# CONFIGURAÇÕES DA JANELA
+# ============================================================================
+JANELA_LARGURA = 1280        # Tamanho inicial da janela e das telas
+JANELA_ALTURA = 720
+JANELA_LARGURA_MIN = 960     # Menor tamanho em que as telas ainda cabem
+JANELA_ALTURA_MIN = 540
+ATRASO_REDIMENSIONAR_MS = 150  # Sem novos resizes por esse tempo = redimensionamento concluído
+
 # ============================================================================
 # CONFIGURAÇÕES DE FONTE
 # ============================================================================
@@ -52,19 +77,38 @@ FONT_PIXEL_SIZE = 13      # Tamanho padrão para textos e botões
 # ============================================================================
 # Caminho para o arquivo JSON que contém todas as palavras e dicas do jogo
 PATH_PALAVRAS_JSON = get_resource_path("data/palavras.json")
+# Perfis de dificuldade (tamanho, palavras, direções...; ver dificult/dificult.py)
+PATH_DIFICULDADES_JSON = get_resource_path("data/dificuldades.json")
+# Máscaras desenhadas do formato do tabuleiro (ver game/mascaras.py)
+PATH_MASCARAS_JSON = get_resource_path("data/mascaras.json")
 
 # ============================================================================
 # CONFIGURAÇÕES DE DIFICULDADE
 # ============================================================================
+# Padrões usados quando data/dificuldades.json não existe ou é inválido
 # Define os tamanhos das matrizes para cada nível de dificuldade
 EASY_SIZE = 10    # Matriz 10x10 - nível fácil (100 células)
 MEDIUM_SIZE = 15  # Matriz 15x15 - nível médio (225 células)
 HARD_SIZE = 20    # Matriz 20x20 - nível difícil (400 células)
+MARATHON_SIZE = 200  # Matriz 200x200 - maratona (40.000 células, tabuleiro com rolagem/zoom)
+
+# Pontuação de dificuldade desejada (0 a 1, ver game/pontuacao.py) por código de dificuldade
+PONTUACAO_ALVO = {1: 0.25, 2: 0.4, 3: 0.52, 4: 0.5}
+QUANTIDADE_PALAVRAS = 10      # Palavras por partida
+CANDIDATOS_GERACAO = 8        # Tabuleiros gerados por partida; fica o mais próximo do alvo
+ORCAMENTO_CANDIDATOS_MS = 60  # Para de gerar candidatos após esse tempo (ex.: maratona)
+CELULAS_LADRILHOS = 250_000   # A partir de quantas células (ex.: 500x500) a geração é em ladrilhos paralelos
+CACHE_TABULEIROS_MB = 64      # Tamanho máximo do cache de tabuleiros em disco (--cache)
+SEMENTES_CACHE = 256          # Tabuleiros diferentes por perfil com o cache ligado (sementes sorteadas)
+SERVIDOR_TABULEIROS = "127.0.0.1:47321"  # Endereço padrão do servidor_tabuleiros.py ("host:porta" ou "unix:/caminho")
+TEMPO_LIMITE_SERVIDOR_S = 1.0  # Espera máxima pelo servidor antes de gerar a partida no próprio jogo
+PRAZO_MENSAGEM_MS = 250       # Busca do modo mensagem secreta; esgotado, a partida sai comum
 
 # ============================================================================
 # SISTEMA DE LOGGING
 # ============================================================================
 log_counter = 0  # Contador global para numerar logs sequencialmente
+log_ativo = True  # Desligado por ferramentas em lote (soak, simulações) para não poluir a saída
 
 def log(archive="desconhecido", msg="sem mensagem de log"):
     """
@@ -78,5 +122,7 @@ def log(archive="desconhecido", msg="sem mensagem de log"):
     Útil para rastrear execução durante desenvolvimento e debug
     """
     global log_counter
+    if not log_ativo:
+        return
     log_counter += 1
     print(f"LOG[{log_counter}][{archive}]: {msg}")
\ No newline at end of file
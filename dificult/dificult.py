@@ -1,64 +1,208 @@
 """
 DIFICULT/DIFICULT.PY - Lógica de Seleção de Dificuldade
 =======================================================
-Este módulo contém a lógica para conversão de níveis de dificuldade em tamanhos de matriz.
+Este módulo contém a lógica para conversão de níveis de dificuldade em perfis de geração.
 Responsável por:
-- Mapear códigos de dificuldade (1, 2, 3) para tamanhos de matriz
-- Fornecer tamanho padrão para códigos inválidos
-- Manter estado da dificuldade selecionada (opcional, para referência futura)
+- Carregar os perfis de data/dificuldades.json (um por código de dificuldade)
+- Mapear códigos de dificuldade (1, 2, 3, 4) para perfis
+- Fornecer perfil padrão para códigos inválidos
+- Manter estado da dificuldade selecionada (perfil atual)
 
-Mapeamento de dificuldades:
+Cada perfil define: tamanho da matriz (linhas x colunas, pode ser
+retangular), quantidade de palavras, direções permitidas, faixa de tamanho
+das palavras, orçamento de tempo da geração, pontuação de dificuldade alvo
+e, opcionalmente, a máscara de formato do tabuleiro (game/mascaras.py).
+
+Perfis padrão (usados se o JSON faltar ou for inválido):
 - Código 1 (Fácil): Matriz 10x10 (100 células)
 - Código 2 (Médio): Matriz 15x15 (225 células)  
 - Código 3 (Difícil): Matriz 20x20 (400 células)
+- Código 4 (Maratona): Matriz 200x200 (40.000 células)
 """
 
-from consts import EASY_SIZE, MEDIUM_SIZE, HARD_SIZE, log
+import json
+import threading
+
+from consts import (
+    EASY_SIZE, MEDIUM_SIZE, HARD_SIZE, MARATHON_SIZE, PONTUACAO_ALVO, QUANTIDADE_PALAVRAS,
+    ORCAMENTO_CANDIDATOS_MS, PATH_DIFICULDADES_JSON, log
+)
+from game import mascaras
+
+# Nomes das direções aceitas no JSON -> vetor (dx, dy) por letra
+# (dx = deslocamento de linha, dy = deslocamento de coluna)
+DIRECOES = {
+    "direita": (0, 1),
+    "baixo": (1, 0),
+    "baixo_direita": (1, 1),
+    "baixo_esquerda": (1, -1),
+    "esquerda": (0, -1),
+    "cima": (-1, 0),
+    "cima_esquerda": (-1, -1),
+    "cima_direita": (-1, 1),
+}
 
 # Variável global para manter referência do último tamanho selecionado
 # (usado principalmente para debugging/logging)
 matriz_size = 0
+perfil_atual = None            # Perfil da última dificuldade escolhida
+
+_perfis = None                 # Cache dos perfis (lidos uma vez por processo)
+_lock_perfis = threading.Lock() # A pré-carga lê os perfis em segundo plano (utils/recursos.py)
+
+
+class Perfil:
+    """
+    Parâmetros de geração de uma dificuldade.
+    """
+
+    __slots__ = ("codigo", "nome", "linhas", "colunas", "palavras", "direcoes",
+                 "tamanho_min", "tamanho_max", "orcamento_ms", "pontuacao_alvo", "mascara")
+
+    def __init__(self, codigo, dados):
+        """
+        Args:
+            codigo (int): Código da dificuldade
+            dados (dict): Entrada do dificuldades.json (ver data/dificuldades.json)
+
+        Raises:
+            ValueError: Se algum campo estiver ausente ou fora do permitido
+        """
+        try:
+            self.codigo = codigo
+            self.nome = str(dados.get("nome", codigo))
+            self.linhas = int(dados["linhas"])
+            self.colunas = int(dados.get("colunas", self.linhas))
+            self.palavras = int(dados.get("palavras", QUANTIDADE_PALAVRAS))
+            self.direcoes = tuple(DIRECOES[nome] for nome in dados.get("direcoes", DIRECOES))
+            self.tamanho_min = int(dados.get("tamanho_min", 1))
+            self.tamanho_max = int(dados.get("tamanho_max", max(self.linhas, self.colunas)))
+            self.orcamento_ms = float(dados.get("orcamento_ms", ORCAMENTO_CANDIDATOS_MS))
+            self.pontuacao_alvo = float(dados.get("pontuacao_alvo", PONTUACAO_ALVO[2]))
+            self.mascara = dados.get("mascara")
+            if self.mascara is not None:
+                self.mascara = str(self.mascara)
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"perfil {codigo} inválido: {e!r}") from None
+        if self.linhas < 1 or self.colunas < 1 or self.palavras < 1 or not self.direcoes:
+            raise ValueError(f"perfil {codigo} inválido: tamanho, palavras e direções precisam ser positivos")
+        if not 1 <= self.tamanho_min <= self.tamanho_max:
+            raise ValueError(f"perfil {codigo} inválido: faixa de tamanho {self.tamanho_min}-{self.tamanho_max}")
+        if self.mascara is not None and self.mascara not in mascaras.nomes():
+            raise ValueError(f"perfil {codigo} inválido: máscara desconhecida {self.mascara!r}")
+
+    def __repr__(self):
+        formato = "" if self.mascara is None else f" ({self.mascara})"
+        return (f"Perfil({self.codigo}, {self.nome!r}, {self.linhas}x{self.colunas}{formato}, "
+                f"{self.palavras} palavras)")
+
+
+def _perfis_padrao():
+    """Perfis equivalentes às constantes de consts.py (todas as direções)."""
+    tamanhos = {1: EASY_SIZE, 2: MEDIUM_SIZE, 3: HARD_SIZE, 4: MARATHON_SIZE}
+    return {
+        codigo: Perfil(codigo, {"linhas": tamanho, "pontuacao_alvo": PONTUACAO_ALVO[codigo]})
+        for codigo, tamanho in tamanhos.items()
+    }
+
+
+def carregar_perfis():
+    """
+    Carrega os perfis de dificuldade.
+
+    Lê data/dificuldades.json na primeira chamada; as seguintes devolvem o
+    mesmo dicionário (que não deve ser modificado por quem chama). Perfis
+    ausentes ou inválidos no JSON usam o padrão de consts.py.
+
+    Returns:
+        dict: {código (int): Perfil}
+    """
+    global _perfis
+    with _lock_perfis:
+        if _perfis is not None:
+            return _perfis
+        perfis = _perfis_padrao()
+        try:
+            with open(PATH_DIFICULDADES_JSON, "r", encoding="utf-8") as f:
+                dados = json.load(f).get("dificuldades", {})
+        except (OSError, ValueError, AttributeError) as e:
+            log("dificult", f"Usando perfis padrão: {e}")
+            dados = {}
+        for chave, valor in dados.items():
+            try:
+                codigo = int(chave)
+                perfis[codigo] = Perfil(codigo, valor)
+            except (ValueError, AttributeError) as e:
+                log("dificult", f"Ignorando perfil {chave!r}: {e}")
+        _perfis = perfis
+        return _perfis
+
+
+def perfil(dificuldade):
+    """
+    Perfil de um código de dificuldade (o médio para códigos desconhecidos).
+
+    Args:
+        dificuldade (int): Código da dificuldade
+
+    Returns:
+        Perfil: Parâmetros de geração
+    """
+    perfis = carregar_perfis()
+    return perfis.get(dificuldade) or perfis[2]
+
 
 def bnt_dificult_escolhida(dificuldade):
     """
-    Converte código de dificuldade em tamanho de matriz para o jogo.
+    Converte código de dificuldade no perfil de geração do jogo.
     
     Esta função mapeia os níveis de dificuldade selecionados pelo usuário
-    nos tamanhos apropriados de matriz que serão usados na geração do 
+    nos perfis (data/dificuldades.json) que serão usados na geração do 
     caça-palavras.
     
     Args:
         dificuldade (int): Código da dificuldade selecionada
-                          1 = Fácil, 2 = Médio, 3 = Difícil
+                          1 = Fácil, 2 = Médio, 3 = Difícil, 4 = Maratona
                           
     Returns:
-        int: Tamanho da matriz (N para uma matriz NxN)
+        Perfil: Perfil da dificuldade (linhas, colunas, palavras, direções...)
         
     Comportamento:
-    - Dificuldade 1: Retorna EASY_SIZE (10) para matriz 10x10
-    - Dificuldade 2: Retorna MEDIUM_SIZE (15) para matriz 15x15  
-    - Dificuldade 3: Retorna HARD_SIZE (20) para matriz 20x20
-    - Outros valores: Retorna MEDIUM_SIZE como padrão seguro
+    - Dificuldade 1: Fácil (padrão 10x10)
+    - Dificuldade 2: Médio (padrão 15x15)
+    - Dificuldade 3: Difícil (padrão 20x20)
+    - Dificuldade 4: Maratona (padrão 200x200)
+    - Outros valores: Retorna o perfil médio como padrão seguro
     
     Efeitos colaterais:
-    - Atualiza variável global matriz_size para referência futura
+    - Atualiza perfil_atual e matriz_size (linhas) para referência futura
     """
-    global matriz_size
+    global matriz_size, perfil_atual
     
-    # Mapear código de dificuldade para tamanho de matriz
-    if dificuldade == 1:
-        matriz_size = EASY_SIZE      # 10x10 - 100 células
-    elif dificuldade == 2:
-        matriz_size = MEDIUM_SIZE    # 15x15 - 225 células
-    elif dificuldade == 3:
-        matriz_size = HARD_SIZE      # 20x20 - 400 células
-    else:
-        # Valor padrão para entradas inválidas
-        matriz_size = MEDIUM_SIZE    # Fallback seguro para médio
-    
-    return matriz_size
+    perfil_atual = perfil(dificuldade)
+    matriz_size = perfil_atual.linhas
+    return perfil_atual
     
     
+def usar_mascara(nome):
+    """
+    Aplica uma máscara de formato a todos os perfis (tabuleiros temáticos).
+
+    Chamado na inicialização (main.py --mascara), antes de qualquer geração.
+
+    Args:
+        nome (str | None): Máscara (game/mascaras.py); None volta aos retângulos
+
+    Raises:
+        ValueError: Se a máscara não existir
+    """
+    if nome is not None and nome not in mascaras.nomes():
+        raise ValueError(f"máscara desconhecida: {nome!r} (disponíveis: {', '.join(mascaras.nomes())})")
+    for p in carregar_perfis().values():
+        p.mascara = nome
+    log("dificult", f"Máscara dos perfis: {nome}")
+
+
 def bnt_voltar_menu(callback=None):
     """
     Callback executado quando o botão "Voltar" é clicado na tela de dificuldade.
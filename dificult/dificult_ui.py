@@ -3,7 +3,7 @@ DIFICULT/DIFICULT_UI.PY - Interface de Seleção de Dificuldade
 =============================================================
 Este módulo define a segunda tela do jogo, onde o usuário escolhe o nível de dificuldade.
 Responsável por:
-- Exibir opções de dificuldade (Fácil, Médio, Difícil)
+- Exibir opções de dificuldade (Fácil, Médio, Difícil, Maratona)
 - Fornecer botão de retorno ao menu principal
 - Aplicar tema visual consistente com o resto do jogo
 - Implementar injeção de callbacks para cada nível
@@ -15,11 +15,11 @@ Menu Principal → [botão "jogar"] → Seleção Dificuldade → [escolher nív
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFontDatabase, QFont
 
 from utils.ui import criar_botao
 import dificult.dificult as dificult
-from consts import FONT_PATH, FONT_PIXEL_SIZE
+from utils import recursos
+from consts import FONT_PIXEL_SIZE, JANELA_LARGURA_MIN, JANELA_ALTURA_MIN
 
 class DificultUI(QWidget):
     """
@@ -29,7 +29,8 @@ class DificultUI(QWidget):
     permitindo que a lógica de negócio seja definida externamente.
     """
     
-    def __init__(self, easy_cb=None, medium_cb=None, hard_cb=None, back_cb=None):
+    def __init__(self, easy_cb=None, medium_cb=None, hard_cb=None, back_cb=None,
+                 marathon_cb=None):
         """
         Inicializa a tela de seleção de dificuldade.
         
@@ -37,6 +38,7 @@ class DificultUI(QWidget):
             easy_cb (callable): Callback executado quando "Fácil" é escolhido
             medium_cb (callable): Callback executado quando "Médio" é escolhido  
             hard_cb (callable): Callback executado quando "Difícil" é escolhido
+            marathon_cb (callable): Callback executado quando "Maratona" é escolhido
             back_cb (callable): Callback executado quando "Voltar" é clicado
             
         Se algum callback não for fornecido, usa comportamento padrão simples.
@@ -50,16 +52,15 @@ class DificultUI(QWidget):
         # CONFIGURAÇÃO DA JANELA
         # ============================================================================
         self.setWindowTitle("Seleção de Dificuldade")
-        self.setFixedSize(1280, 720)  # Mesmo tamanho das outras telas para consistência
-        self.setStyleSheet("background-color: #111018;")  # Tema escuro consistente
+        self.setMinimumSize(JANELA_LARGURA_MIN, JANELA_ALTURA_MIN)  # Mesmo mínimo das outras telas
+        self.setStyleSheet(recursos.estilo("fundo"))  # Tema escuro consistente
 
         # ============================================================================
         # CARREGAMENTO DA FONTE PIXEL
         # ============================================================================
-        # Tentar carregar fonte pixel com tratamento de erro robusto
+        # Tentar obter a fonte pixel (compartilhada) com tratamento de erro robusto
         try:
-            QFontDatabase.addApplicationFont(FONT_PATH)
-            font_pixel = QFont("Press Start 2P", FONT_PIXEL_SIZE)
+            font_pixel = recursos.fonte(FONT_PIXEL_SIZE)
         except Exception:
             # Se falhar no carregamento, usar fonte padrão do sistema
             font_pixel = None
@@ -101,6 +102,14 @@ class DificultUI(QWidget):
         )
         layout.addWidget(btn_hard, alignment=Qt.AlignmentFlag.AlignCenter)
 
+        # Botão "Maratona" - matriz 200x200 (tabuleiro com rolagem e zoom)
+        btn_marathon = criar_botao(
+            "Maratona", 
+            marathon_cb if marathon_cb is not None else (lambda: dificult.bnt_dificult_escolhida(4)), 
+            font_pixel
+        )
+        layout.addWidget(btn_marathon, alignment=Qt.AlignmentFlag.AlignCenter)
+
         # Botão "Voltar" - retorna ao menu principal
         bnt_back = criar_botao(
             "Voltar", 
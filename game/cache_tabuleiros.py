@@ -0,0 +1,174 @@
+"""
+GAME/CACHE_TABULEIROS.PY - Cache de Tabuleiros em Disco
+=======================================================
+Este módulo guarda tabuleiros já gerados em uma pasta, para que quiosques
+que reiniciam com frequência não precisem gerá-los de novo.
+Responsável por:
+- Ler e gravar uma partida por chave (parâmetros de geração + semente)
+- Gravar de forma atômica (arquivo temporário + os.replace), para que
+  vários processos possam compartilhar a mesma pasta
+- Limitar o tamanho total da pasta, removendo os menos usados (LRU)
+- Contar acertos e falhas (taxa de acertos)
+
+Formato:
+- Um arquivo JSON por partida, com nome = hash da chave; o arquivo guarda
+  também a chave, conferida na leitura
+- Leitores veem sempre um arquivo inteiro (o antigo ou o novo), nunca um
+  arquivo pela metade
+- Recência do LRU = data de modificação do arquivo, atualizada a cada
+  acerto (vale entre processos, sem índice compartilhado)
+
+Não depende do Qt: é usado por game.abrir_jogo (game/game.py).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from consts import CACHE_TABULEIROS_MB, SEMENTES_CACHE, get_app_dir, log
+
+EXTENSAO = ".json"
+IDADE_TEMPORARIO_S = 60.0  # Temporários mais velhos que isso sobraram de um processo interrompido
+
+
+class CacheTabuleiros:
+    """
+    Pasta de partidas geradas, limitada em tamanho, compartilhável entre processos.
+    """
+
+    __slots__ = ("pasta", "limite_bytes", "sementes", "acertos", "falhas", "_lock")
+
+    def __init__(self, pasta=None, limite_mb=CACHE_TABULEIROS_MB, sementes=SEMENTES_CACHE):
+        """
+        Args:
+            pasta (str, optional): Pasta do cache (padrão: cache_tabuleiros ao
+                                   lado do executável); criada se não existir
+            limite_mb (float): Tamanho máximo da pasta em MB
+            sementes (int): Sementes sorteadas por perfil quando a partida não
+                            pede uma (quantos tabuleiros diferentes por perfil)
+        """
+        self.pasta = pasta or os.path.join(get_app_dir(), "cache_tabuleiros")
+        self.limite_bytes = int(limite_mb * 1024 * 1024)
+        self.sementes = max(1, int(sementes))
+        self.acertos = 0
+        self.falhas = 0
+        self._lock = threading.Lock()  # Contadores (a pré-carga gera em outra thread)
+        os.makedirs(self.pasta, exist_ok=True)
+
+    def _caminho(self, texto_chave):
+        """Arquivo de uma chave (hash do JSON canônico da chave)."""
+        nome = hashlib.sha256(texto_chave.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.pasta, nome + EXTENSAO)
+
+    def obter(self, chave):
+        """
+        Lê a partida de uma chave, se estiver no cache.
+
+        Args:
+            chave (dict): Parâmetros de geração (valores serializáveis em JSON)
+
+        Returns:
+            dict | None: Dados gravados por guardar(), ou None (falha)
+        """
+        texto_chave = json.dumps(chave, sort_keys=True)
+        caminho = self._caminho(texto_chave)
+        dados = None
+        try:
+            with open(caminho, "r", encoding="utf-8") as f:
+                gravado = json.load(f)
+            if gravado.get("chave") == texto_chave:
+                dados = gravado["dados"]
+                os.utime(caminho)  # Marca como usado agora (LRU)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            log("cache", f"Ignorando {os.path.basename(caminho)}: {e}")
+        with self._lock:
+            if dados is None:
+                self.falhas += 1
+            else:
+                self.acertos += 1
+        return dados
+
+    def guardar(self, chave, dados):
+        """
+        Grava a partida de uma chave (atomicamente) e poda a pasta ao limite.
+
+        Erros de disco só são registrados no log: o cache é opcional.
+
+        Args:
+            chave (dict): Parâmetros de geração, como em obter()
+            dados (dict): Partida (valores serializáveis em JSON)
+        """
+        texto_chave = json.dumps(chave, sort_keys=True)
+        temporario = None
+        try:
+            fd, temporario = tempfile.mkstemp(dir=self.pasta, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"chave": texto_chave, "dados": dados}, f, ensure_ascii=False,
+                          separators=(",", ":"))
+            os.replace(temporario, self._caminho(texto_chave))
+            temporario = None
+        except OSError as e:
+            log("cache", f"Não foi possível gravar no cache: {e}")
+        finally:
+            if temporario is not None:
+                try:
+                    os.remove(temporario)
+                except OSError:
+                    pass
+        self._podar()
+
+    def _podar(self):
+        """Remove os arquivos usados há mais tempo até a pasta caber no limite."""
+        agora = time.time()
+        arquivos, total = [], 0
+        try:
+            with os.scandir(self.pasta) as entradas:
+                for entrada in entradas:
+                    try:
+                        info = entrada.stat()
+                    except OSError:
+                        continue  # Removido por outro processo
+                    if entrada.name.endswith(EXTENSAO):
+                        arquivos.append((info.st_mtime, info.st_size, entrada.path))
+                        total += info.st_size
+                    elif entrada.name.endswith(".tmp") and agora - info.st_mtime > IDADE_TEMPORARIO_S:
+                        self._remover(entrada.path)
+        except OSError as e:
+            log("cache", f"Não foi possível listar o cache: {e}")
+            return
+        if total <= self.limite_bytes:
+            return
+        arquivos.sort()
+        removidos = 0
+        for _, tamanho, caminho in arquivos:
+            if total <= self.limite_bytes:
+                break
+            self._remover(caminho)
+            total -= tamanho
+            removidos += 1
+        log("cache", f"{removidos} tabuleiros removidos (limite de {self.limite_bytes // (1024 * 1024)} MB)")
+
+    @staticmethod
+    def _remover(caminho):
+        """Remove um arquivo, ignorando se outro processo já o removeu (ou está lendo)."""
+        try:
+            os.remove(caminho)
+        except OSError:
+            pass
+
+    def taxa_acertos(self):
+        """
+        Returns:
+            float: Fração das consultas que acharam a partida (0 sem consultas)
+        """
+        consultas = self.acertos + self.falhas
+        return self.acertos / consultas if consultas else 0.0
+
+    def __repr__(self):
+        return (f"CacheTabuleiros({self.pasta!r}, {self.acertos}/{self.acertos + self.falhas} "
+                f"acertos ({self.taxa_acertos():.0%}))")
@@ -0,0 +1,452 @@
+"""
+GAME/DICAS_UI.PY - Lista de Dicas Virtualizada da Tela de Jogo
+==============================================================
+Este módulo implementa a sidebar de dicas da TelaJogo no modelo model/view.
+Responsável por:
+- Guardar as dicas e o estado de cada uma (oculta, revelada, encontrada)
+  em um modelo de lista, sem nenhum widget por dica
+- Desenhar cada item com um delegate (fundo arredondado + texto quebrado)
+- Alternar a dica ao clicar, revelar todas (atalho 'E') e marcar como
+  encontrada quando a palavra é descoberta
+- Filtrar a lista por texto, estado e tamanho da palavra (FiltroDicas),
+  consultando o índice pré-computado de game/indice_dicas.py
+
+Cuidados de custo:
+- Nenhum widget por dica: a QListView só pinta as linhas visíveis e montar
+  a lista de uma partida é apenas trocar os dados do modelo
+- O layout mede todas as linhas a cada mudança de estado (LayoutMode.SinglePass;
+  o modo em lotes deixa a lista em branco até terminar), então o sizeHint
+  lê o modelo direto, sem passar por data()
+- As alturas calculadas pelo delegate ficam em cache por (texto, largura);
+  todas as dicas ocultas compartilham o mesmo texto e a mesma entrada
+"""
+
+from bisect import bisect_left, bisect_right
+
+from PyQt6.QtWidgets import (
+    QListView, QStyledItemDelegate, QAbstractItemView, QWidget, QLineEdit, QComboBox,
+    QVBoxLayout, QHBoxLayout
+)
+from PyQt6.QtGui import QColor, QFontMetrics, QPen
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QRectF, QSize, QTimer, pyqtSignal
+
+from consts import FONT_PIXEL_SIZE, ATRASO_REDIMENSIONAR_MS
+from utils.recursos import fonte, estilo, CORES_DICAS
+from game.indice_dicas import IndiceDicas
+
+TEXTO_DICA_OCULTA = "clique para revelar dica"
+
+# Estados de uma dica (guardados em um bytearray no modelo)
+OCULTA = 0
+REVELADA = 1
+ENCONTRADA = 2
+NOMES_ESTADOS = ("oculta", "revelada", "encontrada")  # Chaves de CORES_DICAS
+
+# Papel de dados com o estado da dica (lido pelo delegate)
+PAPEL_ESTADO = Qt.ItemDataRole.UserRole + 1
+
+# Alinhamento + quebra de linha usados para medir e desenhar o texto
+_FLAGS_TEXTO = Qt.AlignmentFlag.AlignCenter.value | Qt.TextFlag.TextWordWrap.value
+
+
+# ============================================================================
+# MODELO - DICAS E ESTADOS
+# ============================================================================
+class ModeloDicas(QAbstractListModel):
+    """
+    Modelo com as dicas da partida, identificadas pelo mesmo índice de
+    palavras_info.
+
+    As linhas exibidas são as dicas que passam pelo filtro atual
+    (_visiveis); sem filtro, a linha i é a dica i.
+
+    Comportamentos:
+    - Oculta -> Revelada e Revelada -> Oculta ao clicar (toggle)
+    - Encontrada: revelada e travada (cliques ignorados)
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._dicas = []              # Texto de cada dica
+        self._estados = bytearray()   # OCULTA / REVELADA / ENCONTRADA por dica
+        self._tamanhos = []           # Tamanho da palavra de cada dica
+        self._indice = None           # IndiceDicas, criado no primeiro uso do filtro
+        self._visiveis = []           # Índices das dicas exibidas, em ordem crescente
+        self._filtro = ("", None, None)  # (consulta, estado, tamanho)
+
+    def carregar(self, palavras_info):
+        """
+        Troca as dicas exibidas pelas da nova partida e limpa o filtro.
+
+        Args:
+            palavras_info (list): Colocacao de cada palavra (com dica, palavra e encontrada)
+        """
+        self.beginResetModel()
+        self._dicas = [info.dica or "(sem dica)" for info in palavras_info]
+        self._estados = bytearray(
+            ENCONTRADA if info.encontrada else OCULTA for info in palavras_info
+        )
+        self._tamanhos = [len(info.palavra) for info in palavras_info]
+        self._indice = None  # A maioria das partidas não usa o filtro
+        self._filtro = ("", None, None)
+        self._visiveis = list(range(len(self._dicas)))
+        self.endResetModel()
+
+    def tamanhos(self):
+        """Tamanhos de palavra presentes na partida (opções do filtro)."""
+        return sorted(set(self._tamanhos))
+
+    def filtrar(self, consulta="", estado=None, tamanho=None):
+        """
+        Exibe apenas as dicas que passam pelo filtro (consulta ao índice,
+        sem recriar widgets).
+
+        Args:
+            consulta (str): Substring procurada no texto da dica
+            estado (int, optional): OCULTA, REVELADA ou ENCONTRADA
+            tamanho (int, optional): Tamanho da palavra
+        """
+        self._filtro = (consulta, estado, tamanho)
+        if self._indice is None:
+            self._indice = IndiceDicas(self._dicas, self._tamanhos, self._estados)
+        visiveis = self._indice.filtrar(consulta, estado, tamanho)
+        if visiveis == self._visiveis:
+            return
+        self.beginResetModel()
+        self._visiveis = visiveis
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._visiveis)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        linha = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.texto(linha)
+        if role == PAPEL_ESTADO:
+            return self._estados[self._visiveis[linha]]
+        return None
+
+    def texto(self, linha):
+        """Texto exibido na linha (a dica ou o aviso de dica oculta)."""
+        dica = self._visiveis[linha]
+        if self._estados[dica] == OCULTA:
+            return TEXTO_DICA_OCULTA
+        return self._dicas[dica]
+
+    def estado(self, dica):
+        """Retorna o estado (OCULTA, REVELADA ou ENCONTRADA) da dica."""
+        return self._estados[dica]
+
+    def alternar(self, linha):
+        """
+        Revela ou oculta a dica clicada (se não estiver travada).
+
+        Args:
+            linha (int): Linha exibida que foi clicada
+        """
+        dica = self._visiveis[linha]
+        estado = self._estados[dica]
+        if estado == ENCONTRADA:
+            return
+        self._mudar_estado(dica, REVELADA if estado == OCULTA else OCULTA)
+        self._avisar([dica])
+
+    def revelar_todas(self):
+        """Revela todas as dicas ocultas, sem travar (atalho 'E')."""
+        alteradas = [i for i, estado in enumerate(self._estados) if estado == OCULTA]
+        for dica in alteradas:
+            self._mudar_estado(dica, REVELADA)
+        self._avisar(alteradas)
+
+    def marcar_encontrada(self, dica):
+        """
+        Marca a dica como encontrada (verde) e trava a interação.
+
+        Args:
+            dica (int): Índice da palavra em palavras_info
+        """
+        if self._estados[dica] == ENCONTRADA:
+            return
+        self._mudar_estado(dica, ENCONTRADA)
+        self._avisar([dica])
+
+    def _mudar_estado(self, dica, novo):
+        """Atualiza o estado no modelo e no índice do filtro (se já existir)."""
+        if self._indice is not None:
+            self._indice.mudar_estado(dica, self._estados[dica], novo)
+        self._estados[dica] = novo
+
+    def _avisar(self, dicas):
+        """
+        Notifica a view de que as dicas (em ordem crescente) mudaram.
+
+        Com filtro por estado ativo, a mudança pode tirar ou pôr dicas na
+        lista: o filtro é reaplicado. Senão, emite dataChanged do trecho
+        visível afetado. A QListView refaz o layout a cada dataChanged (o
+        texto, e com ele a altura, pode ter mudado); por isso o sizeHint do
+        delegate é barato.
+        """
+        if not dicas:
+            return
+        if self._filtro[1] is not None:
+            self.filtrar(*self._filtro)
+            return
+        primeira = bisect_left(self._visiveis, dicas[0])
+        ultima = bisect_right(self._visiveis, dicas[-1]) - 1
+        if primeira <= ultima:
+            self.dataChanged.emit(self.index(primeira), self.index(ultima))
+
+
+# ============================================================================
+# DELEGATE - DESENHO DE CADA DICA
+# ============================================================================
+class DelegadoDicas(QStyledItemDelegate):
+    """
+    Desenha uma dica como cartão arredondado com o texto centralizado,
+    nas cores de CORES_DICAS conforme o estado.
+    """
+
+    PADDING = 10
+    RAIO = 8
+    ALTURA_MINIMA = 40
+    MAX_ALTURAS = 4096  # Limite do cache de alturas
+
+    def __init__(self, view):
+        """
+        Args:
+            view (QListView): Lista dona do delegate (fornece a largura útil)
+        """
+        super().__init__(view)
+        self._view = view
+        self._modelo = view.modelo()
+        self._fonte = fonte(FONT_PIXEL_SIZE)
+        self._metricas = QFontMetrics(self._fonte)
+        self._cores = [
+            tuple(QColor(c) for c in CORES_DICAS[nome]) for nome in NOMES_ESTADOS
+        ]
+        self._alturas = {}  # {(texto, largura): altura}
+
+    def _altura(self, texto, largura):
+        """Altura do cartão para o texto quebrado na largura dada (com cache)."""
+        chave = (texto, largura)
+        altura = self._alturas.get(chave)
+        if altura is None:
+            area = QRect(0, 0, max(largura - 2 * self.PADDING, 1), 100000)
+            texto_rect = self._metricas.boundingRect(area, _FLAGS_TEXTO, texto)
+            altura = max(texto_rect.height() + 2 * self.PADDING, self.ALTURA_MINIMA)
+            if len(self._alturas) >= self.MAX_ALTURAS:
+                self._alturas.clear()
+            self._alturas[chave] = altura
+        return altura
+
+    def sizeHint(self, option, index):
+        # Chamado para todas as linhas a cada layout: lê o modelo direto, sem data()
+        largura = self._view.largura_itens
+        return QSize(largura, self._altura(self._modelo.texto(index.row()), largura))
+
+    def paint(self, painter, option, index):
+        fundo, cor_texto, borda = self._cores[index.data(PAPEL_ESTADO)]
+        rect = option.rect
+
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        painter.setPen(QPen(borda, 1))
+        painter.setBrush(fundo)
+        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), self.RAIO, self.RAIO)
+
+        painter.setFont(self._fonte)
+        painter.setPen(cor_texto)
+        p = self.PADDING
+        painter.drawText(rect.adjusted(p, p, -p, -p), _FLAGS_TEXTO, index.data())
+        painter.restore()
+
+
+# ============================================================================
+# VIEW - LISTA ROLÁVEL DE DICAS
+# ============================================================================
+class ListaDicas(QListView):
+    """
+    Lista de dicas da sidebar; clicar em um item revela/oculta a dica.
+
+    Não recebe foco, para que os atalhos de teclado continuem na TelaJogo.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._modelo = ModeloDicas(self)
+        self.setModel(self._modelo)
+        self.setItemDelegate(DelegadoDicas(self))
+
+        self.largura_itens = 0  # Largura útil dos cartões (lida pelo delegate)
+        self._redimensionando = False
+        self._pintada = False   # Já foi pintada desde que apareceu (o jogador está vendo)
+        self._tamanho_visto = QSize()  # Último tamanho da lista (não do viewport) tratado
+        self._janela_vista = QSize()   # Tamanho da janela no último resize tratado
+        self.setSpacing(6)  # Metade do espaço entre cartões (aplicado dos dois lados)
+        self.setLayoutMode(QListView.LayoutMode.SinglePass)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setStyleSheet(estilo("lista_dicas"))
+
+        self.pressed.connect(self._item_pressionado)
+
+        # Fim do redimensionamento ao vivo: nenhum resize novo dentro do atraso
+        self._timer_resize = QTimer(self)
+        self._timer_resize.setSingleShot(True)
+        self._timer_resize.setInterval(ATRASO_REDIMENSIONAR_MS)
+        self._timer_resize.timeout.connect(self._fim_redimensionamento)
+
+    def resizeEvent(self, event):
+        """
+        Atualiza a largura dos cartões antes do relayout disparado pelo resize.
+
+        Durante um redimensionamento ao vivo da janela (lista já exibida), os cartões
+        mantêm a largura e o layout atuais; o relayout acontece uma única vez
+        em _fim_redimensionamento.
+        """
+        # Ao vivo = a janela mudou de tamanho com a lista à vista; não conta
+        # quando só o viewport mudou (barra de rolagem apareceu/sumiu)
+        janela = self.window().size()
+        ao_vivo = (
+            self._pintada and self.isVisible() and self._modelo.rowCount()
+            and janela != self._janela_vista and self.size() != self._tamanho_visto
+        )
+        self._janela_vista = janela
+        self._tamanho_visto = self.size()
+        if self._redimensionando or ao_vivo:
+            if not self._redimensionando:
+                self._redimensionando = True
+                self.setResizeMode(QListView.ResizeMode.Fixed)
+            self._timer_resize.start()
+        else:
+            self.largura_itens = self.viewport().width() - 2 * self.spacing()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        self._pintada = True
+
+    def hideEvent(self, event):
+        """Ao voltar a aparecer, o primeiro resize (da pilha de telas) é aplicado direto."""
+        super().hideEvent(event)
+        self._pintada = False
+
+    def _fim_redimensionamento(self):
+        """Aplica a largura final e refaz o layout dos cartões uma vez."""
+        self._redimensionando = False
+        self.largura_itens = self.viewport().width() - 2 * self.spacing()
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.scheduleDelayedItemsLayout()
+
+    def modelo(self):
+        """Retorna o ModeloDicas exibido pela lista."""
+        return self._modelo
+
+    def _item_pressionado(self, index):
+        """Toggle da dica clicada."""
+        self._modelo.alternar(index.row())
+
+
+# ============================================================================
+# FILTRO - BUSCA POR TEXTO, ESTADO E TAMANHO
+# ============================================================================
+class _CampoBusca(QLineEdit):
+    """Campo de busca: ESC limpa o texto; ESC vazio ou Enter devolvem o foco ao jogo."""
+
+    sair = pyqtSignal()
+
+    def keyPressEvent(self, event):
+        key = event.key()
+        if key == Qt.Key.Key_Escape and self.text():
+            self.clear()
+            event.accept()
+            return
+        if key in (Qt.Key.Key_Escape, Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            self.sair.emit()
+            event.accept()
+            return
+        super().keyPressEvent(event)
+
+
+class FiltroDicas(QWidget):
+    """
+    Barra de filtro exibida acima da lista de dicas.
+
+    Cada tecla digitada ou opção escolhida é uma consulta ao índice do
+    modelo; nenhum widget é recriado.
+    """
+
+    sair = pyqtSignal()  # Pedido para devolver o foco do teclado à TelaJogo
+
+    OPCOES_ESTADO = (
+        ("todas", None),
+        ("ocultas", OCULTA),
+        ("reveladas", REVELADA),
+        ("encontradas", ENCONTRADA),
+    )
+
+    def __init__(self, modelo, parent=None):
+        """
+        Args:
+            modelo (ModeloDicas): Modelo filtrado pela barra
+            parent (QWidget, optional): Widget pai
+        """
+        super().__init__(parent)
+        self._modelo = modelo
+        font_pixel = fonte(FONT_PIXEL_SIZE)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+
+        self._busca = _CampoBusca()
+        self._busca.setFont(font_pixel)
+        self._busca.setPlaceholderText("filtrar dicas...")
+        self._busca.sair.connect(self.sair)
+        layout.addWidget(self._busca)
+
+        # Combos só por mouse: o teclado fica com a busca ou com o jogo
+        opcoes = QHBoxLayout()
+        opcoes.setSpacing(8)
+        self._estado = QComboBox()
+        for texto, estado in self.OPCOES_ESTADO:
+            self._estado.addItem(texto, estado)
+        self._tamanho = QComboBox()
+        for combo in (self._estado, self._tamanho):
+            combo.setFont(font_pixel)
+            combo.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+            opcoes.addWidget(combo, stretch=1)
+        layout.addLayout(opcoes)
+
+        self.setStyleSheet(estilo("filtro_dicas"))
+
+        self._busca.textChanged.connect(self._aplicar)
+        self._estado.currentIndexChanged.connect(self._aplicar)
+        self._tamanho.currentIndexChanged.connect(self._aplicar)
+
+    def reiniciar(self):
+        """Limpa a barra e recarrega as opções de tamanho (nova partida)."""
+        for widget in (self._busca, self._estado, self._tamanho):
+            widget.blockSignals(True)
+        self._busca.clear()
+        self._estado.setCurrentIndex(0)
+        self._tamanho.clear()
+        self._tamanho.addItem("tamanho", None)
+        for tamanho in self._modelo.tamanhos():
+            self._tamanho.addItem(f"{tamanho} letras", tamanho)
+        for widget in (self._busca, self._estado, self._tamanho):
+            widget.blockSignals(False)
+
+    def _aplicar(self):
+        """Consulta o índice com os valores atuais da barra."""
+        self._modelo.filtrar(
+            self._busca.text(), self._estado.currentData(), self._tamanho.currentData()
+        )
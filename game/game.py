@@ -5,34 +5,349 @@ Este módulo implementa toda a lógica de geração do caça-palavras.
 Responsável por:
 - Carregar palavras e dicas do arquivo JSON
 - Selecionar aleatoriamente as palavras para cada jogo
-- Posicionar palavras na matriz em 8 direções diferentes
+- Posicionar palavras na matriz em até 8 direções (conforme o perfil)
+- Pré-calcular, por perfil de dificuldade, as tabelas de geração (vagas
+  válidas por tamanho de palavra e palavras do banco que cabem)
 - Preencher espaços vazios com letras aleatórias
+- Delegar tabuleiros gigantes à geração em ladrilhos paralelos (game/ladrilhos.py)
+- Gerar tabuleiros com formato (círculo, coração, letras, furos...) a partir
+  de uma máscara de células ativas (game/mascaras.py)
+- Modo mensagem secreta: cobrir a grade com palavras deixando livres só as
+  células de uma frase, escrita nelas em ordem de leitura (game/mensagem.py)
+- Gerar de forma reproduzível a partir de uma semente e reaproveitar
+  tabuleiros do cache em disco (game/cache_tabuleiros.py), se ligado
+- Buscar partidas prontas no servidor de tabuleiros (servidor_tabuleiros.py),
+  se configurado, gerando aqui quando ele não responde
 - Validar posicionamento (evitar sobreposições inválidas)
 - Coordenar todo o processo de geração
 
 Algoritmo de geração:
-1. Carregar banco de palavras do JSON
-2. Selecionar 10 palavras aleatórias 
-3. Para cada palavra, tentar posicionar em posição/direção aleatória
-4. Validar se cabe sem conflitos (máx 100 tentativas por palavra)
+1. Carregar banco de palavras do JSON (e as tabelas do perfil, em cache)
+2. Selecionar N palavras aleatórias entre as que cabem no perfil
+3. Para cada palavra, tentar posicionar em uma vaga aleatória (início +
+   direção em que a palavra cabe inteira na matriz)
+4. Validar se não há conflito de letras (máx 100 tentativas por palavra)
 5. Preencher células vazias com letras aleatórias
 6. Retornar matriz final e posições das palavras colocadas
 
-Direções suportadas: horizontal, vertical, diagonal (8 direções totais)
+Direções suportadas: horizontal, vertical, diagonal (8 direções totais;
+cada perfil em data/dificuldades.json escolhe as suas)
+
+Representação da partida gerada:
+- Matriz: tupla de strings imutáveis, uma por linha (matriz[i][j] é a letra;
+  espaço nas células fora da máscara, se o perfil tiver uma)
+- Palavras: lista de Colocacao (início, direção e texto); as coordenadas
+  de cada palavra são calculadas sob demanda em vez de guardadas
 """
 
-from consts import log, PATH_PALAVRAS_JSON
+from consts import (
+    log, PATH_PALAVRAS_JSON, CANDIDATOS_GERACAO, QUANTIDADE_PALAVRAS,
+    CELULAS_LADRILHOS, SERVIDOR_TABULEIROS, PRAZO_MENSAGEM_MS
+)
+from game.pontuacao import metricas, pontuacao
+from array import array
+from bisect import bisect_right
+import hashlib
 import json
 import random
 import string
+import threading
+import time
 
 # ============================================================================
 # ESTADO GLOBAL DO JOGO
 # ============================================================================
 # Variáveis globais mantêm o estado atual da partida gerada
-matriz = []                    # Matriz principal do jogo (lista 2D de caracteres)
-palavras_selecionadas = []     # Lista das 10 palavras escolhidas aleatoriamente
-posicoes_palavras = []         # Lista com info de cada palavra: posição, dica, coordenadas
+matriz = []                    # Matriz do jogo (lista 2D durante a geração; tupla de linhas-string no final)
+palavras_selecionadas = []     # Lista das palavras escolhidas aleatoriamente
+posicoes_palavras = []         # Lista de Colocacao (uma por palavra posicionada)
+tempo_geracao_ms = 0.0         # Duração da última geração (exibida no HUD de desempenho)
+estatisticas_geracao = None    # EstatisticasGeracao da última gerar_candidatos()
+_banco_palavras = None         # Cache do palavras.json (lido uma vez por processo)
+_lock_banco = threading.Lock() # A pré-carga lê o banco em segundo plano (utils/recursos.py)
+_tabelas = {}                  # Cache de TabelasGeracao por (linhas, colunas, direções, faixa de tamanho)
+_hash_banco = None             # Hash do banco em cache (parte da chave do cache de tabuleiros)
+cache = None                   # CacheTabuleiros ligado por usar_cache() (None = sem cache)
+servidor = None                # Endereço do servidor de tabuleiros (usar_servidor); None = gerar aqui
+frase_secreta = None           # Frase do modo mensagem secreta (usar_mensagem); None = tabuleiros comuns
+frase_partida = None           # Frase escondida na partida atual (None = partida comum)
+MARGEM_PRAZO = 1.25            # Folga sobre o custo estimado de um candidato antes de começá-lo
+
+# Versão do gerador: aumentar sempre que a mesma semente passar a gerar
+# outro tabuleiro (invalida as partidas do cache em disco)
+VERSAO_GERADOR = 2
+
+# Todas as 8 direções possíveis para posicionamento
+# Cada direção é um vetor (dx, dy) que define o incremento por letra
+DIRECOES = (
+    (0, 1),   # horizontal: esquerda → direita
+    (1, 0),   # vertical: cima → baixo
+    (1, 1),   # diagonal: cima-esquerda → baixo-direita
+    (1, -1),  # diagonal: cima-direita → baixo-esquerda  
+    (0, -1),  # horizontal reversa: direita → esquerda
+    (-1, 0),  # vertical reversa: baixo → cima
+    (-1, -1), # diagonal reversa: baixo-direita → cima-esquerda
+    (-1, 1),  # diagonal reversa: baixo-esquerda → cima-direita
+)
+
+
+class Colocacao:
+    """
+    Registro compacto de uma palavra posicionada na matriz.
+
+    Guarda apenas o texto, a dica, a célula inicial e a direção; o tamanho é
+    o da palavra e as coordenadas ocupadas saem de posicoes(). Só o campo
+    'encontrada' muda durante a partida.
+    """
+
+    __slots__ = ("palavra", "dica", "linha", "coluna", "dx", "dy", "encontrada")
+
+    def __init__(self, palavra, dica, linha, coluna, direcao):
+        """
+        Args:
+            palavra (str): Texto da palavra em MAIÚSCULAS
+            dica (str): Dica exibida na sidebar
+            linha (int): Linha da primeira letra
+            coluna (int): Coluna da primeira letra
+            direcao (tuple): Vetor (dx, dy) por letra, como em pode_colocar_palavra
+        """
+        self.palavra = palavra
+        self.dica = dica
+        self.linha = linha
+        self.coluna = coluna
+        self.dx, self.dy = direcao
+        self.encontrada = False
+
+    def fim(self):
+        """
+        Returns:
+            tuple: (linha, coluna) da última letra
+        """
+        ultima = len(self.palavra) - 1
+        return self.linha + self.dx * ultima, self.coluna + self.dy * ultima
+
+    def posicoes(self):
+        """
+        Coordenadas ocupadas pela palavra, da primeira à última letra.
+
+        Returns:
+            tuple: Tuplas (linha, coluna)
+        """
+        linha, coluna, dx, dy = self.linha, self.coluna, self.dx, self.dy
+        return tuple((linha + dx * i, coluna + dy * i) for i in range(len(self.palavra)))
+
+    def __repr__(self):
+        return (f"Colocacao({self.palavra!r}, ({self.linha}, {self.coluna}), "
+                f"({self.dx}, {self.dy}), encontrada={self.encontrada})")
+
+
+class TabelasGeracao:
+    """
+    Tabelas pré-calculadas para gerar tabuleiros de um formato.
+
+    Montadas uma vez por combinação (linhas, colunas, direções, faixa de
+    tamanho, máscara) e reaproveitadas por todas as partidas desse formato:
+    - vagas: por tamanho de palavra, as faixas de início válidas em cada
+      direção (sorteio uniforme entre todas, sem tentativas fora da matriz)
+    - palavras: palavras do banco dentro da faixa de tamanho que cabem em
+      alguma vaga
+    
+    Com máscara, as vagas de cada direção são as células ativas ordenadas
+    pela quantidade de células ativas seguidas a partir delas (maior
+    primeiro): as vagas de uma palavra de N letras são um prefixo dessa
+    ordem, achado por bisect, e o sorteio continua uniforme e sem rejeição.
+    """
+
+    __slots__ = ("linhas", "colunas", "direcoes", "vagas", "palavras", "mascara", "modelo", "_ordens")
+
+    def __init__(self, linhas, colunas, direcoes, tamanho_min, tamanho_max, banco, mascara=None):
+        """
+        Args:
+            linhas (int): Linhas da matriz
+            colunas (int): Colunas da matriz
+            direcoes (tuple): Vetores (dx, dy) permitidos
+            tamanho_min (int): Menor palavra aceita
+            tamanho_max (int): Maior palavra aceita
+            banco (list): Palavras disponíveis ({'palavra', 'dica'})
+            mascara (mascaras.Mascara, optional): Células ativas (None = todas)
+        """
+        self.linhas = linhas
+        self.colunas = colunas
+        self.direcoes = direcoes
+        self.mascara = mascara
+        self.modelo = None   # Linhas iniciais da matriz de geração (só com máscara)
+        self._ordens = None  # Por direção: (células, -sequência) em ordem (só com máscara)
+        if mascara is not None:
+            self.modelo = mascara.modelo()
+            self._ordens = []
+            for direcao in direcoes:
+                sequencias = mascara.sequencias(direcao)
+                celulas = sorted((k for k, n in enumerate(sequencias) if n),
+                                 key=sequencias.__getitem__, reverse=True)
+                self._ordens.append((
+                    direcao, array("I", celulas), array("i", [-sequencias[k] for k in celulas])
+                ))
+        self.vagas = {}
+        self.palavras = []
+        for palavra_obj in banco:
+            tamanho = len(palavra_obj['palavra'])
+            if not tamanho_min <= tamanho <= tamanho_max:
+                continue
+            if tamanho not in self.vagas:
+                self.vagas[tamanho] = self._faixas(tamanho)
+            if self.vagas[tamanho][0]:
+                self.palavras.append(palavra_obj)
+
+    def _faixas(self, tamanho):
+        """
+        Faixas de início válidas para uma palavra de `tamanho` letras.
+
+        Returns:
+            tuple: (acumulados, faixas) onde faixas são (direcao, linha0,
+                   n_linhas, coluna0, n_colunas) e acumulados a soma das
+                   vagas até cada faixa (para o sorteio); com máscara, as
+                   faixas são (direcao, células em ordem)
+        """
+        acumulados, faixas, total = [], [], 0
+        if self._ordens is not None:
+            for direcao, celulas, negativos in self._ordens:
+                quantidade = bisect_right(negativos, -tamanho)  # Sequência >= tamanho
+                if quantidade:
+                    total += quantidade
+                    acumulados.append(total)
+                    faixas.append((direcao, celulas))
+            return acumulados, faixas
+        extensao = tamanho - 1
+        for dx, dy in self.direcoes:
+            n_linhas = self.linhas - abs(dx) * extensao
+            n_colunas = self.colunas - abs(dy) * extensao
+            if n_linhas <= 0 or n_colunas <= 0:
+                continue
+            # Direções "para trás" começam afastadas da borda inicial
+            linha0 = extensao if dx < 0 else 0
+            coluna0 = extensao if dy < 0 else 0
+            total += n_linhas * n_colunas
+            acumulados.append(total)
+            faixas.append(((dx, dy), linha0, n_linhas, coluna0, n_colunas))
+        return acumulados, faixas
+
+    def sortear_vaga(self, tamanho):
+        """
+        Sorteia início e direção em que uma palavra de `tamanho` letras cabe.
+
+        Returns:
+            tuple | None: (linha, coluna, direcao), ou None se não há vaga
+        """
+        acumulados, faixas = self.vagas.get(tamanho) or self._faixas(tamanho)
+        if not acumulados:
+            return None
+        k = random.randrange(acumulados[-1])
+        i = bisect_right(acumulados, k)
+        k -= acumulados[i - 1] if i else 0
+        if self._ordens is not None:
+            direcao, celulas = faixas[i]
+            linha, coluna = divmod(celulas[k], self.colunas)
+            return linha, coluna, direcao
+        direcao, linha0, _, coluna0, n_colunas = faixas[i]
+        return linha0 + k // n_colunas, coluna0 + k % n_colunas, direcao
+
+
+class EstatisticasGeracao:
+    """
+    O que a última geração com prazo (gerar_candidatos) conseguiu fazer.
+    """
+
+    __slots__ = ("candidatos", "palavras_pedidas", "palavras_colocadas", "pontuacao",
+                 "alvo", "tempo_ms", "prazo_ms", "origem")
+
+    def __init__(self, candidatos, palavras_pedidas, palavras_colocadas, pontuacao,
+                 alvo, tempo_ms, prazo_ms, origem="gerado"):
+        """
+        Args:
+            candidatos (int): Tabuleiros gerados
+            palavras_pedidas (int): Palavras que o perfil pede
+            palavras_colocadas (int): Palavras posicionadas no tabuleiro escolhido
+            pontuacao (float | None): Pontuação do escolhido (None se não houve
+                                      tempo de pontuar: só um candidato)
+            alvo (float): Pontuação alvo do perfil
+            tempo_ms (float): Duração total
+            prazo_ms (float): Prazo pedido
+            origem (str): "gerado" aqui, "cache" (cache em disco) ou "servidor"
+                          (servidor de tabuleiros); fora "gerado", tempo_ms é o
+                          da leitura e o resto vem da geração original
+        """
+        self.candidatos = candidatos
+        self.palavras_pedidas = palavras_pedidas
+        self.palavras_colocadas = palavras_colocadas
+        self.pontuacao = pontuacao
+        self.alvo = alvo
+        self.tempo_ms = tempo_ms
+        self.prazo_ms = prazo_ms
+        self.origem = origem
+
+    def estourou(self):
+        """
+        Returns:
+            bool: True se a geração passou do prazo
+        """
+        return self.tempo_ms > self.prazo_ms
+
+    def __repr__(self):
+        nota = "-" if self.pontuacao is None else f"{self.pontuacao:.2f}"
+        return (f"EstatisticasGeracao({self.candidatos} candidatos, "
+                f"{self.palavras_colocadas}/{self.palavras_pedidas} palavras, pontuação {nota} "
+                f"(alvo {self.alvo:.2f}), {self.tempo_ms:.1f}/{self.prazo_ms:.0f} ms"
+                f"{'' if self.origem == 'gerado' else ', ' + self.origem})")
+
+
+def tabelas_geracao(linhas, colunas=None, direcoes=DIRECOES, tamanho_min=1, tamanho_max=None,
+                    mascara=None):
+    """
+    Tabelas de geração de um formato, montadas na primeira chamada.
+    
+    Args:
+        linhas (int): Linhas da matriz
+        colunas (int, optional): Colunas da matriz (padrão: igual a linhas)
+        direcoes (tuple): Vetores (dx, dy) permitidos
+        tamanho_min (int): Menor palavra aceita
+        tamanho_max (int, optional): Maior palavra aceita (padrão: sem limite)
+        mascara (str, optional): Nome da máscara de formato (game/mascaras.py);
+                                 None = retângulo cheio
+        
+    Returns:
+        TabelasGeracao: Tabelas em cache (não devem ser modificadas)
+        
+    Raises:
+        ValueError: Se a máscara não existir
+    """
+    colunas = linhas if colunas is None else colunas
+    tamanho_max = max(linhas, colunas) if tamanho_max is None else tamanho_max
+    chave = (linhas, colunas, tuple(direcoes), tamanho_min, tamanho_max, mascara)
+    tabelas = _tabelas.get(chave)
+    if tabelas is None:
+        formato = None
+        if mascara is not None:
+            from game.mascaras import mascara as montar_mascara  # Só perfis com formato
+            formato = montar_mascara(mascara, linhas, colunas)
+        tabelas = TabelasGeracao(linhas, colunas, chave[2], tamanho_min, tamanho_max,
+                                 carregar_palavras(), formato)
+        _tabelas[chave] = tabelas
+    return tabelas
+
+
+def preparar_perfis(perfis):
+    """
+    Monta antecipadamente as tabelas de geração de cada perfil.
+    
+    Chamado na pré-carga (utils/recursos.py) para que a primeira partida de
+    cada dificuldade não pague a montagem.
+    
+    Args:
+        perfis (iterable): Perfis de dificuldade (dificult.Perfil)
+    """
+    for perfil in perfis:
+        tabelas_geracao(perfil.linhas, perfil.colunas, perfil.direcoes,
+                        perfil.tamanho_min, perfil.tamanho_max, perfil.mascara)
 
 
 def carregar_palavras():
@@ -52,9 +367,70 @@ def carregar_palavras():
     - Se arquivo não existir ou for inválido, retorna lista vazia
     - Ignora entradas sem texto de palavra válido
     - Normaliza todas as palavras para MAIÚSCULAS para consistência
+
+    Cache:
+    - O JSON é lido apenas na primeira chamada bem-sucedida; as seguintes
+      devolvem a mesma lista (que não deve ser modificada por quem chama)
     """
+    global _banco_palavras
+    with _lock_banco:
+        if _banco_palavras is None:
+            palavras = _ler_palavras_json()
+            if palavras:
+                _banco_palavras = palavras
+            return palavras
+        return _banco_palavras
+
+
+def usar_banco(caminho):
+    """
+    Troca o banco de palavras em cache pelo de outro arquivo JSON.
+    
+    Usado por ferramentas (ex.: simulador.py) para avaliar um banco novo sem
+    substituir o data/palavras.json. O arquivo segue o mesmo formato.
+    
+    Args:
+        caminho (str): Caminho do JSON de palavras
+        
+    Returns:
+        list: Palavras carregadas (vazia se o arquivo for inválido; nesse
+              caso o cache não é alterado)
+    """
+    global _banco_palavras, _hash_banco
+    palavras = _ler_palavras_json(caminho)
+    if palavras:
+        with _lock_banco:
+            _banco_palavras = palavras
+            _tabelas.clear()  # As tabelas guardam palavras do banco anterior
+            _hash_banco = None
+    return palavras
+
+
+def hash_banco():
+    """
+    Hash do conteúdo do banco de palavras em uso (palavras e dicas).
+    
+    Faz parte da chave do cache de tabuleiros: trocar o banco (ou editar o
+    palavras.json) invalida as partidas guardadas.
+    
+    Returns:
+        str: Hash hexadecimal (calculado uma vez por banco)
+    """
+    global _hash_banco
+    if _hash_banco is None:
+        palavras = carregar_palavras()
+        texto = json.dumps(palavras, sort_keys=True, ensure_ascii=False)
+        codigo = hashlib.sha256(texto.encode("utf-8")).hexdigest()[:16]
+        if not palavras:
+            return codigo  # Banco ainda não lido: não guardar
+        _hash_banco = codigo
+    return _hash_banco
+
+
+def _ler_palavras_json(caminho=PATH_PALAVRAS_JSON):
+    """Lê e normaliza um JSON de palavras (sem cache); ver carregar_palavras()."""
     try:
-        with open(PATH_PALAVRAS_JSON, 'r', encoding='utf-8') as f:
+        with open(caminho, 'r', encoding='utf-8') as f:
             data = json.load(f)
             palavras_dict = data.get('palavras', {})
             
@@ -102,7 +478,7 @@ def selecionar_palavras_aleatorias(palavras, quantidade=10):
     return selecionadas
 
 
-def pode_colocar_palavra(palavra, linha, coluna, direcao, size):
+def pode_colocar_palavra(palavra, linha, coluna, direcao, size, colunas=None):
     """
     Valida se uma palavra pode ser posicionada na matriz sem conflitos.
     
@@ -118,7 +494,8 @@ def pode_colocar_palavra(palavra, linha, coluna, direcao, size):
         direcao (tuple): Vetor direção como (dx, dy) onde:
                         dx = deslocamento vertical (-1, 0, 1)
                         dy = deslocamento horizontal (-1, 0, 1)
-        size (int): Tamanho da matriz (NxN)
+        size (int): Linhas da matriz (NxN se colunas não for informado)
+        colunas (int, optional): Colunas da matriz (padrão: size)
         
     Returns:
         bool: True se a palavra pode ser posicionada, False caso contrário
@@ -131,13 +508,14 @@ def pode_colocar_palavra(palavra, linha, coluna, direcao, size):
     """
     dx, dy = direcao
     comprimento = len(palavra)
+    colunas = size if colunas is None else colunas
     
     # Calcular posição final que a palavra ocupará
     end_linha = linha + dx * (comprimento - 1)
     end_coluna = coluna + dy * (comprimento - 1)
     
     # Verificar se a palavra sai dos limites da matriz
-    if end_linha < 0 or end_linha >= size or end_coluna < 0 or end_coluna >= size:
+    if end_linha < 0 or end_linha >= size or end_coluna < 0 or end_coluna >= colunas:
         return False
     
     # Verificar cada posição que a palavra ocupará
@@ -154,59 +532,54 @@ def pode_colocar_palavra(palavra, linha, coluna, direcao, size):
 
 def colocar_palavra(palavra, linha, coluna, direcao):
     """
-    Posiciona uma palavra na matriz e retorna as coordenadas ocupadas.
+    Posiciona uma palavra na matriz.
     
     Esta função assume que a validação já foi feita com pode_colocar_palavra().
     Modifica diretamente a matriz global inserindo cada letra da palavra na 
-    posição calculada pela direção especificada.
+    posição calculada pela direção especificada. As coordenadas ocupadas não
+    são guardadas: a Colocacao da palavra as recalcula quando preciso.
     
     Args:
         palavra (str): Palavra a ser inserida na matriz
         linha (int): Linha inicial de posicionamento
         coluna (int): Coluna inicial de posicionamento  
         direcao (tuple): Vetor direção (dx, dy)
-        
-    Returns:
-        list: Lista de tuplas (linha, coluna) com todas as posições ocupadas
-              pela palavra. Essas coordenadas são usadas posteriormente para
-              validação quando o jogador seleciona palavras.
               
     Efeitos colaterais:
     - Modifica a matriz global inserindo as letras
-    - As posições retornadas são armazenadas em posicoes_palavras para consulta
     """
     dx, dy = direcao
-    posicoes = []
     
     # Inserir cada letra da palavra na matriz seguindo a direção
     for i, letra in enumerate(palavra):
-        r = linha + dx * i
-        c = coluna + dy * i
-        matriz[r][c] = letra
-        posicoes.append((r, c))
-    
-    return posicoes
+        matriz[linha + dx * i][coluna + dy * i] = letra
 
 
-def posicionar_palavras(size, palavras):
+def posicionar_palavras(size, palavras, tabelas=None, prazo=None):
     """
     Algoritmo principal para posicionar todas as palavras selecionadas na matriz.
     
     Este é o coração do gerador de caça-palavras. Tenta posicionar cada palavra
-    em posições e direções aleatórias, validando conflitos e limites. Se uma 
-    palavra não puder ser posicionada após muitas tentativas, é ignorada.
+    em vagas aleatórias (início + direção em que ela cabe na matriz), validando
+    conflitos de letras. Se uma palavra não puder ser posicionada após muitas
+    tentativas, é ignorada.
     
     Args:
-        size (int): Tamanho da matriz (NxN)
+        size (int): Tamanho da matriz (NxN); ignorado se tabelas for informado
         palavras (list): Lista de objetos palavra com 'palavra' e 'dica'
+        tabelas (TabelasGeracao, optional): Formato da matriz (linhas, colunas,
+                                            direções, máscara); padrão: NxN, 8 direções
+        prazo (float, optional): Instante (time.perf_counter) a partir do qual
+                                 nenhuma palavra nova é tentada
         
     Returns:
         list: Lista com nomes das palavras que foram posicionadas com sucesso
         
     Algoritmo:
-    1. Inicializar matriz vazia 
+    1. Inicializar matriz vazia (células fora da máscara já com espaço, que
+       nenhuma palavra pode ocupar)
     2. Para cada palavra:
-       - Tentar até 100 posições/direções aleatórias
+       - Tentar até 100 vagas aleatórias (sorteadas das tabelas)
        - Validar se cabe sem conflitos
        - Se cabe, posicionar e registrar coordenadas
        - Se não cabe após 100 tentativas, pular palavra
@@ -214,31 +587,28 @@ def posicionar_palavras(size, palavras):
     
     Efeitos colaterais:
     - Modifica matriz global
-    - Popula posicoes_palavras com metadados de cada palavra posicionada
+    - Popula posicoes_palavras com a Colocacao de cada palavra posicionada
     """
     global matriz, posicoes_palavras
     
+    if tabelas is None:
+        tabelas = tabelas_geracao(size)
+    linhas, colunas = tabelas.linhas, tabelas.colunas
+    
     # Inicializar estado limpo para nova geração
-    matriz = [['' for _ in range(size)] for _ in range(size)]
+    if tabelas.modelo is None:
+        matriz = [['' for _ in range(colunas)] for _ in range(linhas)]
+    else:
+        matriz = [list(linha) for linha in tabelas.modelo]
     posicoes_palavras = []
     
-    # Definir todas as 8 direções possíveis para posicionamento
-    # Cada direção é um vetor (dx, dy) que define o incremento por letra
-    direcoes = [
-        (0, 1),   # horizontal: esquerda → direita
-        (1, 0),   # vertical: cima → baixo
-        (1, 1),   # diagonal: cima-esquerda → baixo-direita
-        (1, -1),  # diagonal: cima-direita → baixo-esquerda  
-        (0, -1),  # horizontal reversa: direita → esquerda
-        (-1, 0),  # vertical reversa: baixo → cima
-        (-1, -1), # diagonal reversa: baixo-direita → cima-esquerda
-        (-1, 1),  # diagonal reversa: baixo-esquerda → cima-direita
-    ]
-    
     palavras_colocadas = []
     
     # Tentar posicionar cada palavra individualmente
     for palavra_obj in palavras:
+        if prazo is not None and time.perf_counter() >= prazo:
+            log("game.py", f"Prazo esgotado: {len(palavras) - len(palavras_colocadas)} palavras não tentadas")
+            break
         palavra = palavra_obj['palavra']
         tentativas = 0
         max_tentativas = 100  # Limite para evitar loops infinitos
@@ -246,21 +616,19 @@ def posicionar_palavras(size, palavras):
         
         # Algoritmo de tentativa e erro para posicionamento
         while tentativas < max_tentativas and not colocada:
-            # Escolher posição inicial aleatória
-            linha = random.randint(0, size - 1)
-            coluna = random.randint(0, size - 1)
-            direcao = random.choice(direcoes)
+            # Escolher vaga aleatória (a palavra sempre cabe inteira na matriz)
+            vaga = tabelas.sortear_vaga(len(palavra))
+            if vaga is None:
+                break
+            linha, coluna, direcao = vaga
             
             # Tentar posicionar nesta posição/direção
-            if pode_colocar_palavra(palavra, linha, coluna, direcao, size):
-                # Sucesso! Posicionar palavra e registrar metadados
-                posicoes = colocar_palavra(palavra, linha, coluna, direcao)
-                posicoes_palavras.append({
-                    'palavra': palavra,
-                    'dica': palavra_obj['dica'],
-                    'posicoes': posicoes,        # Coordenadas para validação de seleção
-                    'encontrada': False          # Status do jogo
-                })
+            if pode_colocar_palavra(palavra, linha, coluna, direcao, linhas, colunas):
+                # Sucesso! Posicionar palavra e registrar início/direção
+                colocar_palavra(palavra, linha, coluna, direcao)
+                posicoes_palavras.append(
+                    Colocacao(palavra, palavra_obj['dica'], linha, coluna, direcao)
+                )
                 palavras_colocadas.append(palavra)
                 colocada = True
                 log("game.py", f"Palavra '{palavra}' colocada na posição ({linha},{coluna}) direção {direcao}")
@@ -274,7 +642,7 @@ def posicionar_palavras(size, palavras):
     log("game.py", f"Total de palavras colocadas: {len(palavras_colocadas)}/{len(palavras)}")
     return palavras_colocadas
 
-def completar_matriz(size):
+def completar_matriz(size, colunas=None):
     """
     Preenche todas as células vazias da matriz com letras aleatórias.
     
@@ -283,31 +651,68 @@ def completar_matriz(size):
     aleatórias para "camuflar" as palavras e tornar o jogo desafiador.
     
     Args:
-        size (int): Tamanho da matriz (NxN)
+        size (int): Linhas da matriz (NxN se colunas não for informado)
+        colunas (int, optional): Colunas da matriz (padrão: size)
         
     Comportamento:
-    - Percorre toda a matriz buscando células vazias (string vazia)
-    - Substitui cada célula vazia por uma letra maiúscula aleatória (A-Z)
+    - Sorteia uma letra maiúscula (A-Z) para cada célula da linha e usa as
+      sorteadas apenas onde a célula está vazia (string vazia); linhas sem
+      nenhuma palavra usam as sorteadas direto; células fora da máscara
+      mantêm o espaço
     - Usa string.ascii_uppercase para garantir distribuição uniforme
+    - Converte cada linha em uma string imutável: a matriz final é uma tupla
+      de strings (uma por linha), bem mais compacta que a lista 2D de caracteres
     
     Efeitos colaterais:
-    - Modifica matriz global preenchendo células vazias
+    - Substitui a matriz global pela versão preenchida (tupla de strings)
     """
     global matriz
     
     letras = string.ascii_uppercase  # 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    colunas = size if colunas is None else colunas
     
-    # Percorrer toda a matriz
+    # Percorrer a matriz linha a linha
+    linhas = []
     for i in range(size):
-        for j in range(size):
-            # Se a célula está vazia, preencher com letra aleatória
-            if matriz[i][j] == '':
-                matriz[i][j] = random.choice(letras)
+        sorteadas = random.choices(letras, k=colunas)
+        if any(matriz[i]):  # Só mescla as linhas que têm letras de palavras
+            sorteadas = [letra or sorteada for letra, sorteada in zip(matriz[i], sorteadas)]
+        linhas.append("".join(sorteadas))
+    matriz = tuple(linhas)
     
     log("game.py", "Matriz completada com letras aleatórias")
 
+def completar_com_mensagem(letras):
+    """
+    Escreve a frase secreta nas células vazias da matriz, em ordem de leitura.
+    
+    Substitui completar_matriz no modo mensagem secreta: em vez de letras
+    sorteadas, as células que nenhuma palavra ocupa recebem as letras da
+    frase, linha a linha, da esquerda para a direita.
+    
+    Args:
+        letras (str): Letras da frase (mensagem.letras_da_frase), uma por
+                      célula vazia
+        
+    Raises:
+        ValueError: Se o número de letras não é o de células vazias
+        
+    Efeitos colaterais:
+    - Substitui a matriz global pela versão preenchida (tupla de strings)
+    """
+    global matriz
+    
+    vazias = sum(linha.count('') for linha in matriz)
+    if vazias != len(letras):
+        raise ValueError(f"{len(letras)} letras para {vazias} células vazias")
+    proxima = iter(letras)
+    matriz = tuple("".join(letra or next(proxima) for letra in linha) for linha in matriz)
+    
+    log("game.py", "Matriz completada com a mensagem secreta")
+
 
-def gerar(matriz_size):
+def gerar(matriz_size, colunas=None, quantidade=QUANTIDADE_PALAVRAS, direcoes=DIRECOES,
+          tamanho_min=1, tamanho_max=None, prazo=None, mascara=None):
     """
     Função coordenadora principal que executa todo o processo de geração.
     
@@ -315,38 +720,442 @@ def gerar(matriz_size):
     carregamento de dados, seleção aleatória, posicionamento e finalização.
     
     Args:
-        matriz_size (int): Tamanho da matriz quadrada a ser gerada
+        matriz_size (int): Linhas da matriz (quadrada se colunas não for informado)
+        colunas (int, optional): Colunas da matriz (padrão: matriz_size)
+        quantidade (int): Número de palavras sorteadas
+        direcoes (tuple): Vetores (dx, dy) permitidos (padrão: as 8 direções)
+        tamanho_min (int): Menor palavra aceita
+        tamanho_max (int, optional): Maior palavra aceita (padrão: sem limite)
+        prazo (float, optional): Instante (time.perf_counter) depois do qual
+                                 não se tentam mais palavras; o preenchimento
+                                 da matriz é feito sempre
+        mascara (str, optional): Nome da máscara de formato (game/mascaras.py)
         
     Returns:
         tuple: (matriz, posicoes_palavras) onde:
-               - matriz: lista 2D com todas as letras posicionadas
-               - posicoes_palavras: lista com metadados de cada palavra posicionada
+               - matriz: tupla de strings (uma por linha) com todas as letras
+               - posicoes_palavras: lista de Colocacao das palavras posicionadas
                
     Fluxo de execução:
-    1. Carregar todas as palavras disponíveis do arquivo JSON
-    2. Selecionar 10 palavras aleatórias para este jogo
-    3. Posicionar as palavras na matriz em posições/direções aleatórias  
+    1. Obter as tabelas do formato (montadas na primeira vez, ver tabelas_geracao)
+    2. Selecionar `quantidade` palavras aleatórias entre as que cabem
+    3. Posicionar as palavras na matriz em vagas aleatórias
     4. Preencher células restantes com letras aleatórias
     5. Retornar matriz completa e informações das palavras
     """
-    log("game.py", f"Gerando caça-palavras com matriz {matriz_size}x{matriz_size}")
+    colunas = matriz_size if colunas is None else colunas
+    log("game.py", f"Gerando caça-palavras com matriz {matriz_size}x{colunas}")
+    global tempo_geracao_ms
+    inicio = time.perf_counter()
     
-    # ETAPA 1: Carregamento e seleção de palavras
-    todas_palavras = carregar_palavras()
+    # ETAPA 1: Tabelas do formato e seleção de palavras
+    tabelas = tabelas_geracao(matriz_size, colunas, direcoes, tamanho_min, tamanho_max, mascara)
     global palavras_selecionadas
-    palavras_selecionadas = selecionar_palavras_aleatorias(todas_palavras, 10)
+    palavras_selecionadas = selecionar_palavras_aleatorias(tabelas.palavras, quantidade)
     
     # ETAPA 2: Posicionamento das palavras na matriz
-    palavras_colocadas = posicionar_palavras(matriz_size, palavras_selecionadas)
+    palavras_colocadas = posicionar_palavras(matriz_size, palavras_selecionadas, tabelas, prazo)
     
     # ETAPA 3: Preenchimento de células vazias  
-    completar_matriz(matriz_size)
+    completar_matriz(matriz_size, colunas)
     
-    log("game.py", "Geração do caça-palavras concluída")
+    tempo_geracao_ms = (time.perf_counter() - inicio) * 1000.0
+    log("game.py", f"Geração do caça-palavras concluída em {tempo_geracao_ms:.1f} ms")
     
     return matriz, posicoes_palavras
 
-def abrir_jogo(matriz_size):
+def gerar_perfil(perfil, prazo=None):
+    """
+    Gera um tabuleiro com os parâmetros de um perfil de dificuldade.
+    
+    Args:
+        perfil (dificult.Perfil): Linhas, colunas, palavras, direções, faixa de
+                                  tamanho e máscara
+        prazo (float, optional): Instante limite para posicionar palavras (ver gerar)
+        
+    Returns:
+        tuple: (matriz, posicoes_palavras), como gerar()
+    """
+    return gerar(perfil.linhas, perfil.colunas, perfil.palavras, perfil.direcoes,
+                 perfil.tamanho_min, perfil.tamanho_max, prazo, perfil.mascara)
+
+def gerar_candidatos(perfil, candidatos=CANDIDATOS_GERACAO, prazo_ms=None):
+    """
+    Geração "anytime": melhora o tabuleiro enquanto houver tempo e devolve o melhor.
+    
+    Gera candidatos um após o outro e fica com o melhor: primeiro o que
+    posicionou mais palavras, depois o de pontuação mais próxima da
+    pontuacao_alvo do perfil (game/pontuacao.py). Um candidato novo só é
+    começado se o custo do mais caro até ali ainda cabe no prazo, e quem
+    passa do prazo no meio da geração para de tentar palavras. O primeiro
+    candidato é sempre gerado por inteiro (é o piso de latência: em 200x200,
+    ~5 ms quase todos de preenchimento); se não houver tempo para um
+    segundo, nem é pontuado.
+    
+    Args:
+        perfil (dificult.Perfil): Perfil da dificuldade
+        candidatos (int): Máximo de tabuleiros gerados
+        prazo_ms (float, optional): Tempo máximo em ms (padrão: orcamento_ms do perfil)
+        
+    Returns:
+        tuple: (matriz, posicoes_palavras) do candidato escolhido, como gerar()
+        
+    Efeitos colaterais:
+    - As globais (matriz, posicoes_palavras, palavras_selecionadas) ficam
+      com o candidato escolhido; tempo_geracao_ms soma todos os candidatos
+    - estatisticas_geracao descreve o que foi alcançado
+    """
+    global matriz, posicoes_palavras, palavras_selecionadas, tempo_geracao_ms, estatisticas_geracao
+    alvo = perfil.pontuacao_alvo
+    prazo_ms = perfil.orcamento_ms if prazo_ms is None else prazo_ms
+    inicio = time.perf_counter()
+    prazo = inicio + prazo_ms / 1000.0
+    melhor = None  # (chave, candidato, nota); chave maior = melhor
+    custo = 0.0    # Duração do candidato mais caro até agora (gerar + pontuar)
+    n = 0
+    while n < candidatos:
+        n += 1
+        comeco = time.perf_counter()
+        # O primeiro candidato posiciona todas as palavras (um tabuleiro sem
+        # palavras não serve); os seguintes param de tentar ao estourar o prazo
+        candidato = gerar_perfil(perfil, prazo if n > 1 else None) + (palavras_selecionadas,)
+        agora = time.perf_counter()
+        # Sem tempo para outro candidato (estimado pelo mais caro): entrega este
+        ultimo = n == candidatos or agora + MARGEM_PRAZO * max(custo, 2 * (agora - comeco)) > prazo
+        if melhor is None and ultimo:
+            melhor = (None, candidato, None)
+            break
+        nota = pontuacao(metricas(candidato[0], candidato[1]), len(candidato[1]))
+        chave = (len(candidato[1]), -abs(nota - alvo))
+        if melhor is None or chave > melhor[0]:
+            melhor = (chave, candidato, nota)
+        custo = max(custo, time.perf_counter() - comeco)
+        if ultimo or time.perf_counter() + MARGEM_PRAZO * custo > prazo:
+            break
+    
+    _, (matriz, posicoes_palavras, palavras_selecionadas), nota = melhor
+    tempo_geracao_ms = (time.perf_counter() - inicio) * 1000.0
+    estatisticas_geracao = EstatisticasGeracao(
+        n, perfil.palavras, len(posicoes_palavras), nota, alvo, tempo_geracao_ms, prazo_ms
+    )
+    log("game.py", f"Geração concluída: {estatisticas_geracao}")
+    return matriz, posicoes_palavras
+
+def gerar_com_mensagem(perfil, frase, prazo=None):
+    """
+    Gera um tabuleiro do modo mensagem secreta.
+    
+    Em vez de sortear perfil.palavras palavras, cobre a grade com quantas
+    palavras do banco forem precisas para sobrarem exatamente tantas células
+    quanto letras da frase (mensagem.cobrir), e escreve a frase nelas
+    (completar_com_mensagem). A pontuação alvo não é usada.
+    
+    Args:
+        perfil (dificult.Perfil): Tamanho, direções, faixa de tamanho e máscara
+        frase (str): Frase secreta (só as letras vão para a grade)
+        prazo (float, optional): Instante (time.perf_counter) limite da busca;
+                                 sem prazo, um número fixo de tentativas
+                                 (reproduzível com semente)
+        
+    Returns:
+        tuple | None: (matriz, posicoes_palavras), como gerar(), ou None se
+                      a busca não achou um tabuleiro a tempo
+        
+    Raises:
+        ValueError: Se a frase não cabe no tabuleiro ou o banco não tem
+                    letras para cobrir o resto
+        
+    Efeitos colaterais:
+    - As globais (matriz, posicoes_palavras, palavras_selecionadas,
+      tempo_geracao_ms, estatisticas_geracao) ficam com o tabuleiro gerado
+    """
+    global matriz, posicoes_palavras, palavras_selecionadas, tempo_geracao_ms, estatisticas_geracao
+    from game import mensagem  # Só no modo mensagem secreta (--mensagem)
+    
+    inicio = time.perf_counter()
+    letras = mensagem.letras_da_frase(frase)
+    tabelas = tabelas_geracao(perfil.linhas, perfil.colunas, perfil.direcoes, perfil.tamanho_min,
+                              perfil.tamanho_max, perfil.mascara)
+    resultado = mensagem.cobrir(tabelas, len(letras), prazo)
+    if resultado is None:
+        log("game.py", f"Mensagem secreta: nenhum tabuleiro {perfil.linhas}x{perfil.colunas} a tempo")
+        return None
+    grade, colocacoes = resultado
+    matriz = grade
+    posicoes_palavras = [Colocacao(obj['palavra'], obj['dica'], linha, coluna, direcao)
+                         for obj, linha, coluna, direcao in colocacoes]
+    random.shuffle(posicoes_palavras)  # A ordem das dicas não entrega a ordem de leitura
+    palavras_selecionadas = [{'palavra': c.palavra, 'dica': c.dica} for c in posicoes_palavras]
+    completar_com_mensagem(letras)
+    tempo_geracao_ms = (time.perf_counter() - inicio) * 1000.0
+    estatisticas_geracao = EstatisticasGeracao(
+        1, len(posicoes_palavras), len(posicoes_palavras), None, perfil.pontuacao_alvo,
+        tempo_geracao_ms, PRAZO_MENSAGEM_MS
+    )
+    log("game.py", f"Mensagem secreta de {len(letras)} letras: {estatisticas_geracao}")
+    return matriz, posicoes_palavras
+
+def _em_ladrilhos(perfil):
+    """Perfis gerados em ladrilhos: a partir de CELULAS_LADRILHOS células, sem máscara."""
+    return perfil.mascara is None and perfil.linhas * perfil.colunas >= CELULAS_LADRILHOS
+
+def gerar_em_ladrilhos(perfil, processos=None):
+    """
+    Gera um tabuleiro gigante em ladrilhos processados em paralelo.
+    
+    Um único candidato (sem pontuação nem prazo): em matrizes desse tamanho
+    o custo é quase todo preenchimento, dividido entre os processos.
+    
+    Args:
+        perfil (dificult.Perfil): Perfil da dificuldade
+        processos (int, optional): Processos do pool (padrão: todos os núcleos)
+        
+    Returns:
+        tuple: (matriz, posicoes_palavras), como gerar()
+        
+    Efeitos colaterais:
+    - As globais (matriz, posicoes_palavras, palavras_selecionadas,
+      tempo_geracao_ms, estatisticas_geracao) ficam com o tabuleiro gerado
+    """
+    global matriz, posicoes_palavras, palavras_selecionadas, tempo_geracao_ms, estatisticas_geracao
+    from game import ladrilhos  # Importado só para tabuleiros gigantes (multiprocessing)
+    
+    inicio = time.perf_counter()
+    matriz, posicoes_palavras, palavras_selecionadas = ladrilhos.gerar(
+        perfil.linhas, perfil.colunas, perfil.palavras, perfil.direcoes,
+        perfil.tamanho_min, perfil.tamanho_max, processos
+    )
+    tempo_geracao_ms = (time.perf_counter() - inicio) * 1000.0
+    estatisticas_geracao = EstatisticasGeracao(
+        1, perfil.palavras, len(posicoes_palavras), None, perfil.pontuacao_alvo,
+        tempo_geracao_ms, perfil.orcamento_ms
+    )
+    log("game.py", f"Geração em ladrilhos concluída: {estatisticas_geracao}")
+    return matriz, posicoes_palavras
+
+def usar_cache(pasta=None, limite_mb=None, sementes=None):
+    """
+    Liga o cache de tabuleiros em disco para as próximas partidas.
+    
+    Com o cache ligado, abrir_jogo sorteia a semente de cada partida entre
+    `sementes` valores por perfil: depois de aquecido, o cache tem todos os
+    tabuleiros possíveis e nenhuma partida precisa ser gerada.
+    
+    Args:
+        pasta (str, optional): Pasta do cache (padrão: ver CacheTabuleiros)
+        limite_mb (float, optional): Tamanho máximo da pasta (padrão: CACHE_TABULEIROS_MB)
+        sementes (int, optional): Sementes por perfil (padrão: SEMENTES_CACHE)
+        
+    Returns:
+        CacheTabuleiros: O cache ligado (também em game.cache)
+    """
+    global cache
+    from game.cache_tabuleiros import CacheTabuleiros  # Só quando o cache é pedido (--cache)
+    
+    opcoes = {"limite_mb": limite_mb, "sementes": sementes}
+    cache = CacheTabuleiros(pasta, **{k: v for k, v in opcoes.items() if v is not None})
+    log("game.py", f"Cache de tabuleiros em {cache.pasta} ({cache.sementes} sementes por perfil)")
+    return cache
+
+def usar_servidor(endereco=None):
+    """
+    Passa a buscar as partidas no servidor de tabuleiros (servidor_tabuleiros.py).
+    
+    Se o servidor não responder a tempo (TEMPO_LIMITE_SERVIDOR_S) ou mandar
+    uma partida de outro tamanho, a partida é gerada aqui (ou lida do cache).
+    
+    Args:
+        endereco (str, optional): "host:porta" ou "unix:/caminho" (padrão:
+                                  SERVIDOR_TABULEIROS)
+    """
+    global servidor
+    from game import rede_tabuleiros  # Só quando o servidor é pedido (--servidor)
+    
+    servidor = endereco or SERVIDOR_TABULEIROS
+    rede_tabuleiros.ler_endereco(servidor)  # Endereço inválido: erro já aqui
+    log("game.py", f"Partidas do servidor de tabuleiros em {servidor}")
+
+def usar_mensagem(frase):
+    """
+    Passa a esconder uma frase secreta nos tabuleiros das próximas partidas.
+    
+    As células livres da grade, lidas em ordem, formam a frase, revelada ao
+    fim da partida. Quando a frase não cabe no perfil (ou a busca passa de
+    PRAZO_MENSAGEM_MS), a partida sai comum.
+    
+    Args:
+        frase (str | None): Frase secreta; None volta aos tabuleiros comuns
+        
+    Raises:
+        ValueError: Se a frase não tiver nenhuma letra
+    """
+    global frase_secreta
+    from game.mensagem import letras_da_frase
+    
+    if frase is not None and not letras_da_frase(frase):
+        raise ValueError(f"frase sem letras: {frase!r}")
+    frase_secreta = frase
+    log("game.py", f"Mensagem secreta: {frase!r}")
+
+def _partida_com_mensagem(perfil, prazo):
+    """
+    Gera a partida do modo mensagem secreta, se a frase couber no perfil.
+    
+    Args:
+        perfil (dificult.Perfil): Perfil da dificuldade
+        prazo (float | None): Instante limite da busca (None: tentativas fixas)
+        
+    Returns:
+        tuple | None: (matriz, posicoes_palavras), ou None se a partida
+                      deve sair comum (o motivo vai para o log)
+    """
+    global frase_partida
+    try:
+        resultado = gerar_com_mensagem(perfil, frase_secreta, prazo)
+    except ValueError as e:
+        log("game.py", f"Mensagem secreta não cabe no perfil {perfil.nome} ({e}); partida comum")
+        return None
+    if resultado is not None:
+        frase_partida = frase_secreta
+    return resultado
+
+def _partida_do_servidor(perfil):
+    """
+    Busca no servidor uma partida do perfil e a coloca nas globais.
+    
+    Returns:
+        tuple | None: (matriz, posicoes_palavras), ou None se o servidor
+                      falhou (o motivo vai para o log)
+    """
+    from game import rede_tabuleiros
+    
+    inicio = time.perf_counter()
+    try:
+        dados = rede_tabuleiros.buscar_partida(perfil.codigo, servidor)
+        resultado = importar_partida(perfil, dados, inicio, "servidor")
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        log("game.py", f"Servidor de tabuleiros falhou ({e}); gerando aqui")
+        return None
+    log("game.py", f"Partida do servidor em {tempo_geracao_ms:.1f} ms")
+    return resultado
+
+def chave_cache(perfil, semente):
+    """
+    Chave de uma partida no cache: tudo o que decide o tabuleiro gerado.
+    
+    Args:
+        perfil (dificult.Perfil): Perfil da dificuldade
+        semente (int): Semente da geração
+        
+    Returns:
+        dict: Tamanho, palavras, direções, faixa de tamanho, máscara, alvo,
+              frase secreta, hash do banco, versão do gerador e semente
+    """
+    return {
+        "linhas": perfil.linhas,
+        "colunas": perfil.colunas,
+        "palavras": perfil.palavras,
+        "direcoes": [list(d) for d in perfil.direcoes],
+        "tamanho": [perfil.tamanho_min, perfil.tamanho_max],
+        "mascara": perfil.mascara,
+        "alvo": perfil.pontuacao_alvo,
+        "mensagem": frase_secreta,
+        "candidatos": CANDIDATOS_GERACAO,
+        "banco": hash_banco(),
+        "versao": VERSAO_GERADOR,
+        "semente": semente,
+    }
+
+def _gerar_com_semente(perfil, semente):
+    """
+    Gera a partida de um perfil de forma reproduzível.
+    
+    O prazo é ignorado (todos os candidatos são gerados), já que o número
+    de candidatos que cabe no prazo depende da máquina. O estado do random
+    global é restaurado no final.
+    
+    Returns:
+        tuple: (matriz, posicoes_palavras), como gerar()
+    """
+    estado = random.getstate()
+    random.seed(semente)
+    try:
+        if frase_secreta is not None:
+            resultado = _partida_com_mensagem(perfil, None)
+            if resultado is not None:
+                return resultado
+        if _em_ladrilhos(perfil):
+            return gerar_em_ladrilhos(perfil)
+        return gerar_candidatos(perfil, prazo_ms=float("inf"))
+    finally:
+        random.setstate(estado)
+
+def exportar_partida():
+    """
+    Partida atual (globais) em um dicionário serializável em JSON.
+    
+    Formato gravado pelo cache de tabuleiros e enviado pelo servidor de
+    tabuleiros (servidor_tabuleiros.py); importar_partida() faz o inverso.
+    
+    Returns:
+        dict: matriz (linhas), colocacoes ([palavra, dica, linha, coluna,
+              dx, dy]), selecionadas, candidatos, pontuacao e mensagem (frase
+              secreta ou None)
+    """
+    return {
+        "matriz": list(matriz),
+        "colocacoes": [[c.palavra, c.dica, c.linha, c.coluna, c.dx, c.dy] for c in posicoes_palavras],
+        "selecionadas": palavras_selecionadas,
+        "candidatos": estatisticas_geracao.candidatos,
+        "pontuacao": estatisticas_geracao.pontuacao,
+        "mensagem": frase_partida,
+    }
+
+def importar_partida(perfil, dados, inicio, origem):
+    """
+    Restaura nas globais uma partida exportada por exportar_partida().
+    
+    Args:
+        perfil (dificult.Perfil): Perfil da dificuldade
+        dados (dict): Resultado de exportar_partida()
+        inicio (float): Instante (time.perf_counter) do início da leitura
+        origem (str): De onde veio ("cache", "servidor"; ver EstatisticasGeracao)
+        
+    Returns:
+        tuple: (matriz, posicoes_palavras), como gerar()
+        
+    Raises:
+        ValueError: Se a matriz não tem o tamanho ou o formato (máscara) do perfil
+    """
+    global matriz, posicoes_palavras, palavras_selecionadas, tempo_geracao_ms, estatisticas_geracao
+    global frase_partida
+    linhas = tuple(dados["matriz"])
+    if len(linhas) != perfil.linhas or any(len(linha) != perfil.colunas for linha in linhas):
+        raise ValueError(f"partida não é {perfil.linhas}x{perfil.colunas}")
+    # Células fora da máscara são espaços (INATIVA, game/mascaras.py)
+    if perfil.mascara is None:
+        formato_ok = not any(" " in linha for linha in linhas)
+    else:
+        modelo = tabelas_geracao(perfil.linhas, perfil.colunas, perfil.direcoes, perfil.tamanho_min,
+                                 perfil.tamanho_max, perfil.mascara).modelo
+        formato_ok = all(
+            all((letra == " ") == (vazia == " ") for letra, vazia in zip(linha, linha_modelo))
+            for linha, linha_modelo in zip(linhas, modelo)
+        )
+    if not formato_ok:
+        raise ValueError(f"partida não tem o formato do perfil (máscara {perfil.mascara})")
+    matriz = linhas
+    posicoes_palavras = [Colocacao(p, d, l, c, (dx, dy)) for p, d, l, c, dx, dy in dados["colocacoes"]]
+    palavras_selecionadas = dados["selecionadas"]
+    frase_partida = dados.get("mensagem")
+    tempo_geracao_ms = (time.perf_counter() - inicio) * 1000.0
+    estatisticas_geracao = EstatisticasGeracao(
+        dados["candidatos"], perfil.palavras, len(posicoes_palavras), dados["pontuacao"],
+        perfil.pontuacao_alvo, tempo_geracao_ms, perfil.orcamento_ms, origem
+    )
+    return matriz, posicoes_palavras
+
+def abrir_jogo(perfil, prazo_ms=None, semente=None):
     """
     Função de interface pública para inicializar uma partida.
     
@@ -355,16 +1164,61 @@ def abrir_jogo(matriz_size):
     estendida futuramente para incluir outras inicializações necessárias.
     
     Args:
-        matriz_size (int): Tamanho da matriz baseado na dificuldade escolhida
-                          (10 para fácil, 15 para médio, 20 para difícil)
+        perfil (dificult.Perfil | int): Perfil da dificuldade escolhida (vários
+                          candidatos, fica o mais próximo da pontuação alvo;
+                          a partir de CELULAS_LADRILHOS células, em ladrilhos
+                          paralelos); um int gera uma matriz NxN com as regras padrão
+        prazo_ms (float, optional): Tempo máximo de geração (padrão: o
+                          orcamento_ms do perfil; sem prazo para um int)
+        semente (int, optional): Gera sempre o mesmo tabuleiro para a mesma
+                          semente (sem prazo, ver _gerar_com_semente); com o
+                          cache ligado, sorteada entre cache.sementes valores
+                          se não informada, e a partida é procurada no cache
+                          antes de ser gerada. Sem semente e com o servidor
+                          configurado, a partida vem dele (ou é gerada aqui,
+                          se ele falhar), exceto no modo mensagem secreta
                           
     Returns:
         tuple: (matriz, posicoes_palavras) - dados necessários para a UI do jogo
         
     Uso típico:
-        matriz, posicoes = game.abrir_jogo(15)  # Jogo médio
-        # matriz contém a grade de letras para exibição
-        # posicoes contém metadados das palavras para validação de seleção
+        matriz, posicoes = game.abrir_jogo(dificult.perfil(2))  # Jogo médio
+        # matriz contém as linhas de letras (strings) para exibição
+        # posicoes contém a Colocacao de cada palavra para validação de seleção
+        # game.frase_partida é a frase secreta escondida nela (ou None)
     """
-    log("game.py", f"Abrindo jogo com matriz de tamanho {matriz_size}")
-    return gerar(matriz_size)
+    global frase_partida
+    frase_partida = None
+    if isinstance(perfil, int):
+        log("game.py", f"Abrindo jogo com matriz de tamanho {perfil}")
+        prazo = None if prazo_ms is None else time.perf_counter() + prazo_ms / 1000.0
+        return gerar(perfil, prazo=prazo)
+    log("game.py", f"Abrindo jogo com o perfil {perfil.nome} ({perfil.linhas}x{perfil.colunas})")
+    if semente is None and servidor is not None and frase_secreta is None:
+        resultado = _partida_do_servidor(perfil)
+        if resultado is not None:
+            return resultado
+    if semente is None and cache is not None:
+        semente = random.randrange(cache.sementes)
+    if semente is None:
+        if frase_secreta is not None:
+            resultado = _partida_com_mensagem(perfil, time.perf_counter() + PRAZO_MENSAGEM_MS / 1000.0)
+            if resultado is not None:
+                return resultado
+        if _em_ladrilhos(perfil):
+            return gerar_em_ladrilhos(perfil)
+        return gerar_candidatos(perfil, prazo_ms=prazo_ms)
+    
+    if cache is None:
+        return _gerar_com_semente(perfil, semente)
+    inicio = time.perf_counter()
+    chave = chave_cache(perfil, semente)
+    dados = cache.obter(chave)
+    if dados is not None:
+        resultado = importar_partida(perfil, dados, inicio, "cache")
+        log("game.py", f"Semente {semente}: tabuleiro do cache em {tempo_geracao_ms:.1f} ms ({cache})")
+        return resultado
+    resultado = _gerar_com_semente(perfil, semente)
+    cache.guardar(chave, exportar_partida())
+    log("game.py", f"Semente {semente}: tabuleiro gerado e guardado no cache ({cache})")
+    return resultado
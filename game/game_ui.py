@@ -3,30 +3,46 @@ GAME/GAME_UI.PY - Interface Principal do Jogo Caça Palavras
 ===========================================================
 Este módulo implementa a tela principal onde o jogador interage com o caça-palavras.
 Responsável por:
-- Renderizar a matriz de letras como grade interativa
+- Renderizar a matriz de letras como grade interativa (game/tabuleiro_ui.py)
 - Implementar seleção de palavras por clique e arrasto
-- Exibir lista de dicas (ocultas, reveladas por clique)
-- Validar seleções contra palavras posicionadas
-- Gerenciar estado do jogo (palavras encontradas, contador)
+- Exibir lista de dicas (ocultas, reveladas por clique) com filtro por texto, estado e tamanho
+- Encaminhar as seleções à SessaoJogo (game/sessao.py), que guarda o estado
+  da partida, e refletir os eventos dela (palavra encontrada, fim) na tela
 - Processar atalhos de teclado (E, D, C, ESC)
 - Mostrar popup de vitória ao completar todas as palavras
+- Modo descoberta livre (com um dicionário): qualquer palavra do léxico
+  traçada na grade conta como descoberta, com contador próprio
+- Carregar uma nova partida na mesma tela, reaproveitando grade e dicas
+- Montar a partida em etapas (carregar_em_etapas): a tela aparece na hora
+  com um aviso e o resto é feito nas iterações seguintes do loop de eventos
 
 Características interativas:
-- Clique e arrasto em 8 direções (horizontal, vertical, diagonal)
+- Clique e arrasto em 8 direções (horizontal, vertical, diagonal), com
+  rolagem automática perto das bordas em tabuleiros maiores que a tela
+- Rolagem e zoom do tabuleiro (Ctrl + roda, teclas +/-/0)
 - Destacar path temporário durante seleção
 - Validação exata contra coordenadas das palavras posicionadas
 - Auto-revelação de dicas quando palavra é encontrada
-- Sidebar rolável com dicas
+- Sidebar rolável com dicas (lista virtualizada, ver game/dicas_ui.py)
 - Atalhos: E (revelar todas dicas), D (desistir), C (ajuda), ESC (sair)
+- F3: liga/desliga o HUD de desempenho (debug)
 """
 
+import time
+from collections import deque
+
 from PyQt6.QtWidgets import (
-    QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton, QFrame, QGridLayout
-    , QScrollArea, QMessageBox
+    QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton, QFrame
+    , QMessageBox
 )
-from PyQt6.QtGui import QFontDatabase, QFont, QCursor
-from PyQt6.QtCore import Qt
-from consts import FONT_PATH, FONT_PIXEL_SIZE, FONT_PIXEL_BIG_SIZE
+from PyQt6.QtCore import Qt, QTimer
+from consts import FONT_PIXEL_SIZE, JANELA_LARGURA_MIN, JANELA_ALTURA_MIN, log
+from utils.recursos import fonte, estilo
+from game.hud_ui import HudDesempenho, ContadoresDesempenho
+from game.dicas_ui import ListaDicas, FiltroDicas
+from game.sessao import SessaoJogo, EVENTO_ENCONTRADA, EVENTO_DESCOBERTA, EVENTO_FIM
+from game.tabuleiro_ui import TabuleiroView
+
 
 class TelaJogo(QWidget):
     """
@@ -34,51 +50,75 @@ class TelaJogo(QWidget):
     
     Esta classe gerencia toda a interface e lógica de interação do jogo,
     desde a renderização da matriz até a validação de seleções e controle
-    de estado da partida.
+    de estado da partida. A mesma instância pode receber partidas novas
+    via carregar_jogo() ou carregar_em_etapas(), sem recriar a janela.
     """
+
+    TEXTO_CARREGANDO = "gerando tabuleiro..."
+    TEXTO_ERRO = "erro ao gerar o tabuleiro (ESC volta ao menu)"
+    TEXTO_SEM_MENSAGEM = "sem mensagem secreta: a frase não coube neste tabuleiro"
     
-    def __init__(self, matriz, palavras_info, on_finish=None):
+    def __init__(self, matriz=None, palavras_info=None, on_finish=None, tempo_geracao_ms=None, on_replay=None,
+                 dicionario=None, modo_mensagem=False):
         """
         Inicializa a tela de jogo com dados gerados pelo motor do jogo.
         
+        Sem matriz, só o esqueleto da tela é montado (com o aviso de
+        carregamento no tabuleiro); a sidebar de dicas e a partida chegam
+        depois, por carregar_em_etapas().
+        
         Args:
-            matriz (list): Matriz 2D de caracteres gerada pelo game.py
-            palavras_info (list): Lista de dicionários com metadados das palavras:
-                                 {'palavra': str, 'dica': str, 'posicoes': list, 'encontrada': bool}
+            matriz (list, optional): Matriz 2D de caracteres gerada pelo game.py
+            palavras_info (list, optional): Lista de Colocacao (game/game.py) com palavra,
+                                 dica, início/direção e o estado 'encontrada'
             on_finish (callable): Callback executado quando jogo termina (vitória/ESC)
+            tempo_geracao_ms (float, optional): Tempo gasto gerando a matriz (exibido no HUD)
+            on_replay (callable, optional): Callback do botão "jogar de novo" do popup de
+                                            vitória; se None, o botão não é exibido
+            dicionario (game.lexico.Lexico, optional): Liga o modo descoberta livre
+            modo_mensagem (bool): Modo mensagem secreta ligado (--mensagem): partidas
+                                  que saem sem a frase avisam o jogador
         """
+        inicio_construcao = time.perf_counter()
         super().__init__()
 
         # ============================================================================
         # CONFIGURAÇÃO BÁSICA DA JANELA
         # ============================================================================
         self.setWindowTitle("Caça Palavras - Jogo")
-        self.setStyleSheet("background-color: #111018;")
-        self.setFixedSize(1280, 720)
+        self.setStyleSheet(estilo("fundo"))
+        self.setMinimumSize(JANELA_LARGURA_MIN, JANELA_ALTURA_MIN)  # O tabuleiro se ajusta ao espaço
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)  # Para receber eventos de teclado
 
         # ============================================================================
         # ESTADO DO JOGO E DADOS
         # ============================================================================
-        self.matriz = matriz                    # Matriz 2D com as letras do jogo
-        self.palavras_info = palavras_info      # Metadados das palavras posicionadas
-        self._grid_labels = []                  # Matriz 2D de widgets QLabel (células da UI)
-        self._found_cells = set()               # Set de tuplas (i,j) das células já encontradas
+        self.matriz = []                        # Linhas (strings) com as letras do jogo
+        self.palavras_info = []                 # Metadados das palavras posicionadas
+        self._sessao = None                     # SessaoJogo da partida atual (estado e validação)
+        self._dicionario = dicionario           # Léxico do modo descoberta livre (None = desligado)
+        self._mensagem = None                   # Frase secreta da partida (revelada no fim), se houver
+        self._modo_mensagem = modo_mensagem     # Avisa quando a partida sai sem a frase secreta
         self._selecting = False                 # Flag indicando se está fazendo seleção
         self._start_cell = None                 # Tupla (i,j) onde iniciou a seleção atual
         self._current_path = []                 # Lista de tuplas (i,j) do path sendo selecionado
-        self._coords_map = {}                   # Mapa {tupla_coordenadas: índice_palavra}
-        self._coords_map_rev = {}               # Mapa para coordenadas reversas
         self._on_finish = on_finish             # Callback para fim de jogo
-        self._game_over = False                 # Flag para prevenir interações após vitória
+        self._on_replay = on_replay             # Callback para jogar de novo
+        self._pronto = False                    # Partida carregada: mouse e atalhos liberados
+        self._perf = ContadoresDesempenho()     # Contadores lidos pelo HUD de desempenho (F3)
+
+        # Etapas pendentes da montagem progressiva, uma por iteração do loop
+        self._etapas = deque()
+        self._timer_etapas = QTimer(self)
+        self._timer_etapas.setSingleShot(True)
+        self._timer_etapas.setInterval(0)
+        self._timer_etapas.timeout.connect(self._proxima_etapa)
 
         # ============================================================================
         # CONFIGURAÇÃO DE FONTE E ESTILOS
         # ============================================================================
-        # Carrega fonte personalizada pixel art para manter consistência visual
-        QFontDatabase.addApplicationFont(FONT_PATH)
-        font_title = QFont("Press Start 2P", FONT_PIXEL_BIG_SIZE)
-        font_pixel = QFont("Press Start 2P", FONT_PIXEL_SIZE)
+        # Fonte pixel art compartilhada pelo registro de recursos (sem recriar por tela)
+        font_pixel = fonte(FONT_PIXEL_SIZE)
         self._font_pixel = font_pixel
 
         # ============================================================================
@@ -93,138 +133,16 @@ class TelaJogo(QWidget):
         # ============================================================================
         # Container principal da grade de letras
         esquerda = QFrame()
-        esquerda.setStyleSheet("""
-            QFrame {
-                background-color: #0c0c12;
-                border: 4px solid #0a0a0f;
-            }
-        """)
+        esquerda.setStyleSheet(estilo("painel_matriz"))
         esquerda_layout = QVBoxLayout()
         esquerda_layout.setContentsMargins(16, 16, 16, 16)
-        esquerda_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        # Grade QGridLayout para organizar células da matriz
-        grid = QGridLayout()
-        grid.setSpacing(4)  # Espaçamento entre células
-
-        # Tamanho dinâmico das células baseado no tamanho da matriz
-        n = len(matriz)
-        cell_size = 40 if n <= 12 else 28  # Células menores para matrizes grandes
-
-
-        # ============================================================================
-        # ESTILOS CSS PARA ESTADOS DAS CÉLULAS
-        # ============================================================================
-        STYLE_DEFAULT = (
-            "QLabel {"
-            "background-color: #1a1a24;"     # Cinza escuro padrão
-            "color: white;"
-            "border: 2px solid #2a2a3a;"
-            "border-radius: 6px;"
-            "}"
-        )
-        STYLE_SELECTED = (
-            "QLabel {"
-            "background-color: #2d3d5a;"     # Azul durante seleção temporária
-            "color: white;"
-            "border: 2px solid #4b6aa8;"
-            "border-radius: 6px;"
-            "}"
-        )
-        STYLE_FOUND = (
-            "QLabel {"
-            "background-color: #2f8f46;"     # Verde para palavras já encontradas
-            "color: white;"
-            "border: 2px solid #45c165;"
-            "border-radius: 6px;"
-            "}"
-        )
-
-        # Referência ao container para cálculos de hit-testing durante arrasto
-        self._esquerda = esquerda
-
-        # ============================================================================
-        # CLASSE CELLLABEL - CÉLULA INTERATIVA DA MATRIZ
-        # ============================================================================
-        # Definir classe interna para evitar problemas de escopo com referências parent
-        parent = self
 
-        class CellLabel(QLabel):
-            """
-            Célula individual da matriz que responde a eventos de mouse.
-            
-            Cada célula conhece sua posição (i, j) na matriz e implementa
-            a lógica de seleção por clique e arrasto. Os eventos são delegados
-            para a classe pai TelaJogo que gerencia o estado global da seleção.
-            """
-            
-            def __init__(self, i, j, letra):
-                """
-                Inicializa uma célula da matriz com sua posição e letra.
-                
-                Args:
-                    i, j (int): Coordenadas da célula na matriz
-                    letra (str): Caractere a ser exibido na célula
-                """
-                super().__init__(letra)
-                self.i = i
-                self.j = j
-                self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.setFont(font_pixel)
-                self.setFixedSize(cell_size, cell_size)
-                self.setStyleSheet(STYLE_DEFAULT)
-                self.setMouseTracking(True)  # Necessário para capturar movimento durante arrasto
-
-            def enterEvent(self, event):
-                """Atualiza seleção quando mouse entra na célula durante arrasto."""
-                if parent._selecting:
-                    parent._update_selection(self.i, self.j)
-                super().enterEvent(event)
-
-            def mousePressEvent(self, event):
-                """Inicia seleção quando clique esquerdo é pressionado."""
-                if event.button() == Qt.MouseButton.LeftButton:
-                    parent._start_selection(self.i, self.j)
-                super().mousePressEvent(event)
-
-            def mouseReleaseEvent(self, event):
-                """Finaliza seleção quando botão do mouse é solto."""
-                if parent._selecting:
-                    parent._finalize_selection()
-                super().mouseReleaseEvent(event)
-
-            def mouseMoveEvent(self, event):
-                """
-                Processa movimento do mouse durante arrasto.
-                
-                Durante o arrasto, identifica qual célula está sob o cursor
-                mesmo que o mouse não esteja exatamente sobre esta célula específica.
-                """
-                if parent._selecting:
-                    # Converte posição global do mouse para coordenadas locais do container
-                    global_pos = event.globalPosition().toPoint()
-                    local_in_esquerda = parent._esquerda.mapFromGlobal(global_pos)
-                    
-                    # Identifica qual widget filho está sob o cursor (hit-testing)
-                    target = parent._esquerda.childAt(local_in_esquerda)
-                    if isinstance(target, CellLabel):
-                        parent._update_selection(target.i, target.j)
-                super().mouseMoveEvent(event)
-
-        # ============================================================================
-        # CONSTRUÇÃO DA GRADE DE CÉLULAS INTERATIVAS
-        # ============================================================================
-        # Cria matriz bidimensional de widgets CellLabel correspondente à matriz de dados
-        for i, linha in enumerate(matriz):
-            row = []
-            for j, letra in enumerate(linha):
-                lbl = CellLabel(i, j, letra)
-                grid.addWidget(lbl, i, j)  # Adiciona na posição (i,j) do layout de grade
-                row.append(lbl)
-            self._grid_labels.append(row)
+        # Tabuleiro desenhado (preenchido em carregar_jogo): só as células
+        # visíveis são pintadas, com rolagem e zoom para matrizes grandes
+        self._tabuleiro = TabuleiroView(self)
 
         # Monta estrutura da área esquerda
-        esquerda_layout.addLayout(grid)
+        esquerda_layout.addWidget(self._tabuleiro)
         esquerda.setLayout(esquerda_layout)
 
         # ============================================================================
@@ -232,187 +150,30 @@ class TelaJogo(QWidget):
         # ============================================================================
         # Container da sidebar com lista de dicas clicáveis
         direita = QFrame()
-        direita.setStyleSheet("""
-            QFrame {
-                background-color: #0c0c12;
-                border-left: 6px solid #000;
-            }
-        """)
+        direita.setStyleSheet(estilo("painel_dicas"))
 
         direita_container_layout = QVBoxLayout(direita)
         direita_container_layout.setContentsMargins(30, 20, 30, 20)
         direita_container_layout.setSpacing(15)
+        self._layout_direita = direita_container_layout
 
         # ============================================================================
         # CONTADOR DE PROGRESSO
         # ============================================================================
         # Exibe quantas palavras foram encontradas do total
-        total = len(palavras_info)
-        titulo_palavras = QLabel(f"palavras encontradas: 0/{total}")
+        titulo_palavras = QLabel()
         titulo_palavras.setFont(font_pixel)
-        titulo_palavras.setStyleSheet("color: white;")
+        titulo_palavras.setStyleSheet(estilo("texto_branco"))
         titulo_palavras.setAlignment(Qt.AlignmentFlag.AlignCenter)
         direita_container_layout.addWidget(titulo_palavras)
         self._titulo_palavras = titulo_palavras
 
-        # ============================================================================
-        # ÁREA DE DICAS ROLÁVEIS
-        # ============================================================================
-        # Container scrollável para lista de dicas (inicialmente ocultas)
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea { border: none; }
-            QScrollBar:vertical { background: #0c0c12; width: 12px; }
-            QScrollBar::handle:vertical { background: #2a2a3a; min-height: 24px; border-radius: 6px; }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }
-        """)
-        scroll_content = QWidget()
-        dicas_layout = QVBoxLayout(scroll_content)
-        dicas_layout.setContentsMargins(0, 0, 0, 0)
-        dicas_layout.setSpacing(12)
-        scroll.setWidget(scroll_content)
-        self._dicas_layout = dicas_layout
-        # ============================================================================
-        # CLASSE DICAITEM - ITEM CLICÁVEL DA LISTA DE DICAS
-        # ============================================================================
-        class DicaItem(QLabel):
-            """
-            Widget interativo para exibir dicas das palavras.
-            
-            Comportamentos:
-            - Inicialmente oculta ("clique para revelar dica")
-            - Clique revela o texto real da dica (cor laranja)
-            - Segundo clique permite ocultar novamente (toggle)
-            - Quando palavra é encontrada: auto-revela e trava (cor verde)
-            - Suporte ao atalho 'E' para revelar todas as dicas
-            """
-            
-            def __init__(self, dica_texto: str):
-                """
-                Inicializa item de dica em estado oculto.
-                
-                Args:
-                    dica_texto (str): Texto da dica a ser revelado quando clicado
-                """
-                super().__init__("clique para revelar dica")
-                self._dica = dica_texto or "(sem dica)"
-                self._revealed = False    # Se a dica está sendo exibida
-                self._locked = False      # Se o item está travado (palavra encontrada)
-                self.setFont(font_pixel)
-                self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.setWordWrap(True)
-                self.setMinimumHeight(40)
-                self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-                self.setStyleSheet("""
-                    QLabel {
-                        background-color: #2a2a3a;
-                        color: #cccccc;
-                        border-radius: 8px;
-                        padding: 10px;
-                        border: 1px solid #3a3a4a;
-                        min-height: 40px;
-                    }
-                """)
-
-            def mousePressEvent(self, event):
-                """
-                Toggle de revelação da dica ao clicar (se não estiver travada).
-                
-                Estados:
-                - Oculta -> Revelada (laranja): mostra texto da dica
-                - Revelada -> Oculta (cinza): volta ao texto padrão
-                - Travada: ignora cliques (palavra já foi encontrada)
-                """
-                if self._locked:
-                    return
-                
-                if not self._revealed:
-                    # Revela a dica
-                    self._revealed = True
-                    self.setText(self._dica)
-                    self.setStyleSheet("""
-                        QLabel {
-                            background-color: #ff8c00;
-                            color: black;
-                            border-radius: 8px;
-                            padding: 10px;
-                            border: 1px solid #cc6f00;
-                        }
-                    """)
-                else:
-                    # Oculta a dica novamente (toggle)
-                    self._revealed = False
-                    self.setText("clique para revelar dica")
-                    self.setStyleSheet("""
-                        QLabel {
-                            background-color: #2a2a3a;
-                            color: #cccccc;
-                            border-radius: 8px;
-                            padding: 10px;
-                            border: 1px solid #3a3a4a;
-                        }
-                    """)
-
-            def reveal(self, lock: bool = False):
-                """
-                Força revelação da dica (usado pelo atalho 'E').
-                
-                Args:
-                    lock (bool): Se deve travar o item após revelação
-                """
-                if not self._revealed:
-                    self._revealed = True
-                    self.setText(self._dica)
-                    self.setStyleSheet("""
-                        QLabel {
-                            background-color: #ff8c00;
-                            color: black;
-                            border-radius: 8px;
-                            padding: 10px;
-                            border: 1px solid #cc6f00;
-                        }
-                    """)
-                self._locked = lock or self._locked
-
-            def mark_found(self):
-                """
-                Marca dica como encontrada (verde) e trava interação.
-                
-                Chamado automaticamente quando palavra correspondente é descoberta.
-                Estado final: revelada + travada + estilo verde.
-                """
-                self._revealed = True
-                self._locked = True
-                self.setText(self._dica)
-                self.setStyleSheet("""
-                    QLabel {
-                        background-color: #2f8f46;
-                        color: white;
-                        border-radius: 8px;
-                        padding: 10px;
-                        border: 1px solid #45c165;
-                    }
-                """)
-
-        # ============================================================================
-        # CONSTRUÇÃO DA LISTA DE DICAS E MAPEAMENTO
-        # ============================================================================
-        # Cria widgets DicaItem para cada palavra e mapeia palavra->widget para acesso direto
-        self._mapa_dicas = {}
-        for info in palavras_info:
-            dica = info.get('dica', '(sem dica)')
-            palavra = info.get('palavra', '')
-            item = DicaItem(dica)
-            self._dicas_layout.addWidget(item)
-            if palavra:
-                self._mapa_dicas[palavra] = item  # Permite marcar dica quando palavra for encontrada
-
-        # Espaçador para empurrar itens para o topo da área rolável
-        self._dicas_layout.addStretch(1)
-        
-        # Adiciona área rolável ao container da sidebar
-        direita_container_layout.addWidget(scroll, stretch=1)
+        # Filtro e lista de dicas: montados por _montar_dicas (na hora, ou
+        # como primeira etapa de carregar_em_etapas)
+        self._lista_dicas = None
+        self._modelo_dicas = None
+        self._filtro_dicas = None
+        direita_container_layout.addStretch(1)  # Ocupa o lugar da lista até ela existir
 
         # ============================================================================
         # MONTAGEM FINAL DO LAYOUT PRINCIPAL
@@ -422,20 +183,221 @@ class TelaJogo(QWidget):
         layout_main.addWidget(direita, stretch=1)    # Sidebar ocupa 1/3 do espaço
 
         # ============================================================================
-        # PRÉ-COMPUTAÇÃO DE MAPEAMENTO DE COORDENADAS
+        # HUD DE DESEMPENHO (F3)
         # ============================================================================
-        # Cria lookup tables para validação eficiente de seleções
-        # Mapeia coordenadas -> índice da palavra (ambas direções)
-        for idx, info in enumerate(self.palavras_info):
-            coords = tuple(info.get('posicoes', []))
-            if not coords:
-                continue
-            self._coords_map[coords] = idx                        # Direção original
-            self._coords_map_rev[tuple(reversed(coords))] = idx  # Direção reversa
+        # Criado por último para ficar acima dos demais filhos; fora de qualquer layout
+        self._hud = HudDesempenho(self, self._perf, self._tabuleiro.atlas())
+
+        # ============================================================================
+        # DADOS DA PRIMEIRA PARTIDA
+        # ============================================================================
+        if matriz is not None:
+            self._montar_dicas()
+            self.carregar_jogo(matriz, palavras_info, tempo_geracao_ms)
+        else:
+            self._mostrar_carregando()
+        self._perf.tempo_construcao_ms = (time.perf_counter() - inicio_construcao) * 1000.0
 
         # Define foco para receber eventos de teclado (atalhos)
         self.setFocus()
 
+    # ============================================================================
+    # CARREGAMENTO DE PARTIDAS (REUSO DA TELA)
+    # ============================================================================
+
+    def _montar_dicas(self):
+        """
+        Cria o filtro e a lista de dicas da sidebar (uma vez por tela).
+        """
+        if self._lista_dicas is not None:
+            return
+        # Lista model/view: só as dicas visíveis são medidas e pintadas, e o
+        # estado (oculta/revelada/encontrada) fica no modelo, não em widgets
+        self._lista_dicas = ListaDicas()
+        self._modelo_dicas = self._lista_dicas.modelo()
+
+        # Filtro por texto/estado/tamanho, respondido pelo índice do modelo
+        self._filtro_dicas = FiltroDicas(self._modelo_dicas)
+        self._filtro_dicas.sair.connect(self.setFocus)
+
+        # Substitui o espaçador reservado no __init__
+        layout = self._layout_direita
+        layout.takeAt(layout.count() - 1)
+        layout.addWidget(self._filtro_dicas)
+        layout.addWidget(self._lista_dicas, stretch=1)
+
+    def carregar_jogo(self, matriz, palavras_info, tempo_geracao_ms=None, mensagem=None):
+        """
+        Carrega uma partida nova nesta tela, reaproveitando os widgets existentes.
+        
+        O tabuleiro e a lista de dicas apenas trocam os dados exibidos; nenhum
+        widget é criado ou removido, qualquer que seja o tamanho da matriz.
+        
+        Args:
+            matriz (list): Nova matriz 2D de caracteres
+            palavras_info (list): Metadados das palavras da nova partida
+            tempo_geracao_ms (float, optional): Tempo gasto gerando a matriz (HUD)
+            mensagem (str, optional): Frase secreta escondida nas células livres
+        """
+        inicio = time.perf_counter()
+        self._cancelar_etapas()
+        self._montar_dicas()
+        self._iniciar_partida(matriz, palavras_info, tempo_geracao_ms, mensagem)
+        self._carregar_grade(matriz)
+        self._finalizar_carregamento()
+        self._perf.tempo_construcao_ms = (time.perf_counter() - inicio) * 1000.0
+
+    def carregar_em_etapas(self, gerar):
+        """
+        Carrega uma partida em etapas, sem bloquear o primeiro frame.
+        
+        A tela passa na hora para o estado "carregando" (aviso no tabuleiro,
+        sidebar vazia, mouse e atalhos do jogo bloqueados, exceto ESC e F3).
+        Cada etapa roda em uma iteração do loop de eventos, com frames
+        pintados entre elas:
+        1. Monta o filtro e a lista de dicas (só na primeira partida)
+        2. Gera a partida (gerar)
+        3. Exibe o tabuleiro
+        4. Carrega as dicas e os mapas de coordenadas; libera a entrada
+        
+        Chamar de novo (ou carregar_jogo) descarta as etapas pendentes.
+        
+        Args:
+            gerar (callable): Sem argumentos; retorna (matriz, palavras_info,
+                              tempo_geracao_ms) ou (..., mensagem), como os
+                              argumentos de carregar_jogo, ou None se a
+                              geração falhou
+        """
+        self._cancelar_etapas()
+        self._mostrar_carregando()
+        self._perf.tempo_construcao_ms = 0.0
+        partida = {}
+
+        def gerar_partida():
+            resultado = gerar()
+            if resultado is None:
+                self._etapas.clear()
+                self._tabuleiro.definir_aviso(self.TEXTO_ERRO)
+                return
+            partida["dados"] = resultado
+
+        def exibir_tabuleiro():
+            self._iniciar_partida(*partida["dados"])
+            self._carregar_grade(self.matriz)
+
+        # (etapa, conta no tempo de construção do HUD); a geração tem medida própria
+        self._etapas.extend((
+            (self._montar_dicas, True),
+            (gerar_partida, False),
+            (exibir_tabuleiro, True),
+            (self._finalizar_carregamento, True),
+        ))
+        self._timer_etapas.start()
+
+    def atlas(self):
+        """
+        Returns:
+            AtlasGlifos: Atlas de glifos do tabuleiro (taxa de acertos para
+                         o HUD e benchmarks, ver soak_memoria.py)
+        """
+        return self._tabuleiro.atlas()
+
+    def pronto(self):
+        """
+        Returns:
+            bool: True quando a partida terminou de carregar e aceita entrada
+        """
+        return self._pronto
+
+    def _proxima_etapa(self):
+        """Executa uma etapa da montagem e agenda a seguinte para a próxima iteração."""
+        if not self._etapas:
+            return
+        etapa, construcao = self._etapas.popleft()
+        inicio = time.perf_counter()
+        etapa()
+        if construcao:
+            self._perf.tempo_construcao_ms += (time.perf_counter() - inicio) * 1000.0
+        if self._etapas:
+            self._timer_etapas.start()
+
+    def _cancelar_etapas(self):
+        """Descarta as etapas pendentes de carregar_em_etapas."""
+        self._etapas.clear()
+        self._timer_etapas.stop()
+
+    def _mostrar_carregando(self):
+        """Estado "carregando": aviso no tabuleiro, dicas vazias e entrada bloqueada."""
+        self._pronto = False
+        self._selecting = False
+        self._current_path = []
+        self.matriz = []
+        self.palavras_info = []
+        self._sessao = None
+        self._tabuleiro.carregar([])
+        self._tabuleiro.definir_aviso(self.TEXTO_CARREGANDO)
+        if self._modelo_dicas is not None:
+            self._modelo_dicas.carregar([])
+            self._filtro_dicas.reiniciar()
+        self._titulo_palavras.setText("palavras encontradas: -")
+
+    def _iniciar_partida(self, matriz, palavras_info, tempo_geracao_ms, mensagem=None):
+        """
+        Zera o estado da partida anterior e guarda os dados da nova.
+        
+        Args:
+            matriz (list): Matriz 2D de caracteres
+            palavras_info (list): Metadados das palavras
+            tempo_geracao_ms (float, optional): Tempo gasto gerando a matriz (HUD)
+            mensagem (str, optional): Frase secreta escondida nas células livres
+        """
+        self.matriz = matriz
+        self.palavras_info = palavras_info
+        self._mensagem = mensagem
+        self._sessao = SessaoJogo(matriz, palavras_info, self._dicionario)
+        self._sessao.observar(self._ao_evento_sessao)
+        self._selecting = False
+        self._start_cell = None
+        self._current_path = []
+        self._perf.tempo_geracao_ms = tempo_geracao_ms
+
+    def _finalizar_carregamento(self):
+        """
+        Carrega as dicas e libera a entrada.
+        
+        No modo descoberta, enumera aqui as palavras do dicionário presentes
+        no tabuleiro (total do contador).
+        """
+        self._carregar_dicas(self.palavras_info)
+        if self._dicionario is not None:
+            inicio = time.perf_counter()
+            total = self._sessao.total_descobertas()
+            log("game_ui.py", f"{total} palavras do dicionário no tabuleiro "
+                           f"({(time.perf_counter() - inicio) * 1000:.0f} ms)")
+        self._update_counter()
+        self._pronto = True
+
+    def _carregar_grade(self, matriz):
+        """
+        Exibe as letras da matriz no tabuleiro.
+        
+        Args:
+            matriz (list): Matriz 2D de caracteres
+        """
+        # O tamanho das células (zoom 1) é calculado pela view para caber na área
+        self._tabuleiro.carregar(matriz)
+
+    def _carregar_dicas(self, palavras_info):
+        """
+        Troca as dicas da sidebar pelas da partida (apenas o modelo muda).
+        
+        Args:
+            palavras_info (list): Colocacao de cada palavra (com dica e palavra)
+        """
+        self._modelo_dicas.carregar(palavras_info)
+        self._filtro_dicas.reiniciar()
+        self._lista_dicas.scrollToTop()
+
     # ============================================================================
     # MÉTODOS DE GERENCIAMENTO DA SELEÇÃO POR CLIQUE E ARRASTO
     # ============================================================================
@@ -447,8 +409,12 @@ class TelaJogo(QWidget):
         Args:
             i, j (int): Coordenadas da célula onde iniciou a seleção
         """
-        # Não permite iniciar seleção em células já encontradas
-        if (i, j) in self._found_cells:
+        # Clicar na grade tira o foco do filtro de dicas: atalhos voltam a funcionar
+        self.setFocus()
+
+        # Partida ainda carregando ou não permite iniciar seleção em células já
+        # encontradas ou fora da máscara de formato do tabuleiro
+        if not self._pronto or self._sessao.celula_encontrada(i, j) or not self._sessao.celula_ativa(i, j):
             return
         self._selecting = True
         self._start_cell = (i, j)
@@ -501,9 +467,11 @@ class TelaJogo(QWidget):
             return
         
         # Verifica se todas as coordenadas estão dentro dos limites da matriz
-        n = len(self.matriz)
+        # (e dentro da máscara: a reta não atravessa furos do formato)
+        sessao = self._sessao
+        linhas, colunas = sessao.linhas, sessao.colunas
         for (pi, pj) in path:
-            if pi < 0 or pj < 0 or pi >= n or pj >= n:
+            if pi < 0 or pj < 0 or pi >= linhas or pj >= colunas or not sessao.celula_ativa(pi, pj):
                 return
         
         # Atualiza UI com o path temporário
@@ -514,75 +482,67 @@ class TelaJogo(QWidget):
         Finaliza seleção quando usuário solta o botão do mouse.
         
         Processo:
-        1. Verifica se o path selecionado corresponde a alguma palavra
-        2. Se encontrou palavra válida:
-           - Marca células como encontradas (verde permanente)
-           - Atualiza contador de progresso
-           - Revela e trava a dica correspondente
-           - Verifica condição de vitória
+        1. Envia as pontas do path à sessão, que valida e marca a palavra
+           (no modo descoberta, confere também as letras no dicionário)
+        2. Se era uma palavra nova, a sessão emite os eventos tratados em
+           _ao_evento_sessao (células, contador, dica e vitória)
         3. Limpa seleção temporária
         """
-        if self._game_over or not self._current_path:
-            self._reset_temporary_selection()
-            return
-        
-        # Converte path para tupla para busca nos mapas de coordenadas
-        path_tuple = tuple(self._current_path)
-        
-        # Busca palavra correspondente (direção normal e reversa)
-        idx = self._coords_map.get(path_tuple)
-        if idx is None:
-            idx = self._coords_map_rev.get(path_tuple)  # Tenta direção reversa
-        
-        if idx is not None:
-            info = self.palavras_info[idx]
-            if not info.get('encontrada', False):
-                # ============================================================
-                # PALAVRA ENCONTRADA - ATUALIZAR ESTADO DO JOGO
-                # ============================================================
-                info['encontrada'] = True
-                
-                # Marca células da palavra como encontradas (estilo verde permanente)
-                for (i, j) in path_tuple:
-                    self._found_cells.add((i, j))
-                    self._grid_labels[i][j].setStyleSheet(
-                        "QLabel {background-color: #2f8f46; color: white; border: 2px solid #45c165; border-radius: 6px;}"
-                    )
-                
-                # Atualiza contador de palavras encontradas
-                self._update_counter()
-                
-                # Revela e trava dica correspondente
-                palavra = info.get('palavra', '')
-                dica_item = self._mapa_dicas.get(palavra)
-                if dica_item:
-                    dica_item.mark_found()
-                
-                # Verifica se todas as palavras foram encontradas (condição de vitória)
-                if self._all_found():
-                    self._game_over = True
-                    self._mostrar_vitoria_e_finalizar()
+        if self._sessao is not None and self._current_path:
+            # A seleção é uma reta: as pontas bastam para identificar a palavra
+            self._sessao.selecionar(self._current_path[0], self._current_path[-1])
         
         # Limpa seleção temporária independentemente do resultado
         self._reset_temporary_selection()
 
+    def _ao_evento_sessao(self, evento, dados):
+        """
+        Reflete na tela um evento da SessaoJogo.
+        
+        Args:
+            evento (str): EVENTO_ENCONTRADA, EVENTO_DESCOBERTA ou EVENTO_FIM
+            dados: Índice da palavra (encontrada), (palavra, início, fim) da
+                   descoberta ou se o jogador desistiu (fim)
+        """
+        if evento == EVENTO_ENCONTRADA:
+            # Marca células da palavra como encontradas (verde permanente)
+            posicoes = self.palavras_info[dados].posicoes()
+            self._perf.restyles += self._tabuleiro.marcar_encontradas(posicoes)
+            # Revela e trava dica correspondente (mesmo índice no modelo)
+            self._modelo_dicas.marcar_encontrada(dados)
+            self._update_counter()
+        elif evento == EVENTO_DESCOBERTA:
+            # Descoberta livre: cor própria, células continuam selecionáveis
+            _, inicio, fim = dados
+            self._perf.restyles += self._tabuleiro.marcar_descobertas(self._reta(inicio, fim))
+            self._update_counter()
+        elif evento == EVENTO_FIM:
+            if self._mensagem:
+                # Mensagem secreta: as células que sobraram se destacam por trás do popup
+                self._perf.restyles += self._tabuleiro.marcar_descobertas(self._sessao.celulas_livres())
+            self._mostrar_vitoria_e_finalizar()
+
+    @staticmethod
+    def _reta(inicio, fim):
+        """Células da reta de inicio a fim (inclusive), em uma das 8 direções."""
+        (i0, j0), (i1, j1) = inicio, fim
+        di, dj = (i1 > i0) - (i1 < i0), (j1 > j0) - (j1 < j0)
+        n = max(abs(i1 - i0), abs(j1 - j0)) + 1
+        return [(i0 + k * di, j0 + k * dj) for k in range(n)]
+
     def _set_temporary_path(self, path):
         """
-        Aplica estilo temporário (azul) às células do path atual durante seleção.
+        Destaca (azul) as células do path atual durante seleção.
+        
+        Apenas as células que entraram ou saíram do path são repintadas;
+        células já encontradas mantêm o verde.
         
         Args:
             path (list): Lista de tuplas (i, j) representando o caminho selecionado
         """
-        self._clear_temp_styles()  # Remove estilos temporários anteriores
+        self._perf.recomputos_selecao += 1
         self._current_path = path
-        
-        # Aplica estilo azul temporário às células do path (exceto já encontradas)
-        for (i, j) in path:
-            if (i, j) in self._found_cells:
-                continue  # Não sobrescreve estilo de células já encontradas
-            self._grid_labels[i][j].setStyleSheet(
-                "QLabel {background-color: #2d3d5a; color: white; border: 2px solid #4b6aa8; border-radius: 6px;}"
-            )
+        self._perf.restyles += self._tabuleiro.definir_selecao(path)
 
     def _reset_temporary_selection(self):
         """
@@ -600,30 +560,32 @@ class TelaJogo(QWidget):
 
     def _clear_temp_styles(self):
         """
-        Remove estilos temporários e restaura aparência padrão das células.
+        Remove o destaque temporário, restaurando a aparência padrão.
         
-        Preserva células já encontradas (verde) e restaura células
-        não encontradas ao estilo padrão (cinza escuro).
+        Células já encontradas (verde) não são afetadas.
         """
-        for i, row in enumerate(self._grid_labels):
-            for j, lbl in enumerate(row):
-                if (i, j) in self._found_cells:
-                    continue  # Preserva estilo verde das células encontradas
-                lbl.setStyleSheet(
-                    "QLabel {background-color: #1a1a24; color: white; border: 2px solid #2a2a3a; border-radius: 6px;}"
-                )
+        self._perf.restyles += self._tabuleiro.definir_selecao(())
 
     def _mostrar_vitoria_e_finalizar(self):
         """
         Exibe popup de vitória e retorna ao menu principal.
         
         Chamado quando todas as palavras foram encontradas.
+        No modo mensagem secreta, o popup revela a frase escondida (ou avisa
+        que a partida saiu sem ela).
         Após o usuário fechar o popup, executa callback de finalização
-        para retornar ao menu principal.
+        para retornar ao menu principal. Se houver callback de replay,
+        o popup oferece "jogar de novo", que carrega uma nova partida
+        nesta mesma tela.
         """
         msg = QMessageBox(self)
         msg.setWindowTitle("Vitória!")
-        msg.setText("parabens você venceu, sua reconpensa é... absolutamente nada!")
+        texto = "parabens você venceu, sua reconpensa é... absolutamente nada!"
+        if self._mensagem:
+            texto += f"\n\nmensagem secreta: {self._mensagem}"
+        elif self._modo_mensagem:
+            texto += f"\n\n{self.TEXTO_SEM_MENSAGEM}"
+        msg.setText(texto)
         msg.setIcon(QMessageBox.Icon.Information)
         msg.setStandardButtons(QMessageBox.StandardButton.Close)
         
@@ -631,17 +593,23 @@ class TelaJogo(QWidget):
         btn = msg.button(QMessageBox.StandardButton.Close)
         if btn is not None:
             btn.setText("Fechar")
+
+        # Botão opcional para jogar de novo com a mesma dificuldade
+        btn_replay = None
+        if callable(self._on_replay):
+            btn_replay = msg.addButton("Jogar de novo", QMessageBox.ButtonRole.AcceptRole)
         
         # Habilita botão X da janela
         msg.setWindowFlag(Qt.WindowType.WindowCloseButtonHint, True)
         
         # Aplica estilo consistente com o tema do jogo
-        msg.setStyleSheet(
-            "QMessageBox { background-color: #111018; }"
-            "QLabel { color: white; font-family: 'Press Start 2P'; }"
-        )
+        msg.setStyleSheet(estilo("popup_jogo"))
         
         msg.exec()
+
+        if btn_replay is not None and msg.clickedButton() is btn_replay:
+            self._on_replay()
+            return
         
         # Após fechar popup, retorna ao menu principal
         if callable(self._on_finish):
@@ -654,20 +622,17 @@ class TelaJogo(QWidget):
         Atualiza display do contador de palavras encontradas.
         
         Chamado sempre que uma nova palavra é descoberta.
-        Formato: "palavras encontradas: X/Y"
+        Formato: "palavras encontradas: X/Y" (+ "descobertas: D/T" no modo
+        descoberta livre; + um aviso no modo mensagem secreta quando a
+        partida saiu sem a frase)
         """
-        total = len(self.palavras_info)
-        encontrados = sum(1 for p in self.palavras_info if p.get('encontrada'))
-        self._titulo_palavras.setText(f"palavras encontradas: {encontrados}/{total}")
-
-    def _all_found(self) -> bool:
-        """
-        Verifica se todas as palavras foram encontradas (condição de vitória).
-        
-        Returns:
-            bool: True se todas as palavras estão marcadas como encontradas
-        """
-        return all(p.get('encontrada') for p in self.palavras_info)
+        sessao = self._sessao
+        texto = f"palavras encontradas: {sessao.encontradas}/{sessao.total}"
+        if self._dicionario is not None:
+            texto += f"\ndescobertas: {len(sessao.descobertas)}/{sessao.total_descobertas()}"
+        if self._modo_mensagem and not self._mensagem:
+            texto += "\nsem mensagem secreta neste tabuleiro"
+        self._titulo_palavras.setText(texto)
 
     def _reveal_all_hints(self):
         """
@@ -676,8 +641,7 @@ class TelaJogo(QWidget):
         Permite ao usuário ver todas as dicas de uma vez para facilitar
         a localização das palavras restantes.
         """
-        for item in self._mapa_dicas.values():
-            item.reveal(lock=False)  # Revela mas permite ocultar novamente
+        self._modelo_dicas.revelar_todas()  # Revela mas permite ocultar novamente
 
     def _desistir_mark_all_found(self):
         """
@@ -688,27 +652,11 @@ class TelaJogo(QWidget):
         - Marca todas as dicas como encontradas e travadas
         - Atualiza contador para 100%
         - Exibe popup de vitória
-        """
-        for info in self.palavras_info:
-            if not info.get('encontrada'):
-                info['encontrada'] = True
-                # Pinta todas as células da palavra como encontradas
-                for (i, j) in info.get('posicoes', []):
-                    self._found_cells.add((i, j))
-                    self._grid_labels[i][j].setStyleSheet(
-                        "QLabel {background-color: #2f8f46; color: white; border: 2px solid #45c165; border-radius: 6px;}"
-                    )
-                # Marca dica correspondente como encontrada
-                dica_item = self._mapa_dicas.get(info.get('palavra', ''))
-                if dica_item:
-                    dica_item.mark_found()
-        
-        self._update_counter()
         
-        # Finaliza jogo se ainda não estava terminado
-        if not self._game_over:
-            self._game_over = True
-            self._mostrar_vitoria_e_finalizar()
+        Cada passo chega como evento da sessão (ver _ao_evento_sessao); se a
+        partida já terminou, não faz nada.
+        """
+        self._sessao.desistir()
 
     def show_como_jogar(self):
         """
@@ -730,12 +678,7 @@ class TelaJogo(QWidget):
         msg = QMessageBox(self)
         msg.setWindowTitle("Como jogar")
         msg.setText(texto)
-        msg.setStyleSheet(
-            "QMessageBox { background-color: #111018; }"
-            "QMessageBox QLabel { color: white; font-family: 'Press Start 2P'; }"
-            "QLabel { color: white; font-family: 'Press Start 2P'; }"
-            "QPushButton { background-color: #2a2a3a; color: white; }"
-        )
+        msg.setStyleSheet(estilo("popup_como_jogar_jogo"))
         msg.exec()
 
     # ============================================================================
@@ -751,11 +694,19 @@ class TelaJogo(QWidget):
         - D: Desiste (marca todas as palavras como encontradas)
         - C: Abre guia "Como jogar"
         - ESC: Sai do jogo e volta ao menu (processado pela classe pai)
+        - F3: Liga/desliga o HUD de desempenho (debug)
+        - +/-: Aproxima/afasta o tabuleiro; 0 volta ao zoom original
+        
+        Enquanto a partida carrega (carregar_em_etapas), só ESC e F3 valem.
         
         Args:
             event: Evento de teclado do Qt
         """
         key = event.key()
+
+        if not self._pronto and key not in (Qt.Key.Key_Escape, Qt.Key.Key_F3):
+            event.accept()
+            return
         
         if key in (Qt.Key.Key_E,):
             self._reveal_all_hints()
@@ -771,9 +722,30 @@ class TelaJogo(QWidget):
             self.show_como_jogar()
             event.accept()
             return
+
+        if key in (Qt.Key.Key_F3,):
+            self._hud.alternar()
+            event.accept()
+            return
+
+        if key in (Qt.Key.Key_Plus, Qt.Key.Key_Equal):
+            self._tabuleiro.aproximar(1)
+            event.accept()
+            return
+
+        if key in (Qt.Key.Key_Minus,):
+            self._tabuleiro.aproximar(-1)
+            event.accept()
+            return
+
+        if key in (Qt.Key.Key_0,):
+            self._tabuleiro.definir_zoom(1.0)
+            event.accept()
+            return
             
         if key in (Qt.Key.Key_Escape,):
-            # Atalho ESC: volta ao menu principal
+            # Atalho ESC: volta ao menu principal (descarta carregamento pendente)
+            self._cancelar_etapas()
             if callable(self._on_finish):
                 self._on_finish()
             else:
@@ -0,0 +1,179 @@
+"""
+GAME/HUD_UI.PY - Overlay de Desempenho da Tela de Jogo (debug)
+===============================================================
+Este módulo define o HUD de desempenho exibido sobre a TelaJogo com a tecla F3.
+Responsável por:
+- Manter contadores baratos (inteiros) alimentados pela TelaJogo
+- Medir o tempo de cada frame (processamento do UpdateRequest da janela)
+- Exibir tempo de geração, tempo de construção dos widgets, frame time,
+  taxa de eventos de arrasto x recálculos de seleção, restyles/frames por evento
+  e taxa de acerto do atlas de glifos do tabuleiro
+
+Cuidados de custo:
+- O HUD não participa de nenhum layout (filho posicionado manualmente, tamanho
+  fixo), então atualizar o texto não provoca relayout da grade
+- O texto só é atualizado 4x por segundo e apenas enquanto o HUD está visível
+- O filtro de eventos da janela só é instalado enquanto o HUD está visível
+"""
+
+import time
+
+from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import Qt, QTimer, QEvent, QObject
+
+from utils.recursos import estilo, fonte_mono
+
+INTERVALO_HUD_MS = 250  # Frequência de atualização do texto do HUD
+TAMANHO_FONTE_HUD = 9   # Pontos da fonte monoespaçada do HUD
+
+
+class ContadoresDesempenho:
+    """
+    Contadores de eventos da TelaJogo lidos pelo HUD.
+
+    São atributos inteiros simples para que o custo de incrementá-los no
+    caminho quente (arrasto do mouse) seja desprezível.
+    """
+
+    __slots__ = (
+        "tempo_geracao_ms", "tempo_construcao_ms",
+        "eventos_arrasto", "recomputos_selecao", "restyles", "frames", "tempo_frames_ms",
+    )
+
+    def __init__(self):
+        self.tempo_geracao_ms = None    # Geração da matriz (medida pelo game.py)
+        self.tempo_construcao_ms = 0.0  # Construção dos widgets da TelaJogo
+        self.eventos_arrasto = 0        # Eventos de mouse recebidos durante seleção
+        self.recomputos_selecao = 0     # Recalculos do path temporário
+        self.restyles = 0               # Células que mudaram de aparência (repintadas)
+        self.frames = 0                 # UpdateRequests processados pela janela
+        self.tempo_frames_ms = 0.0      # Soma do tempo gasto nesses frames
+
+
+class _MedidorFrames(QObject):
+    """
+    Filtro de eventos que cronometra o processamento de cada frame da janela.
+
+    O filtro só anota o instante em que o UpdateRequest chega e o deixa
+    seguir normalmente (retorna False); um timer de intervalo zero, que só
+    dispara quando o laço de eventos volta a ficar livre, fecha a medição
+    depois que o frame foi pintado.
+    """
+
+    def __init__(self, contadores):
+        super().__init__()
+        self._contadores = contadores
+        self._inicio = None  # Instante do UpdateRequest em medição
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.UpdateRequest and self._inicio is None:
+            self._inicio = time.perf_counter()
+            QTimer.singleShot(0, self._fechar_frame)
+        return False
+
+    def _fechar_frame(self):
+        """Soma o tempo do frame anotado pelo filtro."""
+        if self._inicio is None:
+            return
+        self._contadores.frames += 1
+        self._contadores.tempo_frames_ms += (time.perf_counter() - self._inicio) * 1000.0
+        self._inicio = None
+
+
+class HudDesempenho(QLabel):
+    """
+    Overlay de desempenho posicionado no canto superior esquerdo da tela de jogo.
+
+    Começa oculto; alternar() mostra/esconde.
+    """
+
+    def __init__(self, parent, contadores, atlas=None):
+        """
+        Args:
+            parent (QWidget): Tela de jogo sobre a qual o HUD é desenhado
+            contadores (ContadoresDesempenho): Contadores alimentados pela tela
+            atlas (AtlasGlifos, optional): Atlas do tabuleiro (acertos/faltas)
+        """
+        super().__init__(parent)
+        self._contadores = contadores
+        self._atlas = atlas
+        self._medidor = _MedidorFrames(contadores)
+        self._janela_medida = None
+        self._anterior = None  # (instante, arrasto, recomputos, restyles, frames, tempo_frames, acertos, faltas)
+
+        self.setFont(fonte_mono(TAMANHO_FONTE_HUD))
+        self.setStyleSheet(estilo("hud"))
+        self.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setFixedSize(330, 168)  # Tamanho fixo: mudar o texto não dispara relayout
+        self.move(14, 14)
+        self.hide()
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(INTERVALO_HUD_MS)
+        self._timer.timeout.connect(self._atualizar)
+
+    def alternar(self):
+        """Mostra ou esconde o HUD (tecla F3)."""
+        if self.isVisible():
+            self._timer.stop()
+            if self._janela_medida is not None:
+                self._janela_medida.removeEventFilter(self._medidor)
+                self._janela_medida = None
+            self.hide()
+            return
+
+        self._janela_medida = self.window()
+        self._janela_medida.installEventFilter(self._medidor)
+        self._anterior = None
+        self._atualizar()
+        self.raise_()
+        self.show()
+        self._timer.start()
+
+    def _atualizar(self):
+        """Recalcula as taxas desde a última atualização e troca o texto."""
+        c = self._contadores
+        agora = time.perf_counter()
+        atlas = self._atlas
+        atual = (
+            agora, c.eventos_arrasto, c.recomputos_selecao, c.restyles, c.frames, c.tempo_frames_ms,
+            atlas.acertos if atlas else 0, atlas.faltas if atlas else 0,
+        )
+        anterior = self._anterior or atual
+        self._anterior = atual
+
+        dt = max(agora - anterior[0], 1e-6)
+        arrasto = c.eventos_arrasto - anterior[1]
+        recomputos = c.recomputos_selecao - anterior[2]
+        restyles = c.restyles - anterior[3]
+        frames = c.frames - anterior[4]
+        tempo_frames = c.tempo_frames_ms - anterior[5]
+        # Os contadores do atlas são de quem mede (ex.: soak_memoria.py zera
+        # antes do laço medido): o HUD só lê a diferença, e recomeça do zero
+        # se eles foram zerados desde a última atualização
+        if atual[6] < anterior[6] or atual[7] < anterior[7]:
+            anterior = anterior[:6] + (0, 0)
+        acertos = atual[6] - anterior[6]
+        faltas = atual[7] - anterior[7]
+
+        geracao = "-" if c.tempo_geracao_ms is None else f"{c.tempo_geracao_ms:7.1f} ms"
+        frame_ms = tempo_frames / frames if frames else 0.0
+        por_evento = max(arrasto, 1)
+        if atlas is None:
+            glifos = "-"
+        elif acertos + faltas:
+            glifos = f"{100.0 * acertos / (acertos + faltas):6.1f} % ({len(atlas.glifos)} pixmaps)"
+        else:
+            glifos = f"     - % ({len(atlas.glifos)} pixmaps)"
+
+        self.setText(
+            f"geracao     {geracao}\n"
+            f"construcao  {c.tempo_construcao_ms:7.1f} ms\n"
+            f"frame       {frame_ms:7.2f} ms ({frames / dt:5.1f} fps)\n"
+            f"arrasto     {arrasto / dt:7.1f} ev/s\n"
+            f"selecao     {recomputos / dt:7.1f} recalc/s\n"
+            f"restyle/ev  {restyles / por_evento:7.1f}\n"
+            f"frames/ev   {frames / por_evento:7.2f}\n"
+            f"glifos      {glifos}"
+        )
@@ -0,0 +1,158 @@
+"""
+GAME/INDICE_DICAS.PY - Índice de Busca das Dicas
+================================================
+Este módulo implementa o índice usado pelo filtro da sidebar de dicas.
+Responsável por:
+- Normalizar os textos (minúsculas, sem acentos) para a busca por substring
+- Pré-computar, uma vez por partida (na primeira vez em que o filtro é
+  usado), conjuntos de dicas por n-grama (1 a 3 caracteres), por estado e
+  por tamanho da palavra
+- Responder a um filtro (substring + estado + tamanho) com a lista ordenada
+  dos índices das dicas que passam
+
+Representação:
+- Cada conjunto é um bitset em um int do Python (bit i = dica i), então
+  combinar filtros é um AND entre inteiros, feito em C
+- Consultas de até 3 caracteres são respondidas só pelo índice; consultas
+  maiores intersectam os trigramas e confirmam a substring apenas nas
+  candidatas restantes
+
+Não depende do Qt: é usado pelo ModeloDicas (game/dicas_ui.py).
+"""
+
+import re
+import unicodedata
+
+TAMANHO_MAX_GRAMA = 3  # Maior n-grama indexado (as consultas até esse tamanho não precisam de confirmação)
+_RE_UM = re.compile("1")
+
+
+def normalizar(texto):
+    """
+    Prepara um texto para comparação: minúsculas e sem acentos.
+
+    Args:
+        texto (str): Texto original
+
+    Returns:
+        str: Texto normalizado ("Programação" -> "programacao")
+    """
+    # NFD separa o acento da letra; o encode descarta os acentos soltos
+    return unicodedata.normalize("NFD", texto.lower()).encode("ascii", "ignore").decode("ascii")
+
+
+def _para_bits(ids, total):
+    """Converte uma lista de índices em bitset (int)."""
+    mapa = bytearray((total + 7) // 8)
+    for i in ids:
+        mapa[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(mapa, "little")
+
+
+def _para_ids(bits):
+    """Converte um bitset em lista ordenada de índices."""
+    binario = bin(bits)[:1:-1]  # Bit menos significativo primeiro, sem o '0b'
+    return [m.start() for m in _RE_UM.finditer(binario)]
+
+
+class IndiceDicas:
+    """
+    Índice pré-computado das dicas de uma partida.
+
+    Os textos e tamanhos são fixos após a construção; apenas os estados mudam
+    (via mudar_estado), com custo O(1) por dica.
+    """
+
+    __slots__ = ("total", "todos", "_textos", "_gramas", "_por_tamanho", "_por_estado")
+
+    def __init__(self, textos, tamanhos, estados):
+        """
+        Constrói o índice.
+
+        Args:
+            textos (list): Texto pesquisável de cada dica
+            tamanhos (list): Tamanho da palavra de cada dica
+            estados (iterable): Estado inicial (int) de cada dica
+        """
+        self.total = len(textos)
+        self.todos = (1 << self.total) - 1
+        self._textos = [normalizar(t) for t in textos]
+
+        # Listas de ocorrência por n-grama, convertidas em bitsets no final.
+        # Textos repetidos (dicas iguais) são decompostos uma vez só.
+        por_texto = {}
+        for i, texto in enumerate(self._textos):
+            por_texto.setdefault(texto, []).append(i)
+        ocorrencias = {}
+        for texto, ids in por_texto.items():
+            gramas = set(texto)
+            gramas.update([texto[k:k + 2] for k in range(len(texto) - 1)])
+            gramas.update([texto[k:k + 3] for k in range(len(texto) - 2)])
+            for grama in gramas:
+                lista = ocorrencias.get(grama)
+                if lista is None:
+                    ocorrencias[grama] = lista = []
+                lista.extend(ids)
+        self._gramas = {g: _para_bits(ids, self.total) for g, ids in ocorrencias.items()}
+
+        por_tamanho = {}
+        for i, tamanho in enumerate(tamanhos):
+            por_tamanho.setdefault(tamanho, []).append(i)
+        self._por_tamanho = {t: _para_bits(ids, self.total) for t, ids in por_tamanho.items()}
+
+        self._por_estado = {}
+        for i, estado in enumerate(estados):
+            self._por_estado[estado] = self._por_estado.get(estado, 0) | (1 << i)
+
+    def _ids(self, bits):
+        """Lista de índices do bitset (atalho quando todas as dicas passam)."""
+        return list(range(self.total)) if bits == self.todos else _para_ids(bits)
+
+    def mudar_estado(self, i, anterior, novo):
+        """
+        Move a dica i de um estado para outro.
+
+        Args:
+            i (int): Índice da dica
+            anterior (int): Estado atual
+            novo (int): Novo estado
+        """
+        bit = 1 << i
+        self._por_estado[anterior] = self._por_estado.get(anterior, 0) & ~bit
+        self._por_estado[novo] = self._por_estado.get(novo, 0) | bit
+
+    def filtrar(self, consulta="", estado=None, tamanho=None):
+        """
+        Seleciona as dicas que passam por todos os filtros informados.
+
+        Args:
+            consulta (str): Substring procurada no texto (vazia = qualquer)
+            estado (int, optional): Estado exigido
+            tamanho (int, optional): Tamanho de palavra exigido
+
+        Returns:
+            list: Índices das dicas, em ordem crescente
+        """
+        bits = self.todos
+        if estado is not None:
+            bits &= self._por_estado.get(estado, 0)
+        if tamanho is not None:
+            bits &= self._por_tamanho.get(tamanho, 0)
+
+        consulta = normalizar(consulta)
+        if not consulta:
+            return self._ids(bits)
+
+        if len(consulta) <= TAMANHO_MAX_GRAMA:
+            return self._ids(bits & self._gramas.get(consulta, 0))
+
+        # Intersecta os trigramas da consulta, do mais raro ao mais comum
+        gramas = {consulta[k:k + TAMANHO_MAX_GRAMA] for k in range(len(consulta) - TAMANHO_MAX_GRAMA + 1)}
+        for grama in sorted(gramas, key=lambda g: self._gramas.get(g, 0).bit_count()):
+            bits &= self._gramas.get(grama, 0)
+            if not bits:
+                return []
+
+        # Os trigramas podem aparecer separados: confirma a substring
+        textos = self._textos
+        return [i for i in _para_ids(bits) if consulta in textos[i]]
@@ -0,0 +1,390 @@
+"""
+GAME/LADRILHOS.PY - Geração em Paralelo para Tabuleiros Gigantes
+================================================================
+Este módulo gera tabuleiros muito grandes (500x500 ou mais) dividindo a
+matriz em ladrilhos processados ao mesmo tempo por um pool de processos.
+Responsável por:
+- Distribuir as palavras entre os ladrilhos e a passagem de fronteira
+- Posicionar as palavras de cada ladrilho e preenchê-lo com letras
+  aleatórias, em paralelo, direto na matriz em memória compartilhada
+- Posicionar, no processo principal, as palavras que cruzam ladrilhos
+  (reconciliação) e as que não couberam no seu ladrilho
+- Montar o resultado no mesmo formato de game.gerar: (matriz, colocacoes)
+
+Algoritmo:
+1. Cada palavra sorteia uma vaga na matriz inteira (TabelasGeracao); se a
+   vaga cabe em um ladrilho, a palavra vai para ele, senão fica para a
+   reconciliação começando por aquela vaga. Assim a chance de uma palavra
+   cruzar ladrilhos é a mesma da geração sequencial.
+2. Cada processo posiciona as palavras do seu ladrilho (com o mesmo
+   game.posicionar_palavras, em uma matriz do tamanho do ladrilho) e grava
+   o ladrilho preenchido na memória compartilhada
+3. O processo principal posiciona as palavras restantes sobre a matriz
+   compartilhada e converte as linhas em strings
+
+Memória compartilhada:
+- Um byte por célula (latin-1, que cobre as letras acentuadas do banco)
+- Os processos só devolvem as colocações (poucos bytes por palavra): a
+  matriz nunca é serializada entre processos
+- A reconciliação sabe quais células são de palavras pelas colocações
+  devolvidas (um dicionário célula -> letra); o resto é preenchimento e
+  pode ser sobrescrito
+
+Cada ladrilho recebe uma semente própria sorteada pelo processo principal,
+então o resultado não depende da quantidade de processos.
+
+Os processos do pool são iniciados com "spawn" em todas as plataformas: o
+jogo é um processo Qt com threads (pré-carga, watchdog), e um fork copiaria
+travas seguradas por essas threads. As tarefas levam tudo o que o ladrilho
+precisa, então nada depende de estado herdado do processo principal.
+
+Não depende do Qt: é usado por game.gerar_em_ladrilhos (game/game.py).
+
+    python -m game.ladrilhos --tamanho 1000 --processos 1 2 4
+"""
+import argparse
+import atexit
+import multiprocessing
+import os
+import random
+import string
+import sys
+import time
+from multiprocessing import shared_memory
+
+import consts
+from game import game
+
+LADO_LADRILHO = 128   # Lado (em células) de cada ladrilho; o último de cada eixo pode ser menor
+MAX_TENTATIVAS = 100  # Vagas tentadas por palavra na reconciliação (como em posicionar_palavras)
+
+# Preenchimento: bytes aleatórios viram letras por bytes.translate. Só os
+# valores abaixo de 26 * 9 = 234 são usados (o resto é descartado), para
+# que as 26 letras saiam com a mesma chance
+_TABELA_LETRAS = bytes(string.ascii_uppercase.encode()[i % 26] for i in range(256))
+_DESCARTADOS = bytes(range(234, 256))
+
+_CONTEXTO = multiprocessing.get_context("spawn")  # Sem fork em processo com threads (ver cabeçalho)
+
+_pool = None          # Pool de processos reaproveitado entre gerações
+_processos = 0        # Tamanho do _pool
+_tabelas_ladrilho = {}  # TabelasGeracao por formato de ladrilho (por processo)
+
+
+# ============================================================================
+# POOL DE PROCESSOS
+# ============================================================================
+
+def _iniciar_processo():
+    """Prepara um processo do pool: sem log (o log por palavra é do processo principal)."""
+    consts.log_ativo = False
+
+
+def _obter_pool(processos):
+    """
+    Pool com `processos` processos, criado na primeira chamada e reaproveitado.
+
+    Args:
+        processos (int): Quantidade de processos
+
+    Returns:
+        multiprocessing.pool.Pool: Pool pronto para uso
+    """
+    global _pool, _processos
+    if _pool is not None and _processos != processos:
+        encerrar_pool()
+    if _pool is None:
+        _pool = _CONTEXTO.Pool(processos, initializer=_iniciar_processo)
+        _processos = processos
+        consts.log("ladrilhos", f"Pool de geração em ladrilhos iniciado com {processos} processos")
+    return _pool
+
+
+def encerrar_pool():
+    """Encerra o pool de processos, se houver (chamado também ao sair)."""
+    global _pool, _processos
+    if _pool is not None:
+        _pool.terminate()
+        _pool.join()
+        _pool, _processos = None, 0
+
+
+atexit.register(encerrar_pool)
+
+
+# ============================================================================
+# TRABALHO DE CADA LADRILHO (nos processos do pool)
+# ============================================================================
+
+def _tabelas(altura, largura, direcoes):
+    """TabelasGeracao de um ladrilho (as vagas são calculadas por tamanho, sob demanda)."""
+    chave = (altura, largura, direcoes)
+    tabelas = _tabelas_ladrilho.get(chave)
+    if tabelas is None:
+        tabelas = game.TabelasGeracao(altura, largura, direcoes, 1, max(altura, largura), [])
+        _tabelas_ladrilho[chave] = tabelas
+    return tabelas
+
+
+def _letras_aleatorias(n):
+    """
+    Sorteia n letras (A-Z uniforme) de uma vez, sem laço por célula.
+
+    Returns:
+        bytes: n bytes entre b"A" e b"Z"
+    """
+    letras = b""
+    while len(letras) < n:
+        letras += random.randbytes(n + n // 8 + 16).translate(_TABELA_LETRAS, _DESCARTADOS)
+    return letras[:n]
+
+
+def _gerar_ladrilho(tarefa):
+    """
+    Posiciona as palavras de um ladrilho e grava o ladrilho preenchido.
+
+    Args:
+        tarefa (tuple): (nome da memória compartilhada, colunas da matriz,
+                         linha0, coluna0, altura, largura, direções,
+                         palavras [(índice, texto)], semente)
+
+    Returns:
+        tuple: (colocadas, sobras) onde colocadas são (índice, linha,
+               coluna, direção) em coordenadas da matriz inteira e sobras
+               os índices das palavras que não couberam no ladrilho
+    """
+    nome, colunas, linha0, coluna0, altura, largura, direcoes, palavras, semente = tarefa
+    random.seed(semente)
+
+    colocacoes = []
+    if palavras:
+        # A 'dica' leva o índice da palavra: a dica de verdade fica no processo principal
+        game.posicionar_palavras(altura, [{"palavra": texto, "dica": indice} for indice, texto in palavras],
+                                 _tabelas(altura, largura, direcoes))
+        colocacoes = game.posicoes_palavras
+    colocadas = [(c.dica, linha0 + c.linha, coluna0 + c.coluna, (c.dx, c.dy)) for c in colocacoes]
+    achadas = {c[0] for c in colocadas}
+    sobras = [indice for indice, _ in palavras if indice not in achadas]
+
+    shm = shared_memory.SharedMemory(name=nome)
+    try:
+        buf = shm.buf
+        # Preenchimento do ladrilho inteiro, linha a linha na matriz compartilhada...
+        preenchimento = memoryview(_letras_aleatorias(altura * largura))
+        k = linha0 * colunas + coluna0
+        for i in range(0, altura * largura, largura):
+            buf[k:k + largura] = preenchimento[i:i + largura]
+            k += colunas
+        preenchimento.release()
+        # ... e as letras das palavras por cima
+        textos = dict(palavras)
+        for indice, linha, coluna, (dx, dy) in colocadas:
+            k, passo = linha * colunas + coluna, dx * colunas + dy
+            for letra in textos[indice].encode("latin-1"):
+                buf[k] = letra
+                k += passo
+        del buf
+    finally:
+        shm.close()
+    return colocadas, sobras
+
+
+# ============================================================================
+# GERAÇÃO (processo principal)
+# ============================================================================
+
+def _cabe_em_latin1(texto):
+    """True se o texto pode ser gravado na matriz compartilhada (um byte por letra)."""
+    try:
+        texto.encode("latin-1")
+        return True
+    except UnicodeEncodeError:
+        return False
+
+
+def _ocupar(ocupadas, colunas, palavra, vaga):
+    """Registra em ocupadas (célula -> letra) as células de uma palavra posicionada."""
+    linha, coluna, (dx, dy) = vaga
+    k, passo = linha * colunas + coluna, dx * colunas + dy
+    for letra in palavra.encode("latin-1"):
+        ocupadas[k] = letra
+        k += passo
+
+
+def _reconciliar(buf, colunas, tabelas, ocupadas, palavra, vaga):
+    """
+    Posiciona uma palavra sobre a matriz compartilhada já preenchida.
+
+    Uma célula aceita a letra se é preenchimento (fora de ocupadas) ou se
+    já tem a mesma letra (cruzamento).
+
+    Args:
+        buf (memoryview): Matriz compartilhada
+        colunas (int): Colunas da matriz
+        tabelas (TabelasGeracao): Tabelas da matriz inteira
+        ocupadas (dict): Célula (linha * colunas + coluna) -> letra de palavra;
+                         atualizado com a palavra posicionada
+        palavra (str): Texto da palavra
+        vaga (tuple | None): Primeira vaga a tentar (linha, coluna, direção)
+
+    Returns:
+        tuple | None: (linha, coluna, direção) usada, ou None se não coube
+    """
+    letras = palavra.encode("latin-1")
+    for _ in range(MAX_TENTATIVAS):
+        if vaga is None:
+            vaga = tabelas.sortear_vaga(len(letras))
+            if vaga is None:
+                return None
+        linha, coluna, (dx, dy) = vaga
+        k0 = linha * colunas + coluna
+        passo = dx * colunas + dy
+        k = k0
+        for letra in letras:
+            if ocupadas.get(k, letra) != letra:
+                break
+            k += passo
+        else:
+            k = k0
+            for letra in letras:
+                buf[k] = ocupadas[k] = letra
+                k += passo
+            return vaga
+        vaga = None
+    return None
+
+
+def gerar(linhas, colunas=None, quantidade=consts.QUANTIDADE_PALAVRAS, direcoes=game.DIRECOES,
+          tamanho_min=1, tamanho_max=None, processos=None):
+    """
+    Gera um tabuleiro dividindo a matriz em ladrilhos processados em paralelo.
+
+    Args:
+        linhas (int): Linhas da matriz
+        colunas (int, optional): Colunas da matriz (padrão: igual a linhas)
+        quantidade (int): Número de palavras sorteadas
+        direcoes (tuple): Vetores (dx, dy) permitidos
+        tamanho_min (int): Menor palavra aceita
+        tamanho_max (int, optional): Maior palavra aceita (padrão: sem limite)
+        processos (int, optional): Processos do pool (padrão: os.cpu_count());
+                                   1 processa os ladrilhos no próprio processo
+
+    Returns:
+        tuple: (matriz, colocacoes, selecionadas) onde matriz é a tupla de
+               strings (uma por linha), colocacoes a lista de Colocacao
+               (na ordem das palavras sorteadas) e selecionadas as palavras
+               sorteadas, como em game.gerar
+    """
+    colunas = linhas if colunas is None else colunas
+    processos = processos or os.cpu_count() or 1
+    direcoes = tuple(direcoes)
+    tabelas = game.tabelas_geracao(linhas, colunas, direcoes, tamanho_min, tamanho_max)
+    banco = [p for p in tabelas.palavras if _cabe_em_latin1(p["palavra"])]
+    selecionadas = game.selecionar_palavras_aleatorias(banco, quantidade)
+
+    # ETAPA 1: cada palavra vai para o ladrilho da vaga sorteada, ou para a fronteira
+    ladrilhos_linha = -(-linhas // LADO_LADRILHO)
+    ladrilhos_coluna = -(-colunas // LADO_LADRILHO)
+    por_ladrilho = [[] for _ in range(ladrilhos_linha * ladrilhos_coluna)]
+    fronteira = []  # (índice, vaga inicial)
+    for indice, palavra_obj in enumerate(selecionadas):
+        extensao = len(palavra_obj["palavra"]) - 1
+        vaga = tabelas.sortear_vaga(extensao + 1)
+        if vaga is None:
+            continue
+        linha, coluna, (dx, dy) = vaga
+        ladrilho = (linha // LADO_LADRILHO, coluna // LADO_LADRILHO)
+        if ladrilho == ((linha + dx * extensao) // LADO_LADRILHO, (coluna + dy * extensao) // LADO_LADRILHO):
+            por_ladrilho[ladrilho[0] * ladrilhos_coluna + ladrilho[1]].append((indice, palavra_obj["palavra"]))
+        else:
+            fronteira.append((indice, vaga))
+
+    shm = shared_memory.SharedMemory(create=True, size=linhas * colunas)
+    try:
+        # ETAPA 2: ladrilhos em paralelo (um por tarefa; todos são preenchidos)
+        tarefas = []
+        for t, palavras in enumerate(por_ladrilho):
+            linha0 = (t // ladrilhos_coluna) * LADO_LADRILHO
+            coluna0 = (t % ladrilhos_coluna) * LADO_LADRILHO
+            tarefas.append((shm.name, colunas, linha0, coluna0,
+                            min(LADO_LADRILHO, linhas - linha0), min(LADO_LADRILHO, colunas - coluna0),
+                            direcoes, palavras, random.getrandbits(64)))
+        if processos > 1:
+            resultados = _obter_pool(processos).map(_gerar_ladrilho, tarefas, chunksize=1)
+        else:
+            estado = random.getstate()  # As tarefas semeiam o random global
+            resultados = [_gerar_ladrilho(tarefa) for tarefa in tarefas]
+            random.setstate(estado)
+
+        vagas = [None] * len(selecionadas)
+        for colocadas, sobras in resultados:
+            for indice, linha, coluna, direcao in colocadas:
+                vagas[indice] = (linha, coluna, direcao)
+            fronteira.extend((indice, None) for indice in sobras)
+
+        # ETAPA 3: reconciliação das palavras de fronteira e das sobras
+        ocupadas = {}
+        for indice, vaga in enumerate(vagas):
+            if vaga is not None:
+                _ocupar(ocupadas, colunas, selecionadas[indice]["palavra"], vaga)
+        buf = shm.buf
+        for indice, vaga in fronteira:
+            vagas[indice] = _reconciliar(buf, colunas, tabelas, ocupadas, selecionadas[indice]["palavra"], vaga)
+        texto = bytes(buf).decode("latin-1")
+        del buf
+    finally:
+        shm.close()
+        shm.unlink()
+
+    matriz = tuple(texto[k:k + colunas] for k in range(0, linhas * colunas, colunas))
+    colocacoes = []
+    for palavra_obj, vaga in zip(selecionadas, vagas):
+        if vaga is None:
+            consts.log("ladrilhos", f"Não foi possível colocar a palavra '{palavra_obj['palavra']}'")
+            continue
+        colocacoes.append(game.Colocacao(palavra_obj["palavra"], palavra_obj["dica"], *vaga))
+    consts.log("ladrilhos", f"{len(tarefas)} ladrilhos, {len(fronteira)} palavras na reconciliação, "
+                            f"{len(colocacoes)}/{len(selecionadas)} colocadas")
+    return matriz, colocacoes, selecionadas
+
+
+# ============================================================================
+# MEDIÇÃO DE VAZÃO
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Mede a geração em ladrilhos por quantidade de processos")
+    parser.add_argument("--tamanho", type=int, default=1000, help="lado da matriz (padrão: 1000)")
+    parser.add_argument("--palavras", type=int, default=consts.QUANTIDADE_PALAVRAS,
+                        help=f"palavras por tabuleiro (padrão: {consts.QUANTIDADE_PALAVRAS})")
+    parser.add_argument("--processos", type=int, nargs="+", default=[1, os.cpu_count() or 1],
+                        help="quantidades de processos a comparar (padrão: 1 e todos os núcleos)")
+    parser.add_argument("--repeticoes", type=int, default=5, help="tabuleiros por medição (padrão: 5)")
+    args = parser.parse_args()
+
+    consts.log_ativo = False
+    celulas = args.tamanho * args.tamanho
+    game.tabelas_geracao(args.tamanho)  # Fora da medição: montada uma vez por formato
+
+    inicio = time.perf_counter()
+    for _ in range(args.repeticoes):
+        game.gerar(args.tamanho, quantidade=args.palavras)
+    sequencial = (time.perf_counter() - inicio) / args.repeticoes
+    print(f"{args.tamanho}x{args.tamanho}, {args.palavras} palavras, {os.cpu_count()} núcleos")
+    print(f"  game.gerar (sequencial): {sequencial * 1000:8.1f} ms  {celulas / sequencial / 1e6:6.2f} M células/s")
+
+    base = None
+    for processos in args.processos:
+        gerar(args.tamanho, quantidade=args.palavras, processos=processos)  # Aquece o pool
+        inicio = time.perf_counter()
+        for _ in range(args.repeticoes):
+            gerar(args.tamanho, quantidade=args.palavras, processos=processos)
+        duracao = (time.perf_counter() - inicio) / args.repeticoes
+        base = base or duracao
+        print(f"  ladrilhos, {processos:2d} processos: {duracao * 1000:8.1f} ms  "
+              f"{celulas / duracao / 1e6:6.2f} M células/s  (x{base / duracao:.2f})")
+    encerrar_pool()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,490 @@
+"""
+GAME/LEXICO.PY - Dicionário Compacto (DAWG) do Modo Descoberta Livre
+====================================================================
+Este módulo implementa o léxico usado no modo de descoberta livre, em que
+qualquer palavra válida do dicionário traçada na grade conta ponto (não
+só as palavras posicionadas).
+Responsável por:
+- Compilar uma lista de palavras (100 mil a 1 milhão) em um DAWG mínimo
+  (grafo acíclico de palavras: trie com os sufixos iguais compartilhados)
+- Gravar o DAWG em um arquivo binário plano e abri-lo via mmap, sem
+  decodificar nada na carga (milissegundos, qualquer que seja o tamanho)
+- Responder se uma palavra existe (microssegundos: um passo por letra)
+- Enumerar todas as palavras que podem ser achadas em um tabuleiro
+  (cada célula x 8 direções), para pontuação e para o contador da tela
+
+Normalização: maiúsculas sem acento (NFD sem as marcas combinantes), só
+A-Z; "VIRTUALIZAÇÃO" vira "VIRTUALIZACAO". As letras da grade passam pela
+mesma normalização, então Ç na grade casa com C no dicionário.
+
+Formato do arquivo (inteiros em big-endian):
+- Cabeçalho: b"LXC1", deslocamento da raiz (u32), nós (u32), palavras (u32)
+- Nó: 1 byte (quantidade de filhos | 0x80 se uma palavra termina ali),
+  as letras dos filhos (1 byte cada, em ordem) e o deslocamento de cada
+  filho (u32, na mesma ordem)
+
+Uso:
+    python -m game.lexico compilar lista.txt lexico.idx
+    python -m game.lexico consultar lexico.idx PALAVRA [PALAVRA...]
+
+Não depende do Qt: é usado pela SessaoJogo (game/sessao.py) e pelo main.py
+(--dicionario).
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import time
+import unicodedata
+
+MAGICO = b"LXC1"
+CABECALHO = struct.Struct(">4sIII")  # Mágico, raiz, nós, palavras
+DESLOCAMENTO = struct.Struct(">I")
+TERMINAL = 0x80
+MINIMO_LETRAS = 3  # Palavras mais curtas não contam como descoberta
+
+# Sequências de um byte por valor (mmap.find só aceita bytes)
+_BYTES = tuple(bytes((b,)) for b in range(256))
+
+# As 8 direções das palavras na grade (mesma convenção de game/game.py)
+_DIRECOES = ((0, 1), (1, 0), (1, 1), (1, -1), (0, -1), (-1, 0), (-1, -1), (-1, 1))
+
+
+# ============================================================================
+# NORMALIZAÇÃO
+# ============================================================================
+
+def normalizar(texto):
+    """
+    Normaliza uma palavra para a forma guardada no léxico.
+
+    Args:
+        texto (str): Palavra (qualquer caixa, com ou sem acentos)
+
+    Returns:
+        str | None: Só letras A-Z maiúsculas, ou None se sobrar outro caractere
+    """
+    decomposto = unicodedata.normalize("NFD", texto.strip().upper())
+    palavra = "".join(c for c in decomposto if not unicodedata.combining(c))
+    if not palavra or not palavra.isascii() or not palavra.isalpha():
+        return None
+    return palavra
+
+
+def normalizar_grade(matriz):
+    """
+    Normaliza as letras de uma matriz, célula a célula (uma letra por célula).
+
+    Células cuja letra não vira exatamente uma letra A-Z viram "?", que não
+    existe no léxico e interrompe a busca ali.
+
+    Args:
+        matriz (sequence): Linhas da matriz (strings ou listas de letras)
+
+    Returns:
+        list: Uma linha de bytes (ASCII) por linha da matriz
+    """
+    tabela = {}
+    linhas = []
+    for linha in matriz:
+        codigos = bytearray()
+        for letra in linha:
+            codigo = tabela.get(letra)
+            if codigo is None:
+                forma = normalizar(letra)
+                codigo = tabela[letra] = ord(forma) if forma and len(forma) == 1 else ord("?")
+            codigos.append(codigo)
+        linhas.append(bytes(codigos))
+    return linhas
+
+
+# ============================================================================
+# COMPILAÇÃO (LISTA ORDENADA -> DAWG MÍNIMO)
+# ============================================================================
+
+class _No:
+    """Nó do DAWG em construção (só existe durante a compilação)."""
+
+    __slots__ = ("terminal", "filhos")
+
+    def __init__(self):
+        self.terminal = False
+        self.filhos = {}  # {letra (int): _No}, inseridos em ordem
+
+
+def _registrar(no, registro):
+    """
+    Troca os filhos de 'no' pelos equivalentes já registrados e registra 'no'.
+
+    Dois nós são equivalentes quando têm o mesmo estado terminal e as mesmas
+    letras levando aos mesmos filhos (já registrados, então por identidade).
+
+    Returns:
+        _No: O nó equivalente do registro (o próprio 'no' se for novo)
+    """
+    chave = (no.terminal, tuple((letra, id(filho)) for letra, filho in no.filhos.items()))
+    existente = registro.get(chave)
+    if existente is not None:
+        return existente
+    registro[chave] = no
+    return no
+
+
+def _minimizar(no, ate, registro):
+    """Registra o ramo mais recente de 'no' a partir da profundidade 'ate' (Daciuk)."""
+    caminho = [no]
+    while caminho[-1].filhos:
+        caminho.append(next(reversed(caminho[-1].filhos.values())))
+    for profundidade in range(len(caminho) - 1, ate, -1):
+        pai = caminho[profundidade - 1]
+        letra = next(reversed(pai.filhos))
+        pai.filhos[letra] = _registrar(caminho[profundidade], registro)
+
+
+def compilar(palavras):
+    """
+    Compila palavras em um DAWG mínimo no formato binário deste módulo.
+
+    Construção incremental de Daciuk et al. (entrada ordenada): cada palavra
+    nova só toca o ramo da anterior a partir do prefixo comum, e esse ramo é
+    minimizado (sufixos iguais viram um nó só) antes de ser abandonado.
+
+    Args:
+        palavras (iterable): Palavras em qualquer ordem e forma; são
+                             normalizadas, e as inválidas e repetidas ignoradas
+
+    Returns:
+        bytes: Conteúdo do arquivo do léxico
+    """
+    chaves = sorted({p for p in map(normalizar, palavras) if p})
+    raiz = _No()
+    registro = {}
+    anterior = b""
+    for palavra in chaves:
+        chave = palavra.encode("ascii")
+        comum = 0
+        limite = min(len(chave), len(anterior))
+        while comum < limite and chave[comum] == anterior[comum]:
+            comum += 1
+        _minimizar(raiz, comum, registro)
+        no = raiz
+        for letra in chave[:comum]:
+            no = no.filhos[letra]
+        for letra in chave[comum:]:
+            novo = _No()
+            no.filhos[letra] = novo
+            no = novo
+        no.terminal = True
+        anterior = chave
+    _minimizar(raiz, 0, registro)
+    return _serializar(raiz, len(chaves))
+
+
+def _serializar(raiz, palavras):
+    """Grava os nós (em largura, a raiz primeiro) com deslocamentos absolutos."""
+    ordem, deslocamentos = [], {}
+    pendentes = [raiz]
+    posicao = CABECALHO.size
+    while pendentes:
+        proximos = []
+        for no in pendentes:
+            if id(no) in deslocamentos:
+                continue
+            deslocamentos[id(no)] = posicao
+            posicao += 1 + 5 * len(no.filhos)
+            ordem.append(no)
+            proximos.extend(no.filhos.values())
+        pendentes = proximos
+
+    saida = bytearray(CABECALHO.pack(MAGICO, deslocamentos[id(raiz)], len(ordem), palavras))
+    for no in ordem:
+        letras = sorted(no.filhos)
+        saida.append(len(letras) | (TERMINAL if no.terminal else 0))
+        saida += bytes(letras)
+        for letra in letras:
+            saida += DESLOCAMENTO.pack(deslocamentos[id(no.filhos[letra])])
+    return bytes(saida)
+
+
+def compilar_arquivo(origem, destino):
+    """
+    Compila uma lista de palavras (uma por linha, UTF-8) em um arquivo de léxico.
+
+    A gravação é atômica (arquivo temporário + os.replace): jogos abertos
+    com o léxico antigo mapeado continuam funcionando.
+
+    Args:
+        origem (str): Arquivo texto com as palavras
+        destino (str): Arquivo do léxico a gravar
+
+    Returns:
+        int: Palavras no léxico
+    """
+    with open(origem, "r", encoding="utf-8", errors="replace") as f:
+        dados = compilar(f)
+    temporario = destino + ".tmp"
+    with open(temporario, "wb") as f:
+        f.write(dados)
+    os.replace(temporario, destino)
+    return CABECALHO.unpack_from(dados)[3]
+
+
+# ============================================================================
+# CONSULTA
+# ============================================================================
+
+class Lexico:
+    """
+    Léxico somente leitura sobre o conteúdo binário de compilar().
+
+    O conteúdo pode vir de um arquivo mapeado (abrir) ou da memória
+    (do_banco, de_palavras); as consultas leem os nós direto dos bytes.
+    """
+
+    __slots__ = ("origem", "palavras", "nos", "_dados", "_raiz", "_mapa")
+
+    def __init__(self, dados, origem="memória", mapa=None):
+        """
+        Args:
+            dados (bytes | mmap.mmap): Conteúdo no formato de compilar()
+            origem (str): Descrição da origem (log e __repr__)
+            mapa (mmap.mmap, optional): Mapeamento a fechar em fechar()
+
+        Raises:
+            ValueError: Se o conteúdo não for um léxico válido
+        """
+        if len(dados) < CABECALHO.size:
+            raise ValueError(f"léxico inválido: {origem}")
+        magico, raiz, nos, palavras = CABECALHO.unpack_from(dados)
+        if magico != MAGICO or raiz >= len(dados):
+            raise ValueError(f"léxico inválido: {origem}")
+        self.origem = origem
+        self.palavras = palavras
+        self.nos = nos
+        self._dados = dados
+        self._raiz = raiz
+        self._mapa = mapa
+
+    @classmethod
+    def abrir(cls, caminho):
+        """
+        Abre um arquivo de léxico via mmap (só o cabeçalho é lido na hora).
+
+        Args:
+            caminho (str): Arquivo gravado por compilar_arquivo()
+
+        Returns:
+            Lexico: Léxico mapeado
+
+        Raises:
+            OSError: Se o arquivo não puder ser lido
+            ValueError: Se o arquivo não for um léxico
+        """
+        with open(caminho, "rb") as f:
+            mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(mapa, caminho, mapa)
+        except ValueError:
+            mapa.close()
+            raise
+
+    @classmethod
+    def de_palavras(cls, palavras, origem="memória"):
+        """
+        Compila palavras em memória (listas pequenas, ex.: o banco do jogo).
+
+        Args:
+            palavras (iterable): Palavras em qualquer forma
+            origem (str): Descrição da origem
+
+        Returns:
+            Lexico: Léxico em memória
+        """
+        return cls(compilar(palavras), origem)
+
+    @classmethod
+    def do_banco(cls):
+        """
+        Léxico com as palavras do banco do jogo (data/palavras.json).
+
+        Usado quando o modo descoberta é ligado sem um dicionário próprio.
+
+        Returns:
+            Lexico: Léxico em memória
+        """
+        from game import game
+        return cls.de_palavras((p["palavra"] for p in game.carregar_palavras()), "banco de palavras")
+
+    def fechar(self):
+        """Desfaz o mapeamento do arquivo (o léxico não pode mais ser usado)."""
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+
+    def contem(self, palavra):
+        """
+        Informa se a palavra está no léxico.
+
+        Args:
+            palavra (str): Palavra em qualquer forma (é normalizada)
+
+        Returns:
+            bool: True se a palavra normalizada está no léxico
+        """
+        chave = normalizar(palavra)
+        return chave is not None and self._contem_codigos(chave.encode("ascii"))
+
+    def _contem_codigos(self, codigos):
+        """contem() para uma palavra já normalizada (bytes ASCII)."""
+        dados, find, ler = self._dados, self._dados.find, DESLOCAMENTO.unpack_from
+        no = self._raiz
+        for letra in codigos:
+            # Filhos do nó: n letras em ordem e, depois, n deslocamentos
+            n = dados[no] & 0x7F
+            k = find(_BYTES[letra], no + 1, no + 1 + n)
+            if k < 0:
+                return False
+            no = ler(dados, no + 1 + n + 4 * (k - no - 1))[0]
+        return bool(dados[no] & TERMINAL)
+
+    def palavra_na_reta(self, linhas, inicio, fim, minimo=MINIMO_LETRAS):
+        """
+        Palavra do léxico formada pelas letras de uma reta, lida nos dois sentidos.
+
+        Args:
+            linhas (list): Grade normalizada (normalizar_grade)
+            inicio (tuple): (linha, coluna) da primeira célula
+            fim (tuple): (linha, coluna) da última célula (mesma linha, coluna
+                         ou diagonal de 'inicio')
+            minimo (int): Menor tamanho de palavra aceito
+
+        Returns:
+            str | None: A palavra (no sentido da seleção, se os dois valerem),
+                        ou None se nenhum sentido forma palavra
+        """
+        (i0, j0), (i1, j1) = inicio, fim
+        n = max(abs(i1 - i0), abs(j1 - j0)) + 1
+        if n < minimo:
+            return None
+        di, dj = (i1 > i0) - (i1 < i0), (j1 > j0) - (j1 < j0)
+        codigos = bytes(linhas[i0 + k * di][j0 + k * dj] for k in range(n))
+        for candidata in (codigos, codigos[::-1]):
+            if self._contem_codigos(candidata):
+                return candidata.decode("ascii")
+        return None
+
+    def palavras_no_tabuleiro(self, matriz, minimo=MINIMO_LETRAS):
+        """
+        Enumera todas as palavras do léxico que podem ser traçadas na matriz.
+
+        Parte de cada célula nas 8 direções e desce no DAWG enquanto as
+        letras da reta existirem como prefixo; a busca em cada reta para no
+        primeiro prefixo inexistente, então o custo acompanha as palavras
+        possíveis, não o comprimento das retas. Os filhos de cada nó visitado
+        são decodificados uma vez por chamada.
+
+        Args:
+            matriz (sequence): Linhas da matriz (letras como na partida)
+            minimo (int): Menor tamanho de palavra
+
+        Returns:
+            dict: {(início, fim): palavra} para cada ocorrência; a mesma
+                  palavra pode aparecer em mais de um lugar
+        """
+        linhas = normalizar_grade(matriz)
+        total_linhas = len(linhas)
+        total_colunas = len(linhas[0]) if linhas else 0
+        dados = self._dados
+        decodificados = {}
+
+        def filhos(no):
+            tabela = decodificados.get(no)
+            if tabela is None:
+                n = dados[no] & 0x7F
+                letras = dados[no + 1:no + 1 + n]
+                base = no + 1 + n
+                tabela = decodificados[no] = {
+                    letra: DESLOCAMENTO.unpack_from(dados, base + 4 * k)[0]
+                    for k, letra in enumerate(letras)
+                }
+            return tabela
+
+        achadas = {}
+        raiz = filhos(self._raiz)
+        for i, linha in enumerate(linhas):
+            for j, letra in enumerate(linha):
+                primeiro = raiz.get(letra)
+                if primeiro is None:
+                    continue
+                for di, dj in _DIRECOES:
+                    no, a, b, tamanho = primeiro, i, j, 1
+                    while True:
+                        if tamanho >= minimo and dados[no] & TERMINAL:
+                            achadas[((i, j), (a, b))] = None
+                        a += di
+                        b += dj
+                        if not (0 <= a < total_linhas and 0 <= b < total_colunas):
+                            break
+                        no = filhos(no).get(linhas[a][b])
+                        if no is None:
+                            break
+                        tamanho += 1
+        for (inicio, fim) in achadas:
+            (i0, j0), (i1, j1) = inicio, fim
+            n = max(abs(i1 - i0), abs(j1 - j0)) + 1
+            di, dj = (i1 > i0) - (i1 < i0), (j1 > j0) - (j1 < j0)
+            achadas[(inicio, fim)] = bytes(
+                linhas[i0 + k * di][j0 + k * dj] for k in range(n)
+            ).decode("ascii")
+        return achadas
+
+    def __len__(self):
+        return self.palavras
+
+    def __contains__(self, palavra):
+        return self.contem(palavra)
+
+    def __repr__(self):
+        return f"Lexico({self.origem!r}, {self.palavras} palavras, {self.nos} nós)"
+
+
+# ============================================================================
+# LINHA DE COMANDO
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m game.lexico",
+                                     description="Compila e consulta o léxico do modo descoberta livre.")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+    compilar_cmd = comandos.add_parser("compilar", help="compila uma lista de palavras (uma por linha)")
+    compilar_cmd.add_argument("lista", help="arquivo texto UTF-8 com as palavras")
+    compilar_cmd.add_argument("saida", help="arquivo do léxico a gravar")
+    consultar_cmd = comandos.add_parser("consultar", help="consulta palavras em um léxico compilado")
+    consultar_cmd.add_argument("lexico", help="arquivo do léxico")
+    consultar_cmd.add_argument("palavras", nargs="+")
+    opcoes = parser.parse_args(argv)
+
+    if opcoes.comando == "compilar":
+        inicio = time.perf_counter()
+        palavras = compilar_arquivo(opcoes.lista, opcoes.saida)
+        segundos = time.perf_counter() - inicio
+        tamanho = os.path.getsize(opcoes.saida)
+        print(f"{palavras} palavras em {tamanho / 1024:.0f} KB ({tamanho / max(1, palavras):.1f} "
+              f"bytes/palavra), compilado em {segundos:.1f} s")
+        return 0
+
+    inicio = time.perf_counter()
+    lexico = Lexico.abrir(opcoes.lexico)
+    print(f"{lexico} aberto em {(time.perf_counter() - inicio) * 1000:.2f} ms")
+    for palavra in opcoes.palavras:
+        inicio = time.perf_counter()
+        achou = lexico.contem(palavra)
+        print(f"{palavra}: {'sim' if achou else 'não'} ({(time.perf_counter() - inicio) * 1e6:.1f} µs)")
+    lexico.fechar()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+"""
+GAME/MASCARAS.PY - Máscaras de Formato do Tabuleiro
+===================================================
+Este módulo define quais células de um tabuleiro existem (ativas) quando o
+tabuleiro não é um retângulo cheio: círculos, corações, letras, molduras
+com furos...
+Responsável por:
+- Montar máscaras geométricas (circulo, anel, coracao) em qualquer tamanho
+- Ler máscaras desenhadas de data/mascaras.json ("#" = ativa, "." = furo)
+  e escalá-las ao tamanho do perfil
+- Calcular, por direção, quantas células ativas seguidas começam em cada
+  célula: as vagas de uma palavra de N letras são as células com N ou mais,
+  sem sorteio e rejeição de inícios que caem em furos
+
+Na matriz gerada, as células inativas são INATIVA (espaço): a pontuação
+(game/pontuacao.py) já trata espaço como separador, o léxico (game/lexico.py)
+não casa nada com ele e a TelaJogo não as desenha nem deixa selecioná-las.
+
+Não depende do Qt: é usado por game.tabelas_geracao (game/game.py) e pelos
+perfis (dificult/dificult.py).
+"""
+
+import json
+import threading
+from array import array
+
+from consts import PATH_MASCARAS_JSON, log
+
+INATIVA = " "  # Letra das células fora da máscara na matriz gerada
+ATIVA = "#"    # Célula ativa nos desenhos de data/mascaras.json
+
+_desenhos = None               # Cache de data/mascaras.json {nome: linhas do desenho}
+_lock_desenhos = threading.Lock()
+
+
+class Mascara:
+    """
+    Células ativas de um tabuleiro linhas x colunas.
+    """
+
+    __slots__ = ("nome", "linhas", "colunas", "desenho", "ativas")
+
+    def __init__(self, nome, desenho):
+        """
+        Args:
+            nome (str): Nome da máscara (log, cache de tabelas)
+            desenho (sequence): Uma string por linha, todas do mesmo tamanho;
+                                ATIVA marca as células ativas
+
+        Raises:
+            ValueError: Se o desenho for vazio, irregular ou sem células ativas
+        """
+        self.nome = nome
+        self.desenho = tuple(desenho)
+        self.linhas = len(self.desenho)
+        self.colunas = len(self.desenho[0]) if self.desenho else 0
+        if not self.colunas or any(len(linha) != self.colunas for linha in self.desenho):
+            raise ValueError(f"máscara {nome!r}: linhas vazias ou de tamanhos diferentes")
+        self.ativas = sum(linha.count(ATIVA) for linha in self.desenho)
+        if not self.ativas:
+            raise ValueError(f"máscara {nome!r} sem células ativas")
+
+    def ativa(self, i, j):
+        """
+        Returns:
+            bool: True se a célula (i, j) faz parte do tabuleiro
+        """
+        return self.desenho[i][j] == ATIVA
+
+    def modelo(self):
+        """
+        Linhas iniciais da matriz de geração (ver game.posicionar_palavras).
+
+        Returns:
+            tuple: Por linha, uma tupla com '' nas células ativas (vazias) e
+                   INATIVA nas demais, que barra qualquer palavra nelas
+        """
+        return tuple(
+            tuple('' if c == ATIVA else INATIVA for c in linha) for linha in self.desenho
+        )
+
+    def sequencias(self, direcao):
+        """
+        Células ativas seguidas a partir de cada célula, em uma direção.
+
+        Args:
+            direcao (tuple): Vetor (dx, dy) por letra
+
+        Returns:
+            array: Por célula (índice i * colunas + j), quantas células ativas
+                   há da própria célula em diante na direção (0 se inativa)
+        """
+        dx, dy = direcao
+        linhas, colunas = self.linhas, self.colunas
+        seq = array("H", bytes(2 * linhas * colunas))
+        # A célula seguinte (i + dx, j + dy) é calculada antes da atual
+        ordem_linhas = range(linhas - 1, -1, -1) if dx > 0 else range(linhas)
+        ordem_colunas = range(colunas - 1, -1, -1) if dy > 0 else range(colunas)
+        for i in ordem_linhas:
+            desenho = self.desenho[i]
+            base = i * colunas
+            proxima_linha = i + dx
+            dentro = 0 <= proxima_linha < linhas
+            for j in ordem_colunas:
+                if desenho[j] != ATIVA:
+                    continue
+                b = j + dy
+                if dentro and 0 <= b < colunas:
+                    seq[base + j] = seq[proxima_linha * colunas + b] + 1
+                else:
+                    seq[base + j] = 1
+        return seq
+
+    def __repr__(self):
+        return f"Mascara({self.nome!r}, {self.linhas}x{self.colunas}, {self.ativas} ativas)"
+
+
+# ============================================================================
+# MÁSCARAS GEOMÉTRICAS
+# ============================================================================
+
+def _desenhar(nome, linhas, colunas, dentro):
+    """Máscara com as células cujo centro (x, y em -1..1) satisfaz dentro(x, y)."""
+    desenho = []
+    for i in range(linhas):
+        y = (i + 0.5) / linhas * 2 - 1
+        desenho.append("".join(
+            ATIVA if dentro((j + 0.5) / colunas * 2 - 1, y) else "." for j in range(colunas)
+        ))
+    return Mascara(nome, desenho)
+
+
+def circulo(linhas, colunas):
+    """Círculo (elipse, se retangular) inscrito no tabuleiro."""
+    return _desenhar("circulo", linhas, colunas, lambda x, y: x * x + y * y <= 1.0)
+
+
+def anel(linhas, colunas):
+    """Círculo com um furo no meio (metade do raio)."""
+    return _desenhar("anel", linhas, colunas, lambda x, y: 0.25 <= x * x + y * y <= 1.0)
+
+
+def coracao(linhas, colunas):
+    """Coração (curva (x² + y² - 1)³ - x²y³ <= 0), com a ponta para baixo."""
+    def dentro(x, y):
+        x, y = x * 1.25, -y * 1.25 + 0.2  # Encaixa a curva (~2.3 de altura) no tabuleiro
+        return (x * x + y * y - 1) ** 3 - x * x * y ** 3 <= 0
+    return _desenhar("coracao", linhas, colunas, dentro)
+
+
+GEOMETRICAS = {"circulo": circulo, "anel": anel, "coracao": coracao}
+
+
+# ============================================================================
+# MÁSCARAS DESENHADAS (data/mascaras.json)
+# ============================================================================
+
+def _carregar_desenhos():
+    """Lê data/mascaras.json na primeira chamada ({nome: linhas do desenho})."""
+    global _desenhos
+    with _lock_desenhos:
+        if _desenhos is None:
+            try:
+                with open(PATH_MASCARAS_JSON, "r", encoding="utf-8") as f:
+                    _desenhos = {
+                        str(nome): [str(linha) for linha in desenho]
+                        for nome, desenho in json.load(f).get("mascaras", {}).items()
+                    }
+            except (OSError, ValueError, AttributeError, TypeError) as e:
+                log("mascaras", f"Sem máscaras desenhadas: {e}")
+                _desenhos = {}
+        return _desenhos
+
+
+def _escalar(nome, desenho, linhas, colunas):
+    """Amplia/reduz um desenho para linhas x colunas (vizinho mais próximo)."""
+    altura, largura = len(desenho), max(len(linha) for linha in desenho)
+    desenho = [linha.ljust(largura, ".") for linha in desenho]
+    return Mascara(nome, [
+        "".join(desenho[i * altura // linhas][j * largura // colunas] for j in range(colunas))
+        for i in range(linhas)
+    ])
+
+
+def nomes():
+    """
+    Returns:
+        list: Nomes das máscaras disponíveis (geométricas e desenhadas)
+    """
+    return sorted(set(GEOMETRICAS) | set(_carregar_desenhos()))
+
+
+def mascara(nome, linhas, colunas):
+    """
+    Máscara de um nome no tamanho pedido.
+
+    Args:
+        nome (str): Máscara geométrica (GEOMETRICAS) ou de data/mascaras.json
+        linhas (int): Linhas do tabuleiro
+        colunas (int): Colunas do tabuleiro
+
+    Returns:
+        Mascara: Máscara nova (game.tabelas_geracao guarda a de cada formato)
+
+    Raises:
+        ValueError: Se o nome não existir ou o resultado não tiver células ativas
+    """
+    if nome in GEOMETRICAS:
+        return GEOMETRICAS[nome](linhas, colunas)
+    desenho = _carregar_desenhos().get(nome)
+    if not desenho:
+        raise ValueError(f"máscara desconhecida: {nome!r} (disponíveis: {', '.join(nomes())})")
+    return _escalar(nome, desenho, linhas, colunas)
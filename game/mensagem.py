@@ -0,0 +1,298 @@
+"""
+GAME/MENSAGEM.PY - Modo Mensagem Secreta
+========================================
+Este módulo gera o caça-palavras clássico de "mensagem escondida": as
+células que não pertencem a nenhuma palavra, lidas em ordem (linha a linha,
+da esquerda para a direita), formam uma frase secreta.
+Responsável por:
+- Normalizar a frase (só as letras, em maiúsculas)
+- Cobrir a grade com palavras do banco deixando livres exatamente tantas
+  células quanto letras da frase (busca com retrocesso e propagação de
+  restrições)
+
+Busca (cobrir):
+- As células são decididas em ordem de leitura: a primeira célula ainda
+  vazia vira a ponta de uma palavra em uma das 4 retas que seguem adiante
+  (→, ↓, ↘, ↙; a palavra lida ao contrário usa a direção oposta), ou fica
+  livre. Assim as células antes dela já estão decididas e as seguintes só
+  podem estar vazias ou ter letras de palavras que as cruzam
+- Uma palavra cabe se a reta não passa por furo da máscara e as letras já
+  escritas nela são as da palavra (cruzamento)
+- Propagação: célula sem nenhuma palavra possível é forçosamente livre;
+  o ramo é cortado quando as letras das palavras ainda não usadas não
+  cobrem as células que precisam ser cobertas, ou quando sobram menos
+  células vazias do que letras da frase a esconder; quando sobram
+  exatamente tantas, todas ficam livres sem mais busca
+- Por célula, tenta as RAMOS palavras (de uma amostra do banco, varrida
+  das maiores para as menores até nenhuma poder superar as já achadas) que
+  cobrem mais células novas e a célula livre (antes delas com a chance livres /
+  vazias, para a frase se espalhar pela grade); uma tentativa que passa de
+  NOS_POR_TENTATIVA nós recomeça com outro sorteio
+
+Não depende do Qt: é usado por game.gerar_com_mensagem (game/game.py), que
+escreve a frase nas células livres (game.completar_com_mensagem).
+"""
+
+import random
+import time
+from bisect import bisect_left
+from operator import itemgetter
+
+LIVRE = "\0"     # Célula decidida como livre durante a busca
+RETAS = ((0, 1), (1, 0), (1, 1), (1, -1))  # Retas que seguem adiante na ordem de leitura
+RAMOS = 4        # Palavras tentadas por célula antes de deixá-la livre
+AMOSTRA = 64     # Palavras não usadas examinadas por célula (sorteadas, se houver mais)
+NOS_POR_TENTATIVA = 3000  # Nós da busca antes de recomeçar com outro sorteio
+TENTATIVAS = 64  # Recomeços sem prazo (geração com semente: não depende do relógio)
+
+
+class _Esgotou(Exception):
+    """Tentativa passou de NOS_POR_TENTATIVA nós ou do prazo."""
+
+
+def letras_da_frase(frase):
+    """
+    Letras que a frase ocupa na grade.
+
+    Args:
+        frase (str): Frase secreta (espaços e pontuação são ignorados)
+
+    Returns:
+        str: Só as letras, em MAIÚSCULAS (acentos mantidos, como no banco)
+    """
+    return "".join(c for c in frase.upper() if c.isalpha())
+
+
+def _alcances(tabelas, reta):
+    """Por célula, quantas células ativas seguidas há dela em diante na reta."""
+    if tabelas.mascara is not None:
+        return tabelas.mascara.sequencias(reta)
+    linhas, colunas = tabelas.linhas, tabelas.colunas
+    dx, dy = reta
+    alcance = []
+    for i in range(linhas):
+        abaixo = linhas - i if dx else colunas  # Sem limite vertical em retas horizontais
+        for j in range(colunas):
+            lateral = colunas - j if dy > 0 else j + 1 if dy < 0 else linhas
+            alcance.append(min(abaixo, lateral))
+    return alcance
+
+
+def cobrir(tabelas, livres, prazo=None, tentativas=TENTATIVAS):
+    """
+    Posiciona palavras do banco deixando exatamente `livres` células livres.
+
+    Args:
+        tabelas (game.TabelasGeracao): Formato (linhas, colunas, direções,
+                                       máscara) e palavras que cabem nele
+        livres (int): Células que devem sobrar (letras da frase)
+        prazo (float, optional): Instante (time.perf_counter) limite; sem
+                                 prazo, no máximo `tentativas` recomeços
+        tentativas (int): Recomeços sem prazo
+
+    Returns:
+        tuple | None: (grade, colocacoes), onde grade é uma lista de linhas
+                      (listas) com as letras das palavras, '' nas células
+                      livres e INATIVA fora da máscara, e colocacoes são
+                      (palavra_obj, linha, coluna, direcao); None se não
+                      achou a tempo
+
+    Raises:
+        ValueError: Se a frase não cabe nas células ativas ou as letras do
+                    banco não bastam para cobrir as demais
+    """
+    linhas, colunas = tabelas.linhas, tabelas.colunas
+    if tabelas.modelo is None:
+        inicial = [''] * (linhas * colunas)
+    else:
+        inicial = [celula for linha in tabelas.modelo for celula in linha]
+    ativas = inicial.count('')
+    if livres > ativas:
+        raise ValueError(f"frase de {livres} letras não cabe em {ativas} células")
+
+    # Uma entrada por texto: a mesma palavra duas vezes na grade seria ambígua
+    objetos = list({obj['palavra']: obj for obj in tabelas.palavras}.values())
+    textos = [obj['palavra'] for obj in objetos]
+    letras_banco = sum(map(len, textos))
+    if letras_banco < ativas - livres:
+        raise ValueError(f"o banco tem {letras_banco} letras; cobrir {ativas - livres} "
+                         f"células ({linhas}x{colunas} menos {livres} livres) pede mais palavras")
+    invertidos = [texto[::-1] for texto in textos]
+
+    # (passo no índice plano, alcance por célula, direção, lida adiante, lida ao contrário)
+    permitidas = set(tabelas.direcoes)
+    retas = []
+    for dx, dy in RETAS:
+        adiante, contrario = (dx, dy) in permitidas, (-dx, -dy) in permitidas
+        if adiante or contrario:
+            retas.append((dx * colunas + dy, _alcances(tabelas, (dx, dy)), (dx, dy), adiante, contrario))
+    if not retas:
+        raise ValueError("nenhuma direção permitida")
+
+    total = len(inicial)
+    tentativa = 0
+    while (time.perf_counter() < prazo) if prazo is not None else (tentativa < tentativas):
+        tentativa += 1
+        resultado = _tentar(inicial, ativas, livres, textos, invertidos, retas, prazo)
+        if resultado is not None:
+            grade, pilha = resultado
+            colocacoes = []
+            for w, k, passo, direcao, contrario in pilha:
+                if contrario:  # Começa na outra ponta e volta até k
+                    k += (len(textos[w]) - 1) * passo
+                    direcao = (-direcao[0], -direcao[1])
+                linha, coluna = divmod(k, colunas)
+                colocacoes.append((objetos[w], linha, coluna, direcao))
+            return [[('' if c == LIVRE else c) for c in grade[i:i + colunas]]
+                    for i in range(0, total, colunas)], colocacoes
+    return None
+
+
+def _tentar(inicial, vazias, livres, textos, invertidos, retas, prazo):
+    """
+    Uma tentativa da busca (ver o cabeçalho do módulo).
+
+    Returns:
+        tuple | None: (grade plana, pilha de (palavra, célula, passo, direção,
+                      ao contrário)), ou None se esgotou os nós ou o prazo
+    """
+    grade = list(inicial)
+    total = len(grade)
+    cobertura = [0] * total          # Palavras que passam por cada célula (para desfazer)
+    restantes = list(range(len(textos)))
+    random.shuffle(restantes)
+    posicao = {w: i for i, w in enumerate(restantes)}
+    pilha = []
+    tamanhos = [len(texto) for texto in textos]
+    estado = {"vazias": vazias, "livres": livres, "letras": sum(map(len, textos)), "nos": 0}
+
+    def opcoes(k):
+        """Palavras que podem ter uma ponta em k: (ganho, palavra, passo, direção, ao contrário)."""
+        if len(restantes) > AMOSTRA:
+            amostra = random.sample(restantes, AMOSTRA)
+        else:
+            amostra = restantes[:]
+            random.shuffle(amostra)
+        # Maiores primeiro (estável: empates na ordem sorteada); o ganho de uma
+        # palavra não passa do seu tamanho, então a varredura para assim que
+        # nenhuma das que faltam supera as RAMOS melhores já achadas
+        amostra.sort(key=tamanhos.__getitem__, reverse=True)
+        vias = []
+        for passo, alcance, direcao, adiante, contrario in retas:
+            r = alcance[k]
+            if r < 2:
+                continue
+            trecho = grade[k:k + (r - 1) * passo + 1:passo]
+            fixas = [(i, g) for i, g in enumerate(trecho) if g]  # Letras de palavras que cruzam
+            vias.append((r, fixas, [i for i, _ in fixas], passo, direcao, adiante, contrario))
+        achadas = []
+        piso = 0  # Menor ganho entre as RAMOS melhores (com RAMOS achadas)
+        for w in amostra:
+            n = tamanhos[w]
+            if n <= piso:
+                break
+            for r, fixas, indices, passo, direcao, adiante, contrario in vias:
+                if n > r:
+                    continue
+                m = bisect_left(indices, n)  # Letras já escritas dentro da palavra
+                if not m:
+                    if adiante:
+                        achadas.append((n, w, passo, direcao, False))
+                    if contrario:
+                        achadas.append((n, w, passo, direcao, True))
+                    continue
+                if adiante and all(textos[w][i] == g for i, g in fixas[:m]):
+                    achadas.append((n - m, w, passo, direcao, False))
+                if contrario and all(invertidos[w][i] == g for i, g in fixas[:m]):
+                    achadas.append((n - m, w, passo, direcao, True))
+            if len(achadas) >= RAMOS:
+                achadas.sort(key=itemgetter(0), reverse=True)  # Estável
+                del achadas[RAMOS:]
+                piso = achadas[-1][0]
+        achadas.sort(key=itemgetter(0), reverse=True)
+        return achadas
+
+    def colocar(w, k, passo, contrario):
+        texto = invertidos[w] if contrario else textos[w]
+        novas = 0
+        for i, letra in enumerate(texto):
+            c = k + i * passo
+            if not grade[c]:
+                grade[c] = letra
+                novas += 1
+            cobertura[c] += 1
+        estado["vazias"] -= novas
+        estado["letras"] -= len(texto)
+        # Tira w de restantes (troca com o último); desfazer() repõe na ordem inversa
+        i = posicao[w]
+        ultimo = restantes[-1]
+        restantes[i] = ultimo
+        posicao[ultimo] = i
+        restantes.pop()
+        return i
+
+    def desfazer(w, k, passo, i):
+        n = len(textos[w])
+        for c in range(k, k + n * passo, passo):
+            cobertura[c] -= 1
+            if not cobertura[c]:
+                grade[c] = ''
+                estado["vazias"] += 1
+        estado["letras"] += n
+        movido = restantes[i] if i < len(restantes) else w
+        restantes.append(movido)
+        posicao[movido] = len(restantes) - 1
+        restantes[i] = w
+        posicao[w] = i
+
+    def buscar(k):
+        estado["nos"] += 1
+        if estado["nos"] > NOS_POR_TENTATIVA or (
+                prazo is not None and not estado["nos"] & 63 and time.perf_counter() >= prazo):
+            raise _Esgotou
+        while k < total and grade[k] != '':
+            k += 1
+        vazias, livres = estado["vazias"], estado["livres"]
+        if k == total:
+            return livres == 0
+        if vazias < livres or vazias - livres > estado["letras"]:
+            return False
+        if vazias == livres:  # Todas as vazias que sobram são as livres
+            for c in range(k, total):
+                if grade[c] == '':
+                    grade[c] = LIVRE
+            estado["vazias"] = estado["livres"] = 0
+            return True
+        # Livre primeiro com a chance de sua cota (livres / vazias): espalha a
+        # frase pela grade em vez de deixá-la toda nas últimas linhas
+        ramos = opcoes(k)
+        if livres and random.random() * vazias < livres:
+            ramos.insert(0, None)
+        elif livres:
+            ramos.append(None)
+        for ramo in ramos:
+            if ramo is None:
+                grade[k] = LIVRE
+                estado["vazias"] -= 1
+                estado["livres"] -= 1
+                if buscar(k + 1):
+                    return True
+                grade[k] = ''
+                estado["vazias"] += 1
+                estado["livres"] += 1
+                continue
+            _, w, passo, direcao, contrario = ramo
+            i = colocar(w, k, passo, contrario)
+            pilha.append((w, k, passo, direcao, contrario))
+            if buscar(k + 1):
+                return True
+            pilha.pop()
+            desfazer(w, k, passo, i)
+        return False
+
+    try:
+        if buscar(0):
+            return grade, pilha
+    except (_Esgotou, RecursionError):
+        pass
+    return None
@@ -0,0 +1,159 @@
+"""
+GAME/REDE_TABULEIROS.PY - Protocolo e Cliente do Servidor de Tabuleiros
+=======================================================================
+Este módulo define como o jogo conversa com o servidor de tabuleiros
+(servidor_tabuleiros.py), que gera partidas para vários quiosques.
+Responsável por:
+- Interpretar endereços: "unix:/caminho/do/socket" ou "host:porta" (TCP)
+- Montar e ler quadros: 4 bytes (tamanho, big-endian) + JSON em UTF-8
+- Buscar uma partida pronta no servidor (cliente síncrono, com tempo limite)
+
+Mensagens (um quadro cada; a conexão pode ser reaproveitada):
+- Pedido:   {"dificuldade": código}
+- Resposta: {"ok": true, "partida": game.exportar_partida()}
+            ou {"ok": false, "erro": "mensagem"}
+
+Não depende do Qt: é usado por game.abrir_jogo (game/game.py) e pelo
+servidor_tabuleiros.py.
+"""
+
+import json
+import socket
+import struct
+
+from consts import SERVIDOR_TABULEIROS, TEMPO_LIMITE_SERVIDOR_S
+
+CABECALHO = struct.Struct(">I")  # Tamanho do corpo do quadro
+MAX_QUADRO = 64 * 1024 * 1024    # Maior quadro aceito (uma partida 1000x1000 tem ~1 MB)
+
+
+def ler_endereco(endereco=SERVIDOR_TABULEIROS):
+    """
+    Interpreta um endereço do servidor.
+
+    Args:
+        endereco (str): "unix:/caminho" (socket Unix) ou "host:porta" (TCP)
+
+    Returns:
+        tuple: ("unix", caminho) ou ("tcp", (host, porta))
+
+    Raises:
+        ValueError: Se o endereço não estiver em nenhum dos formatos
+    """
+    if endereco.startswith("unix:"):
+        return "unix", endereco[len("unix:"):]
+    host, separador, porta = endereco.rpartition(":")
+    if not separador or not porta.isdigit():
+        raise ValueError(f"endereço inválido: {endereco!r} (use host:porta ou unix:/caminho)")
+    return "tcp", (host or "127.0.0.1", int(porta))
+
+
+def quadro(corpo):
+    """
+    Monta um quadro.
+
+    Args:
+        corpo (bytes | dict): JSON já codificado, ou um dicionário a codificar
+
+    Returns:
+        bytes: Cabeçalho + corpo
+    """
+    if not isinstance(corpo, bytes):
+        corpo = json.dumps(corpo, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return CABECALHO.pack(len(corpo)) + corpo
+
+
+def tamanho_quadro(cabecalho):
+    """
+    Tamanho do corpo anunciado por um cabeçalho.
+
+    Raises:
+        ValueError: Se passar de MAX_QUADRO
+    """
+    (tamanho,) = CABECALHO.unpack(cabecalho)
+    if tamanho > MAX_QUADRO:
+        raise ValueError(f"quadro de {tamanho} bytes")
+    return tamanho
+
+
+def _receber(conexao, n):
+    """Lê exatamente n bytes do socket."""
+    partes = []
+    while n:
+        parte = conexao.recv(min(n, 1024 * 1024))
+        if not parte:
+            raise ConnectionError("servidor fechou a conexão")
+        partes.append(parte)
+        n -= len(parte)
+    return b"".join(partes)
+
+
+def conectar(endereco=SERVIDOR_TABULEIROS, tempo_limite=TEMPO_LIMITE_SERVIDOR_S):
+    """
+    Abre uma conexão com o servidor.
+
+    Args:
+        endereco (str): Endereço (ver ler_endereco)
+        tempo_limite (float): Segundos para conectar e para cada leitura
+
+    Returns:
+        socket.socket: Conexão aberta
+
+    Raises:
+        OSError: Se o servidor não estiver no ar
+    """
+    tipo, destino = ler_endereco(endereco)
+    if tipo == "tcp":
+        conexao = socket.create_connection(destino, timeout=tempo_limite)
+        conexao.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return conexao
+    conexao = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conexao.settimeout(tempo_limite)
+    try:
+        conexao.connect(destino)
+    except OSError:
+        conexao.close()
+        raise
+    return conexao
+
+
+def pedir_partida(conexao, dificuldade):
+    """
+    Pede uma partida em uma conexão aberta.
+
+    Args:
+        conexao (socket.socket): Conexão de conectar()
+        dificuldade (int): Código da dificuldade (perfil do servidor)
+
+    Returns:
+        dict: Partida no formato de game.exportar_partida()
+
+    Raises:
+        OSError: Falha de rede ou tempo esgotado
+        ValueError: Resposta inválida ou erro informado pelo servidor
+    """
+    conexao.sendall(quadro({"dificuldade": dificuldade}))
+    resposta = json.loads(_receber(conexao, tamanho_quadro(_receber(conexao, CABECALHO.size))))
+    if not resposta.get("ok"):
+        raise ValueError(f"servidor recusou: {resposta.get('erro')}")
+    return resposta["partida"]
+
+
+def buscar_partida(dificuldade, endereco=SERVIDOR_TABULEIROS, tempo_limite=TEMPO_LIMITE_SERVIDOR_S):
+    """
+    Busca uma partida pronta no servidor (uma conexão por partida).
+
+    Args:
+        dificuldade (int): Código da dificuldade
+        endereco (str): Endereço do servidor
+        tempo_limite (float): Segundos para conectar e para cada leitura
+
+    Returns:
+        dict: Partida no formato de game.exportar_partida()
+
+    Raises:
+        OSError: Servidor fora do ar, falha de rede ou tempo esgotado
+        ValueError: Resposta inválida ou erro informado pelo servidor
+    """
+    with conectar(endereco, tempo_limite) as conexao:
+        return pedir_partida(conexao, dificuldade)
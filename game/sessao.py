@@ -0,0 +1,275 @@
+"""
+GAME/SESSAO.PY - Estado de uma Partida (sem interface)
+======================================================
+Este módulo implementa a sessão de jogo usada pela TelaJogo.
+Responsável por:
+- Guardar quais células e palavras já foram encontradas
+- Validar uma seleção (pontas da reta) contra as palavras posicionadas
+- Manter o contador de palavras encontradas e detectar o fim da partida
+- No modo descoberta livre (com um léxico, ver game/lexico.py), aceitar
+  também qualquer palavra do dicionário traçada na grade
+- Avisar os observadores (a tela, testes, simulações) de cada mudança
+
+Representação:
+- Células encontradas: bitset em um bytearray (bit i*colunas + j), com
+  consulta e marcação O(1) por célula
+- Palavras: mapa {(início, fim): índice} nas duas direções; como a seleção
+  é sempre uma reta, validar é um único acesso ao dicionário
+- Contador de encontradas mantido incrementalmente (O(1) para consultar)
+- Descobertas livres: {palavra: (início, fim)}; cada palavra conta uma vez
+
+Eventos (callback(evento, dados), na ordem em que acontecem):
+- EVENTO_ENCONTRADA: dados = índice da palavra em colocacoes
+- EVENTO_DESCOBERTA: dados = (palavra, início, fim) de uma descoberta livre
+- EVENTO_FIM: dados = True se o jogador desistiu, False se venceu
+
+Não depende do Qt: é usado pela TelaJogo (game/game_ui.py).
+"""
+
+from game.mascaras import INATIVA
+
+EVENTO_ENCONTRADA = "encontrada"
+EVENTO_DESCOBERTA = "descoberta"
+EVENTO_FIM = "fim"
+
+
+class SessaoJogo:
+    """
+    Estado de uma partida: matriz, palavras posicionadas e progresso.
+
+    As palavras são as Colocacao de game/game.py; o campo 'encontrada' de
+    cada uma é mantido em sincronia pela sessão.
+    """
+
+    __slots__ = ("matriz", "colocacoes", "linhas", "colunas", "total", "encontradas",
+                 "terminada", "lexico", "descobertas", "_celulas", "_extremos", "_observadores",
+                 "_grade", "_posicionadas", "_achaveis")
+
+    def __init__(self, matriz, colocacoes, lexico=None):
+        """
+        Args:
+            matriz (sequence): Linhas da matriz (strings ou listas de letras)
+            colocacoes (list): Colocacao de cada palavra posicionada
+            lexico (game.lexico.Lexico, optional): Liga o modo descoberta livre
+        """
+        self.matriz = matriz
+        self.colocacoes = colocacoes
+        self.linhas = len(matriz)
+        self.colunas = len(matriz[0]) if matriz else 0
+        self.total = len(colocacoes)
+        self.encontradas = 0
+        self.terminada = False
+        self._celulas = bytearray((self.linhas * self.colunas + 7) // 8)
+        self._observadores = []
+        self.lexico = lexico
+        self.descobertas = {}
+        self._grade = None         # Matriz normalizada para o léxico (na primeira consulta)
+        self._posicionadas = None  # Palavras posicionadas, normalizadas (não são descobertas)
+        self._achaveis = None      # Cache de achaveis()
+
+        self._extremos = {}
+        for idx, info in enumerate(colocacoes):
+            inicio, fim = (info.linha, info.coluna), info.fim()
+            self._extremos[(inicio, fim)] = idx  # Direção original
+            self._extremos[(fim, inicio)] = idx  # Direção reversa
+            # Palavras que já chegam encontradas (partida retomada) contam desde o início
+            if info.encontrada:
+                self._marcar_celulas(info)
+                self.encontradas += 1
+
+    # ============================================================================
+    # OBSERVADORES
+    # ============================================================================
+
+    def observar(self, callback):
+        """
+        Registra um observador dos eventos da sessão.
+
+        Args:
+            callback (callable): Recebe (evento, dados)
+        """
+        self._observadores.append(callback)
+
+    def deixar_de_observar(self, callback):
+        """
+        Remove um observador registrado com observar().
+
+        Args:
+            callback (callable): Observador a remover
+        """
+        if callback in self._observadores:
+            self._observadores.remove(callback)
+
+    def _emitir(self, evento, dados):
+        """Entrega o evento a cada observador (cópia da lista: podem se remover)."""
+        for callback in tuple(self._observadores):
+            callback(evento, dados)
+
+    # ============================================================================
+    # CONSULTAS
+    # ============================================================================
+
+    def palavra_em(self, inicio, fim):
+        """
+        Índice da palavra que vai de uma ponta à outra (em qualquer sentido).
+
+        Args:
+            inicio (tuple): (linha, coluna) da primeira célula da seleção
+            fim (tuple): (linha, coluna) da última célula da seleção
+
+        Returns:
+            int | None: Índice em colocacoes, ou None se não há palavra ali
+        """
+        return self._extremos.get((inicio, fim))
+
+    def celula_ativa(self, i, j):
+        """
+        Returns:
+            bool: True se a célula (i, j) faz parte do tabuleiro (não está
+                  fora da máscara de formato, ver game/mascaras.py)
+        """
+        return self.matriz[i][j] != INATIVA
+
+    def celula_encontrada(self, i, j):
+        """
+        Returns:
+            bool: True se a célula (i, j) pertence a uma palavra já encontrada
+        """
+        k = i * self.colunas + j
+        return bool(self._celulas[k >> 3] & (1 << (k & 7)))
+
+    def completa(self):
+        """
+        Returns:
+            bool: True se todas as palavras foram encontradas
+        """
+        return self.encontradas == self.total
+
+    def celulas_livres(self):
+        """
+        Células ativas que não pertencem a nenhuma palavra, em ordem de leitura.
+
+        No modo mensagem secreta (game.gerar_com_mensagem), suas letras
+        formam a frase escondida.
+
+        Returns:
+            list: Tuplas (linha, coluna)
+        """
+        ocupadas = {celula for info in self.colocacoes for celula in info.posicoes()}
+        return [(i, j) for i, linha in enumerate(self.matriz) for j, letra in enumerate(linha)
+                if letra != INATIVA and (i, j) not in ocupadas]
+
+    def achaveis(self):
+        """
+        Todas as descobertas livres possíveis neste tabuleiro (modo descoberta).
+
+        Enumeradas pelo léxico na primeira chamada e guardadas; as palavras
+        posicionadas ficam de fora (contam como palavras encontradas).
+
+        Returns:
+            dict: {(início, fim): palavra} de cada ocorrência (vazio sem léxico)
+        """
+        if self._achaveis is None:
+            if self.lexico is None:
+                self._achaveis = {}
+            else:
+                posicionadas = self._palavras_posicionadas()
+                self._achaveis = {
+                    extremos: palavra
+                    for extremos, palavra in self.lexico.palavras_no_tabuleiro(self.matriz).items()
+                    if palavra not in posicionadas
+                }
+        return self._achaveis
+
+    def total_descobertas(self):
+        """
+        Returns:
+            int: Palavras distintas que podem ser descobertas (ver achaveis)
+        """
+        return len(set(self.achaveis().values()))
+
+    # ============================================================================
+    # AÇÕES DO JOGADOR
+    # ============================================================================
+
+    def selecionar(self, inicio, fim):
+        """
+        Valida a seleção de uma reta e marca a palavra, se for nova.
+
+        Emite EVENTO_ENCONTRADA e, se era a última palavra, EVENTO_FIM. No
+        modo descoberta, uma reta que não é palavra posicionada é conferida
+        no léxico (nos dois sentidos) e pode emitir EVENTO_DESCOBERTA.
+
+        Args:
+            inicio (tuple): (linha, coluna) onde a seleção começou
+            fim (tuple): (linha, coluna) onde a seleção terminou
+
+        Returns:
+            int | None: Índice da palavra encontrada, ou None se a seleção não
+                        corresponde a uma palavra nova (ou a partida acabou)
+        """
+        if self.terminada:
+            return None
+        idx = self._extremos.get((inicio, fim))
+        if idx is None:
+            if self.lexico is not None:
+                self._descobrir(inicio, fim)
+            return None
+        if self.colocacoes[idx].encontrada:
+            return None
+        self._encontrar(idx)
+        if self.encontradas == self.total:
+            self.terminada = True
+            self._emitir(EVENTO_FIM, False)
+        return idx
+
+    def desistir(self):
+        """
+        Marca todas as palavras restantes como encontradas e encerra a partida.
+
+        Emite EVENTO_ENCONTRADA para cada palavra restante e depois EVENTO_FIM.
+        Não faz nada se a partida já terminou.
+        """
+        if self.terminada:
+            return
+        for idx, info in enumerate(self.colocacoes):
+            if not info.encontrada:
+                self._encontrar(idx)
+        self.terminada = True
+        self._emitir(EVENTO_FIM, True)
+
+    def _encontrar(self, idx):
+        """Marca a palavra idx (flag, células e contador) e emite o evento."""
+        info = self.colocacoes[idx]
+        info.encontrada = True
+        self._marcar_celulas(info)
+        self.encontradas += 1
+        self._emitir(EVENTO_ENCONTRADA, idx)
+
+    def _marcar_celulas(self, info):
+        """Liga no bitset os bits das células ocupadas pela palavra."""
+        celulas, colunas = self._celulas, self.colunas
+        k = info.linha * colunas + info.coluna
+        passo = info.dx * colunas + info.dy
+        for _ in range(len(info.palavra)):
+            celulas[k >> 3] |= 1 << (k & 7)
+            k += passo
+
+    def _descobrir(self, inicio, fim):
+        """Confere a reta no léxico e registra a palavra, se for uma descoberta nova."""
+        from game.lexico import normalizar_grade
+
+        if self._grade is None:
+            self._grade = normalizar_grade(self.matriz)
+        palavra = self.lexico.palavra_na_reta(self._grade, inicio, fim)
+        if palavra is None or palavra in self.descobertas or palavra in self._palavras_posicionadas():
+            return
+        self.descobertas[palavra] = (inicio, fim)
+        self._emitir(EVENTO_DESCOBERTA, (palavra, inicio, fim))
+
+    def _palavras_posicionadas(self):
+        """Textos normalizados das palavras posicionadas (calculados uma vez)."""
+        if self._posicionadas is None:
+            from game.lexico import normalizar
+            self._posicionadas = {normalizar(info.palavra) for info in self.colocacoes}
+        return self._posicionadas
@@ -0,0 +1,713 @@
+"""
+GAME/TABULEIRO_UI.PY - Tabuleiro Desenhado com Rolagem e Zoom
+=============================================================
+Este módulo implementa a área da matriz de letras da TelaJogo.
+Responsável por:
+- Desenhar as células diretamente no viewport (sem um widget por célula),
+  apenas as que estão visíveis na área exposta
+- Rolagem (barras, roda do mouse e arrasto com botão direito/do meio) e
+  zoom (Ctrl + roda, ou as teclas +/-/0 tratadas pela TelaJogo)
+- Converter a posição do mouse em célula e repassar a seleção por clique e
+  arrasto para a TelaJogo, com rolagem automática perto das bordas
+- Guardar quais células estão na seleção temporária e quais já foram
+  encontradas, repintando só o retângulo das células que mudaram
+- Não desenhar as células fora da máscara de formato (letra INATIVA, ver
+  game/mascaras.py): tabuleiros em círculo, coração, letras, com furos
+- Ajustar o tamanho das células ao espaço disponível; durante um
+  redimensionamento ao vivo da janela, exibir uma imagem escalada do
+  tabuleiro e recalcular tudo uma única vez quando o redimensionamento para
+- Manter um atlas de glifos: cada célula (letra + estado) é desenhada uma
+  vez por tamanho em um QPixmap, e a pintura do tabuleiro vira uma cópia
+  de pixmap por célula
+
+Com isso, memória e custo de pintura acompanham o tamanho da área visível,
+não o do tabuleiro (tabuleiros "maratona" de 200x200 ou maiores).
+"""
+
+import math
+import re
+
+from PyQt6.QtWidgets import QAbstractScrollArea, QFrame
+from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QPixmap
+from PyQt6.QtCore import Qt, QTimer, QRect, QRectF, QSize
+
+from consts import FONT_PIXEL_SIZE, ATRASO_REDIMENSIONAR_MS
+from utils.recursos import fonte, estilo, CORES_CELULAS
+from game.mascaras import INATIVA
+
+# Índices dos estados de aparência de uma célula
+NORMAL = 0
+SELECIONADA = 1
+ENCONTRADA = 2
+DESCOBERTA = 3           # Palavra livre do dicionário (modo descoberta, game/lexico.py)
+NOMES_ESTADOS = ("normal", "selecionada", "encontrada", "descoberta")  # Chaves de CORES_CELULAS
+
+ESPACO_BASE = 4          # Espaço entre células (px) com zoom 1
+RAIO_BASE = 6            # Raio das bordas arredondadas com zoom 1
+CELULA_MIN = 28          # Limites do lado da célula com zoom 1, ajustado ao espaço disponível
+CELULA_MAX = 64
+LADO_MIN_LETRA = 8       # Abaixo disso as células viram quadrados lisos, sem letra
+COR_FUNDO = "#0c0c12"    # Mesmo fundo do painel da matriz
+
+
+class AtlasGlifos:
+    """
+    Cache de pixmaps das células do tabuleiro, por (letra, estado).
+
+    Todas as entradas têm o mesmo lado e a mesma razão de pixels do
+    dispositivo; preparar() descarta o atlas quando um dos dois muda (zoom,
+    troca de tela/DPI), então a memória fica limitada a letras x estados.
+    Os contadores de acertos/faltas (só células realmente copiadas do
+    atlas) alimentam o HUD de desempenho e os benchmarks: quem é dono da
+    medição chama zerar_contadores() e lê taxa_acertos(); o HUD só lê a
+    diferença entre suas atualizações, sem zerá-los.
+    """
+
+    __slots__ = ("glifos", "acertos", "faltas", "_lado", "_dpr", "_fonte", "_cores", "_raio", "_borda")
+
+    def __init__(self, fonte, cores):
+        """
+        Args:
+            fonte (QFont): Fonte das letras (o tamanho é ajustado por preparar)
+            cores (list): (fundo, texto, borda) em QColor, indexado pelo estado
+        """
+        self.glifos = {}
+        self.acertos = 0
+        self.faltas = 0
+        self._lado = None
+        self._dpr = None
+        self._fonte = fonte
+        self._cores = cores
+        self._raio = 0.0
+        self._borda = 1.0
+
+    def preparar(self, lado, dpr, zoom):
+        """
+        Garante que o atlas corresponde ao lado e DPI atuais.
+
+        Args:
+            lado (int): Lado da célula em pixels lógicos
+            dpr (float): devicePixelRatio do viewport
+            zoom (float): Zoom atual (escala do raio e da borda)
+        """
+        if lado == self._lado and dpr == self._dpr:
+            return
+        self.glifos.clear()
+        self._lado = lado
+        self._dpr = dpr
+        self._raio = RAIO_BASE * zoom
+        self._borda = max(1.0, 2 * zoom)
+        self._fonte.setPixelSize(max(1, round(lado * 0.45)))
+
+    def renderizar(self, chave):
+        """
+        Desenha a célula (letra, estado) e guarda no atlas (conta uma falta).
+
+        Returns:
+            QPixmap: Pixmap da célula
+        """
+        letra, estado = chave
+        lado, borda = self._lado, self._borda
+        fundo, cor_texto, cor_borda = self._cores[estado]
+
+        pixmap = QPixmap(max(1, round(lado * self._dpr)), max(1, round(lado * self._dpr)))
+        pixmap.setDevicePixelRatio(self._dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(cor_borda, borda))
+        painter.setBrush(fundo)
+        painter.drawRoundedRect(
+            QRectF(borda / 2, borda / 2, lado - borda, lado - borda), self._raio, self._raio
+        )
+        painter.setFont(self._fonte)
+        painter.setPen(cor_texto)
+        painter.drawText(QRect(0, 0, lado, lado), Qt.AlignmentFlag.AlignCenter, letra)
+        painter.end()
+
+        self.glifos[chave] = pixmap
+        self.faltas += 1
+        return pixmap
+
+    def taxa_acertos(self):
+        """Fração das células desenhadas que vieram do atlas (0.0 a 1.0)."""
+        total = self.acertos + self.faltas
+        return self.acertos / total if total else 0.0
+
+    def zerar_contadores(self):
+        """Zera acertos/faltas (o atlas em si é mantido)."""
+        self.acertos = 0
+        self.faltas = 0
+
+
+class TabuleiroView(QAbstractScrollArea):
+    """
+    Visualização rolável e com zoom da matriz de letras.
+
+    Os eventos de seleção são delegados à TelaJogo (_start_selection,
+    _update_selection, _finalize_selection), que mantém as regras do jogo;
+    a view só converte coordenadas e desenha.
+    """
+
+    ZOOM_MIN = 0.25
+    ZOOM_MAX = 3.0
+    PASSO_ZOOM = 1.15                # Fator por "clique" da roda / tecla
+    MARGEM_AUTO_SCROLL = 32          # Distância da borda (px) que ativa a rolagem automática
+    INTERVALO_AUTO_SCROLL_MS = 16
+
+    def __init__(self, tela):
+        """
+        Args:
+            tela (TelaJogo): Tela dona do tabuleiro (recebe os eventos de seleção)
+        """
+        super().__init__()
+        self._tela = tela
+        self._matriz = []
+        self._linhas = 0
+        self._colunas = 0
+        self._celula_base = CELULA_MIN  # Lado da célula (px) com zoom 1, ajustado ao tamanho da view
+        self._zoom = 1.0
+        self._selecao = set()       # Células do path temporário
+        self._encontradas = set()   # Células de palavras já encontradas
+        self._descobertas = set()   # Células de descobertas livres (modo descoberta)
+        self._inativas = []         # Por linha: faixas (j0, j1) de células fora da máscara
+        self._ultima_pos = None     # Última posição do mouse durante o arrasto
+        self._pan = None            # (posição inicial, valor h, valor v) ao arrastar o tabuleiro
+        self._aviso = ""            # Texto exibido no lugar de um tabuleiro vazio (carregando, erro)
+        self._instantaneo = None    # Imagem exibida durante o redimensionamento ao vivo
+        self._base_instantaneo = CELULA_MIN  # Lado da célula quando a imagem foi capturada
+        self._capturando = False    # Evita recursão durante a captura da imagem
+        self._tamanho_visto = QSize()  # Último tamanho da view (não do viewport) tratado
+        self._pintado = False       # Já foi pintado desde que apareceu (o jogador está vendo)
+        self._janela_vista = QSize()  # Tamanho da janela no último resize tratado
+
+        self._cores = [
+            tuple(QColor(c) for c in CORES_CELULAS[nome]) for nome in NOMES_ESTADOS
+        ]
+        self._cor_fundo = QColor(COR_FUNDO)
+        # Cópia da fonte: o tamanho acompanha o lado da célula
+        self._atlas = AtlasGlifos(QFont(fonte(FONT_PIXEL_SIZE)), self._cores)
+
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)  # Atalhos continuam na TelaJogo
+        self.setStyleSheet(estilo("tabuleiro"))
+        self.viewport().setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+        self._timer_auto = QTimer(self)
+        self._timer_auto.setInterval(self.INTERVALO_AUTO_SCROLL_MS)
+        self._timer_auto.timeout.connect(self._auto_scroll)
+
+        # Fim do redimensionamento: nenhum resize novo dentro do atraso
+        self._timer_resize = QTimer(self)
+        self._timer_resize.setSingleShot(True)
+        self._timer_resize.setInterval(ATRASO_REDIMENSIONAR_MS)
+        self._timer_resize.timeout.connect(self._fim_redimensionamento)
+
+        self.horizontalScrollBar().valueChanged.connect(self.viewport().update)
+        self.verticalScrollBar().valueChanged.connect(self.viewport().update)
+
+    # ============================================================================
+    # DADOS E ESTADO DAS CÉLULAS
+    # ============================================================================
+
+    def carregar(self, matriz):
+        """
+        Exibe uma nova matriz, sem seleção nem células encontradas.
+
+        O lado das células (zoom 1) é escolhido para o tabuleiro caber na
+        view, limitado a CELULA_MIN..CELULA_MAX.
+
+        Args:
+            matriz (list): Matriz 2D de caracteres
+        """
+        self._matriz = matriz
+        self._aviso = ""
+        self._linhas = len(matriz)
+        self._colunas = len(matriz[0]) if matriz else 0
+        self._inativas = [
+            [(m.start(), m.end() - 1) for m in re.finditer(re.escape(INATIVA) + "+", linha)]
+            for linha in matriz
+        ] if any(INATIVA in linha for linha in matriz) else []
+        self._celula_base = self._celula_ajustada()
+        self._selecao = set()
+        self._encontradas = set()
+        self._descobertas = set()
+        self._zoom = 1.0
+        self._atualizar_barras()
+        self.horizontalScrollBar().setValue(0)
+        self.verticalScrollBar().setValue(0)
+        self.viewport().update()
+
+    def definir_aviso(self, texto):
+        """
+        Define o texto exibido enquanto o tabuleiro está vazio.
+
+        Args:
+            texto (str): Aviso (ex.: "gerando tabuleiro..."); vazio remove
+        """
+        self._aviso = texto
+        self.viewport().update()
+
+    def definir_selecao(self, celulas):
+        """
+        Troca as células destacadas como seleção temporária.
+
+        Args:
+            celulas (iterable): Tuplas (i, j) do path atual (vazio limpa)
+
+        Returns:
+            int: Quantidade de células que mudaram de aparência
+        """
+        nova = set(celulas)
+        alteradas = (nova ^ self._selecao) - self._encontradas
+        self._selecao = nova
+        self._repintar(alteradas)
+        return len(alteradas)
+
+    def marcar_encontradas(self, celulas):
+        """
+        Pinta as células como encontradas (permanente até a próxima partida).
+
+        Args:
+            celulas (iterable): Tuplas (i, j) da palavra encontrada
+
+        Returns:
+            int: Quantidade de células que mudaram de aparência
+        """
+        novas = set(celulas) - self._encontradas
+        self._encontradas |= novas
+        self._repintar(novas)
+        return len(novas)
+
+    def marcar_descobertas(self, celulas):
+        """
+        Pinta as células de uma descoberta livre (continuam selecionáveis).
+
+        Args:
+            celulas (iterable): Tuplas (i, j) da palavra descoberta
+
+        Returns:
+            int: Quantidade de células que mudaram de aparência
+        """
+        novas = set(celulas) - self._descobertas
+        self._descobertas |= novas
+        alteradas = novas - self._encontradas - self._selecao
+        self._repintar(alteradas)
+        return len(alteradas)
+
+    def _estado(self, i, j):
+        """Estado de aparência da célula (encontrada > seleção > descoberta)."""
+        if (i, j) in self._encontradas:
+            return ENCONTRADA
+        if (i, j) in self._selecao:
+            return SELECIONADA
+        if (i, j) in self._descobertas:
+            return DESCOBERTA
+        return NORMAL
+
+    # ============================================================================
+    # GEOMETRIA (ZOOM, ROLAGEM E CONVERSÃO DE COORDENADAS)
+    # ============================================================================
+
+    def _lado(self):
+        return max(2, round(self._celula_base * self._zoom))
+
+    def _espaco(self):
+        return max(1, round(ESPACO_BASE * self._zoom))
+
+    def _tamanho_conteudo(self):
+        """Largura e altura do tabuleiro inteiro (px) no zoom atual."""
+        passo = self._lado() + self._espaco()
+        espaco = self._espaco()
+        return max(0, self._colunas * passo - espaco), max(0, self._linhas * passo - espaco)
+
+    def _origem(self):
+        """Posição (no viewport) do canto da célula (0, 0); centraliza tabuleiros pequenos."""
+        largura, altura = self._tamanho_conteudo()
+        vp = self.viewport()
+        x = max(0, (vp.width() - largura) // 2) - self.horizontalScrollBar().value()
+        y = max(0, (vp.height() - altura) // 2) - self.verticalScrollBar().value()
+        return x, y
+
+    def _celula_ajustada(self):
+        """
+        Lado da célula (zoom 1) que faz o tabuleiro caber na view inteira
+        (sem contar as barras de rolagem), limitado a CELULA_MIN..CELULA_MAX.
+        """
+        if not self._linhas or not self._colunas:
+            return self._celula_base
+        lado = min(
+            (self.width() + ESPACO_BASE) // self._colunas,
+            (self.height() + ESPACO_BASE) // self._linhas,
+        ) - ESPACO_BASE
+        return min(max(lado, CELULA_MIN), CELULA_MAX)
+
+    def _ponto_conteudo(self, ancora):
+        """Posição da âncora (viewport) relativa ao canto do tabuleiro, e o passo atual."""
+        x0, y0 = self._origem()
+        return ancora.x() - x0, ancora.y() - y0, self._lado() + self._espaco()
+
+    def _restaurar_ancora(self, ancora, ponto):
+        """
+        Rola para que o ponto do tabuleiro medido por _ponto_conteudo volte a
+        ficar sob a âncora depois de uma mudança de escala.
+        """
+        cx, cy, passo_antigo = ponto
+        self._atualizar_barras()
+        escala = (self._lado() + self._espaco()) / passo_antigo
+        self.horizontalScrollBar().setValue(round(cx * escala - ancora.x()))
+        self.verticalScrollBar().setValue(round(cy * escala - ancora.y()))
+        self.viewport().update()
+
+    def _atualizar_barras(self):
+        """Ajusta o alcance das barras de rolagem ao tamanho do conteúdo."""
+        largura, altura = self._tamanho_conteudo()
+        vp = self.viewport()
+        passo = self._lado() + self._espaco()
+        for barra, total, visivel in (
+            (self.horizontalScrollBar(), largura, vp.width()),
+            (self.verticalScrollBar(), altura, vp.height()),
+        ):
+            barra.setRange(0, max(0, total - visivel))
+            barra.setPageStep(visivel)
+            barra.setSingleStep(passo)
+
+    def celula_em(self, pos, limitar=False):
+        """
+        Converte uma posição do viewport na célula correspondente.
+
+        O espaço entre células conta como metade para cada vizinha, para que
+        o arrasto não "perca" a célula ao passar pelas frestas.
+
+        Args:
+            pos (QPoint): Posição no viewport
+            limitar (bool): Se True, posições fora do tabuleiro são levadas à
+                            célula mais próxima da borda
+
+        Returns:
+            tuple | None: (i, j) ou None se fora do tabuleiro e limitar=False
+        """
+        if not self._linhas or not self._colunas:
+            return None
+        passo = self._lado() + self._espaco()
+        meio = self._espaco() / 2
+        x0, y0 = self._origem()
+        j = math.floor((pos.x() - x0 + meio) / passo)
+        i = math.floor((pos.y() - y0 + meio) / passo)
+        if limitar:
+            return min(max(i, 0), self._linhas - 1), min(max(j, 0), self._colunas - 1)
+        if 0 <= i < self._linhas and 0 <= j < self._colunas:
+            return i, j
+        return None
+
+    def _retangulo_celulas(self, celulas):
+        """Retângulo do viewport que cobre todas as células informadas."""
+        passo = self._lado() + self._espaco()
+        x0, y0 = self._origem()
+        linhas = [i for i, _ in celulas]
+        colunas = [j for _, j in celulas]
+        esquerda = x0 + min(colunas) * passo
+        topo = y0 + min(linhas) * passo
+        return QRect(
+            esquerda, topo,
+            (max(colunas) - min(colunas)) * passo + self._lado(),
+            (max(linhas) - min(linhas)) * passo + self._lado(),
+        )
+
+    def _repintar(self, celulas):
+        """Agenda a repintura apenas da região das células alteradas."""
+        if celulas:
+            self.viewport().update(self._retangulo_celulas(celulas))
+
+    # ============================================================================
+    # ZOOM
+    # ============================================================================
+
+    def atlas(self):
+        """Atlas de glifos do tabuleiro (taxa de acertos para o HUD e benchmarks)."""
+        return self._atlas
+
+    def zoom(self):
+        """Fator de zoom atual (1.0 = tamanho base da célula)."""
+        return self._zoom
+
+    def definir_zoom(self, zoom, ancora=None):
+        """
+        Aplica um novo zoom mantendo fixo o ponto do tabuleiro sob a âncora.
+
+        Args:
+            zoom (float): Novo fator (limitado a ZOOM_MIN..ZOOM_MAX)
+            ancora (QPoint, optional): Ponto do viewport a manter (padrão: centro)
+        """
+        zoom = min(max(zoom, self.ZOOM_MIN), self.ZOOM_MAX)
+        if zoom == self._zoom:
+            return
+        if ancora is None:
+            ancora = self.viewport().rect().center()
+
+        # Mantém o ponto sob a âncora antes e depois do zoom
+        ponto = self._ponto_conteudo(ancora)
+        self._zoom = zoom
+        self._restaurar_ancora(ancora, ponto)
+
+    def aproximar(self, passos=1):
+        """Aumenta (passos > 0) ou diminui (passos < 0) o zoom."""
+        self.definir_zoom(self._zoom * self.PASSO_ZOOM ** passos)
+
+    # ============================================================================
+    # PINTURA (APENAS CÉLULAS VISÍVEIS)
+    # ============================================================================
+
+    def paintEvent(self, event):
+        area = event.rect()
+        painter = QPainter(self.viewport())
+        painter.fillRect(area, self._cor_fundo)
+        if self._instantaneo is not None:
+            self._desenhar_instantaneo(painter)
+            return
+        if not self._linhas or not self._colunas:
+            if self._aviso:
+                painter.setFont(fonte(FONT_PIXEL_SIZE))
+                painter.setPen(self._cores[NORMAL][1])
+                painter.drawText(
+                    self.viewport().rect().adjusted(16, 0, -16, 0),
+                    Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, self._aviso,
+                )
+            return
+        self._pintado = True
+
+        lado = self._lado()
+        passo = lado + self._espaco()
+        x0, y0 = self._origem()
+
+        # Faixa de linhas/colunas que intersecta a área a repintar
+        c0 = max(0, (area.left() - x0) // passo)
+        c1 = min(self._colunas - 1, (area.right() - x0) // passo)
+        r0 = max(0, (area.top() - y0) // passo)
+        r1 = min(self._linhas - 1, (area.bottom() - y0) // passo)
+        if c0 > c1 or r0 > r1:
+            return
+
+        if lado < LADO_MIN_LETRA:
+            # Zoom muito afastado: quadrados lisos, sem letra. Pinta o bloco
+            # visível de uma vez, recorta as frestas com linhas de fundo e só
+            # então cobre as células destacadas (custo linhas + colunas)
+            espaco = passo - lado
+            esquerda, topo = x0 + c0 * passo, y0 + r0 * passo
+            largura, altura = (c1 - c0 + 1) * passo - espaco, (r1 - r0 + 1) * passo - espaco
+            painter.fillRect(esquerda, topo, largura, altura, self._cores[NORMAL][0])
+            for j in range(c0, c1):
+                painter.fillRect(x0 + j * passo + lado, topo, espaco, altura, self._cor_fundo)
+            for i in range(r0, r1):
+                painter.fillRect(esquerda, y0 + i * passo + lado, largura, espaco, self._cor_fundo)
+            for estado, celulas in ((DESCOBERTA, self._descobertas), (SELECIONADA, self._selecao),
+                                    (ENCONTRADA, self._encontradas)):
+                cor = self._cores[estado][0]
+                for i, j in celulas:
+                    if r0 <= i <= r1 and c0 <= j <= c1 and self._estado(i, j) == estado:
+                        painter.fillRect(x0 + j * passo, y0 + i * passo, lado, lado, cor)
+            # Células fora da máscara: uma faixa de fundo por trecho inativo da linha
+            if self._inativas:
+                for i in range(r0, r1 + 1):
+                    for j0, j1 in self._inativas[i]:
+                        if j1 >= c0 and j0 <= c1:
+                            painter.fillRect(x0 + j0 * passo, y0 + i * passo, (j1 - j0 + 1) * passo,
+                                             lado, self._cor_fundo)
+            return
+
+        # Uma cópia de pixmap por célula; só (letra, estado) novos são desenhados
+        atlas = self._atlas
+        atlas.preparar(lado, self.viewport().devicePixelRatioF(), self._zoom)
+        glifos = atlas.glifos
+        faltas = atlas.faltas
+        inativas = 0
+        for i in range(r0, r1 + 1):
+            y = y0 + i * passo
+            linha = self._matriz[i]
+            for j in range(c0, c1 + 1):
+                if linha[j] == INATIVA:
+                    inativas += 1  # Fora da máscara: fica o fundo (não conta no atlas)
+                    continue
+                chave = (linha[j], self._estado(i, j))
+                pixmap = glifos.get(chave)
+                if pixmap is None:
+                    pixmap = atlas.renderizar(chave)
+                painter.drawPixmap(x0 + j * passo, y, pixmap)
+        atlas.acertos += (r1 - r0 + 1) * (c1 - c0 + 1) - inativas - (atlas.faltas - faltas)
+
+    def _desenhar_instantaneo(self, painter):
+        """
+        Desenha a imagem capturada no início do redimensionamento, escalada
+        como o tabuleiro ficará (proporção entre o lado ajustado e o de
+        captura) e centralizada no viewport.
+        """
+        tamanho = self._instantaneo.deviceIndependentSize()
+        escala = self._celula_ajustada() / self._base_instantaneo
+        largura, altura = tamanho.width() * escala, tamanho.height() * escala
+        centro = self.viewport().rect().center()
+        painter.drawPixmap(
+            QRectF(centro.x() - largura / 2, centro.y() - altura / 2, largura, altura),
+            self._instantaneo, QRectF(self._instantaneo.rect()),
+        )
+
+    # ============================================================================
+    # REDIMENSIONAMENTO
+    # ============================================================================
+
+    def resizeEvent(self, event):
+        """
+        Antes de o tabuleiro aparecer, ou se a janela não mudou de tamanho,
+        reajusta na hora. Com a janela sendo redimensionada e o tabuleiro à
+        vista (redimensionamento ao vivo), captura uma imagem do tabuleiro no
+        primeiro evento e só a reescala nos seguintes; o reajuste real fica
+        para _fim_redimensionamento.
+        """
+        super().resizeEvent(event)
+        if self.size() == self._tamanho_visto:
+            # Só o viewport mudou (barra de rolagem apareceu/sumiu): o
+            # QAbstractScrollArea também repassa esse resize para cá
+            if self._instantaneo is None:
+                self._atualizar_barras()
+            return
+        self._tamanho_visto = self.size()
+        # Ao vivo = a janela mudou de tamanho com o tabuleiro à vista; mudanças
+        # internas de layout (ex.: nova partida) são aplicadas direto
+        janela = self.window().size()
+        ao_vivo = self._pintado and self.isVisible() and janela != self._janela_vista
+        self._janela_vista = janela
+        if self._instantaneo is None and not ao_vivo:
+            self._reajustar()
+            return
+        if self._instantaneo is None and not self._capturando:
+            # grab() entrega o resize pendente do viewport, que o
+            # QAbstractScrollArea repassa a este mesmo método
+            self._capturando = True
+            try:
+                self._instantaneo = self.viewport().grab()
+            finally:
+                self._capturando = False
+            self._base_instantaneo = self._celula_base
+        self._timer_resize.start()
+
+    def hideEvent(self, event):
+        """Ao voltar a aparecer, o primeiro resize (da pilha de telas) é aplicado direto."""
+        super().hideEvent(event)
+        self._pintado = False
+
+    def _fim_redimensionamento(self):
+        """Redimensionamento concluído: descarta a imagem e reajusta uma vez."""
+        self._instantaneo = None
+        self._reajustar()
+        self.viewport().update()
+
+    def _reajustar(self):
+        """Recalcula o lado das células e as barras, mantendo o centro visível no lugar."""
+        nova = self._celula_ajustada()
+        if nova == self._celula_base:
+            self._atualizar_barras()
+            return
+        centro = self.viewport().rect().center()
+        ponto = self._ponto_conteudo(centro)
+        self._celula_base = nova
+        self._restaurar_ancora(centro, ponto)
+
+    # ============================================================================
+    # MOUSE: SELEÇÃO, ROLAGEM AUTOMÁTICA, ARRASTO DO TABULEIRO E ZOOM
+    # ============================================================================
+
+    def mousePressEvent(self, event):
+        botao = event.button()
+        if botao == Qt.MouseButton.LeftButton:
+            celula = self.celula_em(event.position().toPoint())
+            if celula is not None:
+                self._ultima_pos = event.position().toPoint()
+                self._tela._start_selection(*celula)
+        elif botao in (Qt.MouseButton.RightButton, Qt.MouseButton.MiddleButton):
+            # Arrasta o tabuleiro (pan)
+            self._pan = (
+                event.position().toPoint(),
+                self.horizontalScrollBar().value(),
+                self.verticalScrollBar().value(),
+            )
+            self.viewport().setCursor(Qt.CursorShape.ClosedHandCursor)
+        event.accept()
+
+    def mouseMoveEvent(self, event):
+        pos = event.position().toPoint()
+        if self._pan is not None:
+            inicio, h, v = self._pan
+            self.horizontalScrollBar().setValue(h - (pos.x() - inicio.x()))
+            self.verticalScrollBar().setValue(v - (pos.y() - inicio.y()))
+            return
+        tela = self._tela
+        if tela._selecting:
+            tela._perf.eventos_arrasto += 1
+            self._ultima_pos = pos
+            self._selecionar_em(pos)
+            if self._velocidade_auto(pos) != (0, 0):
+                if not self._timer_auto.isActive():
+                    self._timer_auto.start()
+            else:
+                self._timer_auto.stop()
+
+    def mouseReleaseEvent(self, event):
+        botao = event.button()
+        if botao == Qt.MouseButton.LeftButton:
+            self._timer_auto.stop()
+            if self._tela._selecting:
+                self._tela._finalize_selection()
+        elif self._pan is not None and botao in (Qt.MouseButton.RightButton, Qt.MouseButton.MiddleButton):
+            self._pan = None
+            self.viewport().unsetCursor()
+        event.accept()
+
+    def wheelEvent(self, event):
+        """Ctrl + roda: zoom ancorado no cursor; sem Ctrl: rolagem normal."""
+        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            passos = event.angleDelta().y() / 120
+            if passos:
+                self.definir_zoom(self._zoom * self.PASSO_ZOOM ** passos, event.position().toPoint())
+            event.accept()
+            return
+        super().wheelEvent(event)
+
+    def _selecionar_em(self, pos):
+        """Atualiza a seleção até a célula sob (ou mais próxima de) pos."""
+        celula = self.celula_em(pos, limitar=True)
+        if celula is not None:
+            self._tela._update_selection(*celula)
+
+    def _velocidade_auto(self, pos):
+        """
+        Deslocamento por tick da rolagem automática, proporcional à
+        proximidade (ou distância além) da borda do viewport.
+        """
+        margem = self.MARGEM_AUTO_SCROLL
+        passo = self._lado() + self._espaco()
+        vp = self.viewport()
+
+        def eixo(coord, tamanho):
+            if coord < margem:
+                intensidade = (margem - coord) / margem
+                return -max(1, round(min(intensidade, 3.0) * passo / 2))
+            if coord > tamanho - margem:
+                intensidade = (coord - (tamanho - margem)) / margem
+                return max(1, round(min(intensidade, 3.0) * passo / 2))
+            return 0
+
+        return eixo(pos.x(), vp.width()), eixo(pos.y(), vp.height())
+
+    def _auto_scroll(self):
+        """Rola enquanto o arrasto está perto da borda e estende a seleção."""
+        if not self._tela._selecting or self._ultima_pos is None:
+            self._timer_auto.stop()
+            return
+        dx, dy = self._velocidade_auto(self._ultima_pos)
+        h = self.horizontalScrollBar()
+        v = self.verticalScrollBar()
+        antes = (h.value(), v.value())
+        h.setValue(h.value() + dx)
+        v.setValue(v.value() + dy)
+        if (h.value(), v.value()) == antes:
+            return  # Já na borda do tabuleiro
+        self._selecionar_em(self._ultima_pos)
@@ -5,29 +5,50 @@ Este é o ponto de entrada e controlador principal da aplicação.
 Responsável por:
 - Inicializar a aplicação PyQt6
 - Gerenciar o fluxo entre as diferentes telas (menu, dificuldade, jogo)
-- Manter referência à janela ativa para evitar que a app termine prematuramente
+- Manter a janela principal única, com as telas empilhadas e reaproveitadas
 - Implementar a lógica de negócio (callbacks dos botões)
 - Coordenar a comunicação entre os módulos de UI e game logic
 
 Arquitetura:
 - Usa padrão de injeção de dependência para separar UI da lógica
 - Cada tela recebe callbacks em vez de ter lógica acoplada
-- Controla o ciclo de vida das janelas (abrir/fechar/alternar)
+- Controla o ciclo de vida das telas (criar uma vez, alternar, recarregar partida)
 """
 
-from main_ui import MenuInicial
-from PyQt6.QtWidgets import QApplication
-from dificult.dificult_ui import DificultUI
-import dificult.dificult as dificult
+# Primeiro import: marca o instante zero do relatório de inicialização
+from utils import startup
 import sys
+import argparse
 from consts import log
 
+# PyQt6 e as telas são importados sob demanda (ver __main__ e callbacks abaixo)
+# para que a primeira janela apareça o quanto antes
+
 # ============================================================================
 # ESTADO GLOBAL DA APLICAÇÃO
 # ============================================================================
-# Mantém referência à janela atualmente ativa para evitar que o Qt termine
-# a aplicação quando uma janela é fechada (Qt termina quando não há janelas abertas)
-janela = None  # referência à janela principal ativa
+# Janela única da aplicação (JanelaPrincipal). As telas vivem dentro dela em
+# uma pilha e são reaproveitadas, em vez de fechar e recriar janelas.
+janela = None  # referência à janela principal (única)
+telas = {}     # telas já construídas: {"menu": ..., "dificuldade": ..., "jogo": ...}
+dificuldade_atual = None  # último código de dificuldade (para "jogar de novo")
+perfil = None  # perfilador ativo quando o jogo é iniciado com --profile
+watchdog = None  # detector de travamentos ativo quando iniciado com --watchdog
+dicionario = None  # léxico do modo descoberta livre (--dicionario)
+modo_mensagem = False  # modo mensagem secreta ligado (--mensagem)
+
+def marcar_tela(nome):
+    """
+    Informa ao perfilador (se ativo) qual tela passa a ser a atual.
+
+    Chamado antes de construir/exibir cada tela, para que o custo de
+    construção seja atribuído à tela nova no relatório do --profile.
+
+    Args:
+        nome (str): Nome da tela (MenuInicial, DificultUI, TelaJogo)
+    """
+    if perfil is not None:
+        perfil.marcar_tela(nome)
 
 # ============================================================================
 # CALLBACKS DE AÇÕES DOS BOTÕES (LÓGICA DE NEGÓCIO)
@@ -38,117 +59,120 @@ def bnt_jogar_clicado():
     Callback executado quando o botão "jogar" é clicado no menu principal.
     Inicia o fluxo de seleção de dificuldade e posterior início do jogo.
     Fluxo:
-    1. Cria e exibe a tela de seleção de dificuldade
+    1. Cria (apenas na primeira vez) a tela de seleção de dificuldade
     2. Define callbacks para cada nível de dificuldade
-    3. Fecha o menu principal e mantém referência da nova tela
+    3. Exibe a tela na janela principal
     """
     log("main", "botão jogar clicado")
-    global janela
+    marcar_tela("DificultUI")
     try:
-        # Função interna que será executada quando uma dificuldade for selecionada
-        def select_difficulty(d):
-            """
-            Callback interno para quando uma dificuldade é escolhida.
-            
-            Args:
-                d (int): Código da dificuldade (1=fácil, 2=médio, 3=difícil)
-            """
-            global janela  # Necessário para acessar e modificar a variável global
-            # Converter código de dificuldade em tamanho da matriz
-            size = dificult.bnt_dificult_escolhida(d)
-            log("main", f"Dificuldade {d} escolhida -> size={size}")
-            
-            # Tentar inicializar o jogo
-            try:
-                # Importações lazy para evitar dependências circulares
-                from game import game
-                from game.game_ui import TelaJogo
-                
-                # Gerar matriz do jogo com palavras posicionadas
-                matriz, posicoes = game.abrir_jogo(size)
-                log("main", f"Jogo iniciado com matriz {size}x{size}")
-
-                # Callback para retornar ao menu quando o jogo terminar
-                def voltar_menu():
-                    """
-                    Callback executado quando o jogo termina (vitória ou ESC).
-                    Fecha a tela do jogo e reabre o menu principal.
-                    """
-                    global janela
-                    try:
-                        # Fechar janela atual se existir
-                        if janela is not None:
-                            janela.close()
-                        
-                        # Recriar menu principal com os mesmos callbacks
-                        nova_menu = MenuInicial(
-                            jogar_cb=bnt_jogar_clicado,
-                            como_cb=bnt_como_clicar,
-                            sair_cb=bnt_sair_clicado,
-                        )
-                        nova_menu.show()
-                        janela = nova_menu
-                    except Exception as e:
-                        log("main", f"Erro ao voltar ao menu: {e}")
-
-                # Criar e exibir tela do jogo
-                jogo = TelaJogo(matriz, posicoes, on_finish=voltar_menu)
-                jogo.show()
-                
-                # Fechar tela de dificuldade e atualizar referência
-                if janela is not None:
-                    janela.close()
-                janela = jogo
-                return
-                
-            except Exception as e:
-                log("main", f"Erro ao iniciar jogo: {e}")
-                import traceback
-                traceback.print_exc()
-                # Se falhar, não fecha a janela atual para o usuário ver o erro
-
-        # Função para voltar ao menu principal a partir da tela de dificuldade
-        def voltar_ao_menu():
-            """Volta ao menu principal fechando a tela atual e criando nova instância do menu."""
-            global janela
-            try:
-                # Fechar janela atual (tela de dificuldade)
-                if janela is not None:
-                    janela.close()
-                
-                # Recriar menu principal com os mesmos callbacks
-                nova_menu = MenuInicial(
-                    jogar_cb=bnt_jogar_clicado,
-                    como_cb=bnt_como_clicar,
-                    sair_cb=bnt_sair_clicado,
-                )
-                nova_menu.show()
-                janela = nova_menu
-                log("main", "Retorno ao menu principal realizado com sucesso")
-            except Exception as e:
-                log("main", f"Erro ao voltar ao menu: {e}")
-        
-        # Criar tela de seleção de dificuldade com callbacks para cada opção
-        nova = DificultUI(
-            easy_cb=lambda: select_difficulty(1),    # Callback para fácil
-            medium_cb=lambda: select_difficulty(2),  # Callback para médio
-            hard_cb=lambda: select_difficulty(3),    # Callback para difícil
-            back_cb=voltar_ao_menu,                 # Callback para voltar ao menu
-        )
-        nova.show()
-
-        # Fechar menu principal e atualizar referência global
-        if janela is not None:
-            janela.close()
-        janela = nova
+        tela = telas.get("dificuldade")
+        if tela is None:
+            # Importação lazy: a tela de dificuldade não é necessária para o menu
+            from dificult.dificult_ui import DificultUI
+
+            # Criar tela de seleção de dificuldade com callbacks para cada opção
+            tela = DificultUI(
+                easy_cb=lambda: select_difficulty(1),    # Callback para fácil
+                medium_cb=lambda: select_difficulty(2),  # Callback para médio
+                hard_cb=lambda: select_difficulty(3),    # Callback para difícil
+                marathon_cb=lambda: select_difficulty(4),  # Callback para maratona
+                back_cb=voltar_menu,                     # Callback para voltar ao menu
+            )
+            telas["dificuldade"] = tela
+        janela.mostrar_tela(tela)
 
     except Exception as e:
         log("main", f"falha ao abrir DificultUI: {e}")
 
+def select_difficulty(d):
+    """
+    Callback para quando uma dificuldade é escolhida.
+
+    Exibe a TelaJogo na hora, no estado "carregando", e deixa a geração e a
+    montagem da partida para as próximas iterações do loop de eventos
+    (TelaJogo.carregar_em_etapas): o clique responde já no frame seguinte.
+    A TelaJogo é criada uma única vez; nas partidas seguintes a nova matriz
+    é carregada na tela existente, reaproveitando tabuleiro e dicas.
+
+    Args:
+        d (int): Código da dificuldade (1=fácil, 2=médio, 3=difícil, 4=maratona)
+    """
+    global dificuldade_atual
+    import dificult.dificult as dificult
+
+    # Converter código de dificuldade em tamanho da matriz
+    perfil_dif = dificult.bnt_dificult_escolhida(d)
+    dificuldade_atual = d
+    log("main", f"Dificuldade {d} escolhida -> {perfil_dif.linhas}x{perfil_dif.colunas}")
+    marcar_tela("TelaJogo")
+    
+    # Tentar inicializar o jogo
+    try:
+        # Importações lazy para evitar dependências circulares
+        from game.game_ui import TelaJogo
+
+        jogo = telas.get("jogo")
+        if jogo is None:
+            # Primeira partida: criar a tela do jogo (só o esqueleto)
+            jogo = TelaJogo(on_finish=voltar_menu, on_replay=jogar_novamente, dicionario=dicionario,
+                            modo_mensagem=modo_mensagem)
+            telas["jogo"] = jogo
+        janela.mostrar_tela(jogo)
+        jogo.carregar_em_etapas(lambda: gerar_partida(perfil_dif))
+        
+    except Exception as e:
+        log("main", f"Erro ao iniciar jogo: {e}")
+        import traceback
+        traceback.print_exc()
+        # Se falhar, mantém a tela atual para o usuário ver o erro
+
+def gerar_partida(perfil_dif):
+    """
+    Etapa de geração usada por TelaJogo.carregar_em_etapas.
+
+    Args:
+        perfil_dif (dificult.Perfil): Perfil da dificuldade (tamanho, palavras,
+                                      direções, pontuação alvo...)
+
+    Returns:
+        tuple | None: (matriz, posicoes, tempo_geracao_ms, mensagem), ou None
+                      se a geração falhar (a tela mostra o erro; ESC volta ao
+                      menu); mensagem é a frase secreta escondida na partida
+                      (--mensagem) ou None
+    """
+    try:
+        from game import game
+        matriz, posicoes = game.abrir_jogo(perfil_dif)
+        log("main", f"Jogo iniciado com matriz {perfil_dif.linhas}x{perfil_dif.colunas}")
+        return matriz, posicoes, game.tempo_geracao_ms, game.frase_partida
+    except Exception as e:
+        log("main", f"Erro ao gerar jogo: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+
+def jogar_novamente():
+    """Callback do botão "jogar de novo" da vitória: nova partida, mesma dificuldade."""
+    log("main", "jogar de novo")
+    select_difficulty(dificuldade_atual)
+
+def voltar_menu():
+    """
+    Callback executado quando o jogo termina (vitória ou ESC) ou quando
+    "Voltar" é clicado na tela de dificuldade. Apenas exibe o menu existente.
+    """
+    marcar_tela("MenuInicial")
+    try:
+        janela.mostrar_tela(telas["menu"])
+        log("main", "Retorno ao menu principal realizado com sucesso")
+    except Exception as e:
+        log("main", f"Erro ao voltar ao menu: {e}")
+
 def bnt_como_clicar():
     """
     Callback executado quando o botão "como jogar?" é clicado.
-    Delega para a janela atual mostrar o popup de instruções.
+    Delega para a tela atual mostrar o popup de instruções.
     """
     log("main", "botão como jogar clicado")
     global janela
@@ -178,23 +202,173 @@ def atalho_menu():
     else:
         log("main", "janela principal não está aberta.")
 
-# ============================================================================
-# PONTO DE ENTRADA DA APLICAÇÃO
-# ============================================================================
-if __name__ == "__main__":
-    # Criar aplicação Qt
-    app = QApplication(sys.argv)
-    
-    # Criar janela principal do menu com injeção de callbacks
+def criar_janela_principal():
+    """
+    Cria a janela principal única com o menu inicial já exibido.
+
+    Usado pelo ponto de entrada e pelo teste de memória (soak_memoria.py).
+    Requer uma QApplication existente.
+
+    Returns:
+        JanelaPrincipal: Janela criada (ainda não exibida)
+    """
+    global janela
+    from main_ui import MenuInicial, JanelaPrincipal
+
+    # Criar a janela principal e o menu com injeção de callbacks
     # Isso separa a UI da lógica - a UI não sabe o que fazer, apenas chama os callbacks
-    janela = MenuInicial(
+    marcar_tela("MenuInicial")
+    janela = JanelaPrincipal()
+    telas.clear()
+    telas["menu"] = MenuInicial(
         jogar_cb=bnt_jogar_clicado,   # O que fazer quando "jogar" for clicado
         como_cb=bnt_como_clicar,     # O que fazer quando "como jogar" for clicado
         sair_cb=bnt_sair_clicado,    # O que fazer quando "sair" for clicado
     )
+    janela.mostrar_tela(telas["menu"])
+    return janela
+
+def ler_argumentos(argv):
+    """
+    Lê as opções de linha de comando do jogo.
+
+    Argumentos desconhecidos são ignorados aqui e repassados ao Qt
+    (ex: -platform, -style).
+
+    Args:
+        argv (list): Argumentos da linha de comando (sem o nome do programa)
+
+    Returns:
+        tuple: (opcoes, argumentos_restantes)
+    """
+    parser = argparse.ArgumentParser(prog="CacaPalavras", add_help=True)
+    parser.add_argument(
+        "--profile", nargs="?", const="det", default=None, choices=("det", "sample"),
+        help="perfila o jogo (det=cProfile, sample=amostragem) e grava os relatórios ao sair",
+    )
+    parser.add_argument(
+        "--watchdog", nargs="?", const=50, default=None, type=int, metavar="MS",
+        help="registra a pilha da thread principal em travamentos acima de MS milissegundos (padrão: 50)",
+    )
+    parser.add_argument(
+        "--cache", nargs="?", const="", default=None, metavar="PASTA",
+        help="guarda os tabuleiros gerados em disco e os reaproveita nas próximas execuções "
+             "(padrão: cache_tabuleiros ao lado do executável)",
+    )
+    parser.add_argument(
+        "--cache-mb", type=float, default=None, metavar="MB",
+        help="tamanho máximo do cache de tabuleiros (padrão: 64)",
+    )
+    parser.add_argument(
+        "--sementes", type=int, default=None, metavar="N",
+        help="tabuleiros diferentes por dificuldade com o cache ligado (padrão: 256)",
+    )
+    parser.add_argument(
+        "--servidor", nargs="?", const="", default=None, metavar="ENDERECO",
+        help="busca as partidas no servidor_tabuleiros.py (host:porta ou unix:/caminho; "
+             "padrão: 127.0.0.1:47321); se ele não responder, gera no próprio jogo",
+    )
+    parser.add_argument(
+        "--mascara", default=None, metavar="NOME",
+        help="formato dos tabuleiros de todas as dificuldades (circulo, anel, coracao ou "
+             "um desenho de data/mascaras.json)",
+    )
+    parser.add_argument(
+        "--dicionario", nargs="?", const="", default=None, metavar="ARQUIVO",
+        help="modo descoberta livre: qualquer palavra do dicionário traçada na grade conta "
+             "(ARQUIVO compilado com python -m game.lexico; padrão: o banco de palavras)",
+    )
+    parser.add_argument(
+        "--mensagem", default=None, metavar="FRASE",
+        help="modo mensagem secreta: as letras que sobram na grade, lidas em ordem, formam "
+             "FRASE, revelada no fim da partida (tabuleiros em que ela não cabe saem comuns)",
+    )
+    return parser.parse_known_args(argv)
+
+# ============================================================================
+# PONTO DE ENTRADA DA APLICAÇÃO
+# ============================================================================
+if __name__ == "__main__":
+    # Executável do PyInstaller: os processos da geração em ladrilhos
+    # (game/ladrilhos.py) reentram por aqui e precisam parar neste ponto
+    import multiprocessing
+    multiprocessing.freeze_support()
+    opcoes, argv_qt = ler_argumentos(sys.argv[1:])
+
+    # Ligar o perfilador antes de qualquer trabalho do Qt, se solicitado
+    if opcoes.profile:
+        from utils.profiler import iniciar_perfil
+        perfil = iniciar_perfil(opcoes.profile)
+
+    # Criar aplicação Qt (primeiro import do PyQt6 no caminho de inicialização)
+    from PyQt6.QtWidgets import QApplication
+    startup.marcar("import PyQt6")
+    app = QApplication(sys.argv[:1] + argv_qt)
+    startup.marcar("QApplication")
+
+    # Ligar o detector de travamentos (precisa da QApplication para o timer)
+    if opcoes.watchdog is not None:
+        from utils.watchdog import iniciar_watchdog
+        watchdog = iniciar_watchdog(opcoes.watchdog)
+
+    # Formato temático dos tabuleiros (antes da pré-carga, que monta as tabelas dos perfis)
+    if opcoes.mascara is not None:
+        import dificult.dificult as dificult
+        try:
+            dificult.usar_mascara(opcoes.mascara)
+        except ValueError as e:
+            log("main", f"{e}; tabuleiros retangulares")
+
+    # Cache de tabuleiros em disco (quiosques): partidas já geradas não são geradas de novo
+    if opcoes.cache is not None:
+        from game import game
+        game.usar_cache(opcoes.cache or None, opcoes.cache_mb, opcoes.sementes)
+
+    # Servidor de tabuleiros compartilhado pelos quiosques da mesma máquina
+    if opcoes.servidor is not None:
+        from game import game
+        game.usar_servidor(opcoes.servidor or None)
+
+    # Modo mensagem secreta: a frase vai para as células que nenhuma palavra ocupa
+    if opcoes.mensagem is not None:
+        from game import game
+        try:
+            game.usar_mensagem(opcoes.mensagem)
+            modo_mensagem = True
+        except ValueError as e:
+            log("main", f"{e}; modo mensagem secreta desligado")
+
+    # Modo descoberta livre: o léxico é mapeado do disco (ou montado do banco)
+    if opcoes.dicionario is not None:
+        from game.lexico import Lexico
+        try:
+            dicionario = Lexico.abrir(opcoes.dicionario) if opcoes.dicionario else Lexico.do_banco()
+            log("main", f"Modo descoberta livre: {dicionario}")
+        except (OSError, ValueError) as e:
+            log("main", f"Dicionário indisponível ({e}); modo descoberta desligado")
+
+    # Mostrar o splash imediatamente e ler fonte/palavras em segundo plano
+    from utils.ui import mostrar_splash
+    from utils import recursos
+    splash = mostrar_splash()
+    startup.marcar("splash")
+    recursos.pre_carregar()
+
+    # Somente o módulo do menu é importado agora; dificuldade e jogo ficam
+    # para quando o jogador clicar em "jogar"
+    import main_ui
+    startup.marcar("import menu")
+    recursos.registrar_fonte()
+    startup.marcar("fonte registrada")
+    
+    # Criar a janela principal com o menu
+    criar_janela_principal()
+    startup.marcar("menu construido")
     
-    # Exibir a janela principal
+    # Exibir a janela principal e registrar o tempo até o primeiro frame
+    startup.relatar_quando_visivel(telas["menu"])
     janela.show()
+    splash.close()
     
     # Iniciar loop de eventos do Qt e sair quando a aplicação terminar
-    sys.exit(app.exec())
\ No newline at end of file
+    sys.exit(app.exec())
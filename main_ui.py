@@ -8,6 +8,7 @@ Responsável por:
 - Mostrar popup de instruções do jogo
 - Aplicar tema visual consistente (fundo escuro, fonte pixel)
 - Implementar padrão de injeção de dependência para callbacks
+- Definir a janela principal única (JanelaPrincipal) que empilha as telas
 
 Características visuais:
 - Fundo escuro (#111018) para tema "gaming"
@@ -16,12 +17,12 @@ Características visuais:
 - Layout responsivo com centralização vertical
 """
 
-from PyQt6.QtWidgets import (QWidget, QLabel, QVBoxLayout, QMessageBox)
-from PyQt6.QtGui import QFontDatabase, QFont
+from PyQt6.QtWidgets import (QWidget, QLabel, QVBoxLayout, QMessageBox, QStackedLayout)
 from PyQt6.QtCore import Qt
 import consts as c
 from textwrap import dedent
 from utils.ui import criar_botao
+from utils import recursos
 
 class MenuInicial(QWidget):
     """
@@ -55,16 +56,16 @@ class MenuInicial(QWidget):
         # CONFIGURAÇÃO DA JANELA
         # ============================================================================
         self.setWindowTitle("Caça Palavras")
-        self.setFixedSize(1280, 720)  # Tamanho fixo para consistência visual
-        self.setStyleSheet("background-color: #111018;")  # Fundo escuro tema gaming
+        self.setMinimumSize(c.JANELA_LARGURA_MIN, c.JANELA_ALTURA_MIN)  # Layout centralizado se adapta ao tamanho
+        self.setStyleSheet(recursos.estilo("fundo"))  # Fundo escuro tema gaming
 
         # ============================================================================
         # CARREGAMENTO E CONFIGURAÇÃO DAS FONTES
         # ============================================================================
         # Carregar fonte pixel "Press Start 2P" para estética retrô de videogame
-        QFontDatabase.addApplicationFont(c.FONT_PATH)
-        font_pixel_big = QFont("Press Start 2P", c.FONT_PIXEL_BIG_SIZE)  # Para títulos
-        font_pixel = QFont("Press Start 2P", c.FONT_PIXEL_SIZE)          # Para textos
+        # (registro único e QFont compartilhadas pelo registro de recursos)
+        font_pixel_big = recursos.fonte(c.FONT_PIXEL_BIG_SIZE)  # Para títulos
+        font_pixel = recursos.fonte(c.FONT_PIXEL_SIZE)          # Para textos
 
         # ============================================================================
         # ESTRUTURA DE LAYOUT
@@ -87,14 +88,14 @@ class MenuInicial(QWidget):
         # Título principal do jogo
         titulo = QLabel("caça palavras")
         titulo.setFont(font_pixel_big)
-        titulo.setStyleSheet("color: white")
+        titulo.setStyleSheet(recursos.estilo("texto_branco"))
         titulo.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(titulo)
 
         # Texto de instrução sobre atalhos
         desc = QLabel("pressione c para ver os atalhos")
         desc.setFont(font_pixel)
-        desc.setStyleSheet("color: white")
+        desc.setStyleSheet(recursos.estilo("texto_branco"))
         desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(desc)
 
@@ -163,30 +164,7 @@ class MenuInicial(QWidget):
         popup.setIcon(QMessageBox.Icon.Information)
 
         # Aplicar estilo consistente com o tema do jogo
-        popup.setStyleSheet("""
-            QMessageBox {
-                background-color: #111018;  /* Fundo escuro */
-            }
-            QMessageBox QLabel {
-                color: white;               /* Texto branco */
-                font-family: 'Press Start 2P';  /* Fonte pixel */
-                font-size: 14px;
-            }
-            QLabel {
-                color: white;
-                font-family: 'Press Start 2P';
-            }
-            QPushButton {
-                background-color: #ff8c00;  /* Botão laranja */
-                color: black;
-                border-radius: 10px;
-                padding: 8px 16px;
-                font-family: 'Press Start 2P';
-            }
-            QPushButton:hover {
-                background-color: #ffa733;  /* Hover laranja claro */
-            }
-        """)
+        popup.setStyleSheet(recursos.estilo("popup_como_jogar"))
 
         popup.exec()
 
@@ -227,3 +205,64 @@ class MenuInicial(QWidget):
             # Delegar outros eventos para o comportamento padrão
             super().keyPressEvent(event)
 
+
+class JanelaPrincipal(QWidget):
+    """
+    Janela única da aplicação, que hospeda as telas em uma pilha (QStackedLayout).
+    
+    As telas (MenuInicial, DificultUI, TelaJogo) são criadas uma vez e apenas
+    alternadas; trocar de tela não fecha nem recria janelas.
+    """
+
+    def __init__(self):
+        """Inicializa a janela vazia; as telas são adicionadas por mostrar_tela()."""
+        super().__init__()
+        self.setWindowTitle("Caça Palavras")
+        # Redimensionável: as telas acompanham o tamanho pela pilha
+        self.setMinimumSize(c.JANELA_LARGURA_MIN, c.JANELA_ALTURA_MIN)
+        self.resize(c.JANELA_LARGURA, c.JANELA_ALTURA)
+
+        self._pilha = QStackedLayout(self)
+        self._pilha.setContentsMargins(0, 0, 0, 0)
+        self._pilha.currentChanged.connect(self._tela_trocada)
+
+    def mostrar_tela(self, tela):
+        """
+        Exibe uma tela, adicionando-a à pilha na primeira vez.
+        
+        Args:
+            tela (QWidget): Tela a ser exibida
+        """
+        if self._pilha.indexOf(tela) == -1:
+            self._pilha.addWidget(tela)
+        self._pilha.setCurrentWidget(tela)
+        tela.setFocus()  # Atalhos de teclado vão para a tela visível
+
+    def remover_tela(self, tela):
+        """
+        Retira uma tela da pilha e agenda sua destruição.
+        
+        Args:
+            tela (QWidget): Tela a ser descartada
+        """
+        self._pilha.removeWidget(tela)
+        tela.deleteLater()
+
+    def tela_atual(self):
+        """
+        Returns:
+            QWidget: Tela atualmente visível (ou None)
+        """
+        return self._pilha.currentWidget()
+
+    def show_como_jogar(self):
+        """Delega o popup "Como Jogar" para a tela visível."""
+        tela = self.tela_atual()
+        if tela is not None and hasattr(tela, "show_como_jogar"):
+            tela.show_como_jogar()
+
+    def _tela_trocada(self, indice):
+        """Usa o título da tela visível como título da janela."""
+        tela = self._pilha.widget(indice)
+        if tela is not None:
+            self.setWindowTitle(tela.windowTitle())
@@ -0,0 +1,315 @@
+"""
+Servidor local de tabuleiros: um processo gera as partidas de vários quiosques.
+
+O servidor atende em um socket Unix ou TCP local (asyncio) e mantém, por
+dificuldade, uma fila de partidas prontas. As partidas são geradas em lotes
+por um pool de processos (game.abrir_jogo com os perfis de
+data/dificuldades.json) e já saem dos processos codificadas em JSON, então
+o loop de eventos só copia bytes. Um pedido é atendido na hora se a fila
+da dificuldade tem partida; senão espera a próxima que ficar pronta.
+
+Protocolo: quadros de 4 bytes de tamanho + JSON (ver game/rede_tabuleiros.py).
+O jogo usa o servidor com `python main.py --servidor [ENDERECO]` e gera a
+partida sozinho se o servidor não responder.
+
+O comando "carga" abre várias conexões simultâneas pedindo partidas sem
+parar e imprime pedidos/s e os percentis de latência.
+
+    python servidor_tabuleiros.py servir
+    python servidor_tabuleiros.py servir --endereco unix:/tmp/tabuleiros.sock --processos 4 --fila 16
+    python servidor_tabuleiros.py carga --conexoes 16 --pedidos 200 --dificuldades 1 2 3
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import consts
+from dificult import dificult
+from game import game, rede_tabuleiros
+from simulador import percentil
+
+FILA_PADRAO = 8   # Partidas prontas mantidas por dificuldade
+LOTE_PADRAO = 4   # Partidas geradas por chamada a um processo (divide o custo da troca de mensagens)
+ESPERA_ERRO_S = 1.0  # Pausa antes de tentar de novo quando a geração falha
+
+
+# ============================================================================
+# PROCESSOS GERADORES
+# ============================================================================
+
+def _iniciar_processo(caminho_banco):
+    """Prepara um processo do pool: sem log, com o banco escolhido e as tabelas prontas."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C encerra só o processo principal
+    consts.log_ativo = False
+    if caminho_banco:
+        game.usar_banco(caminho_banco)
+    game.preparar_perfis(dificult.carregar_perfis().values())
+
+
+def _gerar_lote(codigo, quantidade):
+    """
+    Gera partidas de uma dificuldade (executado nos processos do pool).
+
+    Args:
+        codigo (int): Código da dificuldade
+        quantidade (int): Partidas a gerar
+
+    Returns:
+        list: Cada partida como JSON em bytes (game.exportar_partida)
+    """
+    perfil = dificult.perfil(codigo)
+    partidas = []
+    for _ in range(quantidade):
+        game.abrir_jogo(perfil)
+        partidas.append(json.dumps(game.exportar_partida(), ensure_ascii=False,
+                                   separators=(",", ":")).encode("utf-8"))
+    return partidas
+
+
+# ============================================================================
+# SERVIDOR
+# ============================================================================
+
+class ServidorTabuleiros:
+    """
+    Filas de partidas prontas por dificuldade, abastecidas pelo pool.
+    """
+
+    __slots__ = ("executor", "lote", "filas", "atendidos", "esperas", "_em_producao", "_consumo")
+
+    def __init__(self, codigos, executor, tamanho_fila=FILA_PADRAO, lote=LOTE_PADRAO):
+        """
+        Args:
+            codigos (iterable): Códigos das dificuldades servidas
+            executor (ProcessPoolExecutor): Pool que gera as partidas
+            tamanho_fila (int): Partidas prontas mantidas por dificuldade
+            lote (int): Partidas por chamada a um processo
+        """
+        self.executor = executor
+        self.lote = max(1, lote)
+        self.filas = {codigo: asyncio.Queue(max(1, tamanho_fila)) for codigo in codigos}
+        self.atendidos = dict.fromkeys(self.filas, 0)
+        self.esperas = dict.fromkeys(self.filas, 0)  # Pedidos que acharam a fila vazia
+        self._em_producao = dict.fromkeys(self.filas, 0)
+        self._consumo = {codigo: asyncio.Event() for codigo in self.filas}
+
+    def abastecer(self):
+        """
+        Inicia o abastecimento das filas (chamar com o loop de eventos rodando).
+
+        Returns:
+            list: Tarefas de abastecimento (uma por dificuldade)
+        """
+        return [asyncio.create_task(self._abastecer(codigo)) for codigo in self.filas]
+
+    async def _abastecer(self, codigo):
+        """Mantém a fila cheia: encomenda lotes até cobrir o que falta, e espera consumo."""
+        fila, consumo = self.filas[codigo], self._consumo[codigo]
+        while True:
+            falta = fila.maxsize - fila.qsize() - self._em_producao[codigo]
+            if falta <= 0:
+                await consumo.wait()
+                consumo.clear()
+                continue
+            quantidade = min(self.lote, falta)
+            self._em_producao[codigo] += quantidade
+            asyncio.create_task(self._produzir(codigo, quantidade))
+
+    async def _produzir(self, codigo, quantidade):
+        """Gera um lote no pool e coloca as partidas na fila."""
+        try:
+            partidas = await asyncio.get_running_loop().run_in_executor(
+                self.executor, _gerar_lote, codigo, quantidade
+            )
+        except Exception as e:
+            consts.log("servidor", f"Falha ao gerar partidas da dificuldade {codigo}: {e!r}")
+            await asyncio.sleep(ESPERA_ERRO_S)
+            partidas = []
+        self._em_producao[codigo] -= quantidade
+        for partida in partidas:
+            self.filas[codigo].put_nowait(partida)
+        if len(partidas) < quantidade:
+            self._consumo[codigo].set()  # O que faltou volta a ser encomendado
+
+    async def atender(self, leitor, escritor):
+        """Atende uma conexão: um pedido por quadro, até o cliente fechar."""
+        try:
+            while True:
+                try:
+                    cabecalho = await leitor.readexactly(rede_tabuleiros.CABECALHO.size)
+                except asyncio.IncompleteReadError:
+                    break  # Cliente fechou a conexão
+                pedido = json.loads(await leitor.readexactly(rede_tabuleiros.tamanho_quadro(cabecalho)))
+                escritor.write(rede_tabuleiros.quadro(await self._responder(pedido)))
+                await escritor.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+            consts.log("servidor", f"Conexão encerrada: {e!r}")
+        finally:
+            escritor.close()
+
+    async def _responder(self, pedido):
+        """
+        Corpo da resposta a um pedido.
+
+        Returns:
+            bytes | dict: Partida pronta (JSON já codificado) ou o erro
+        """
+        codigo = pedido.get("dificuldade") if isinstance(pedido, dict) else None
+        fila = self.filas.get(codigo)
+        if fila is None:
+            return {"ok": False, "erro": f"dificuldade desconhecida: {codigo!r}"}
+        if fila.empty():
+            self.esperas[codigo] += 1
+        partida = await fila.get()
+        self._consumo[codigo].set()
+        self.atendidos[codigo] += 1
+        return b'{"ok":true,"partida":' + partida + b"}"
+
+
+async def servir(endereco, processos, tamanho_fila, lote, caminho_banco):
+    """
+    Sobe o servidor e atende até ser interrompido (Ctrl+C ou SIGTERM).
+
+    Args:
+        endereco (str): "host:porta" ou "unix:/caminho"
+        processos (int): Processos geradores
+        tamanho_fila (int): Partidas prontas por dificuldade
+        lote (int): Partidas por chamada a um processo
+        caminho_banco (str | None): JSON de palavras (padrão: data/palavras.json)
+    """
+    tipo, destino = rede_tabuleiros.ler_endereco(endereco)
+    codigos = sorted(dificult.carregar_perfis())
+    with ProcessPoolExecutor(processos, initializer=_iniciar_processo, initargs=(caminho_banco,)) as executor:
+        servidor = ServidorTabuleiros(codigos, executor, tamanho_fila, lote)
+        if tipo == "unix":
+            if os.path.exists(destino):
+                os.remove(destino)  # Socket de uma execução anterior
+            rede = await asyncio.start_unix_server(servidor.atender, path=destino)
+        else:
+            rede = await asyncio.start_server(servidor.atender, *destino)
+        tarefas = servidor.abastecer()
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        except NotImplementedError:
+            pass  # Windows: só Ctrl+C
+        print(f"Servindo dificuldades {codigos} em {endereco} "
+              f"({processos} processos, fila {tamanho_fila}, lote {lote})")
+        try:
+            async with rede:
+                await rede.serve_forever()
+        finally:
+            for tarefa in tarefas:
+                tarefa.cancel()
+            if tipo == "unix" and os.path.exists(destino):
+                os.remove(destino)
+            for codigo in codigos:
+                print(f"  dificuldade {codigo}: {servidor.atendidos[codigo]} atendidos, "
+                      f"{servidor.esperas[codigo]} esperaram a geração")
+
+
+# ============================================================================
+# GERADOR DE CARGA
+# ============================================================================
+
+async def _cliente_carga(endereco, dificuldades, pedidos, latencias, rng):
+    """Uma conexão pedindo partidas em sequência; anota a latência de cada pedido."""
+    tipo, destino = rede_tabuleiros.ler_endereco(endereco)
+    if tipo == "unix":
+        leitor, escritor = await asyncio.open_unix_connection(destino)
+    else:
+        leitor, escritor = await asyncio.open_connection(*destino)
+    erros = 0
+    try:
+        for _ in range(pedidos):
+            inicio = time.perf_counter()
+            escritor.write(rede_tabuleiros.quadro({"dificuldade": rng.choice(dificuldades)}))
+            await escritor.drain()
+            cabecalho = await leitor.readexactly(rede_tabuleiros.CABECALHO.size)
+            corpo = await leitor.readexactly(rede_tabuleiros.tamanho_quadro(cabecalho))
+            latencias.append(time.perf_counter() - inicio)
+            if not corpo.startswith(b'{"ok":true'):
+                erros += 1
+    finally:
+        escritor.close()
+    return erros
+
+
+async def carga(endereco, conexoes, pedidos, dificuldades, semente):
+    """
+    Mede o servidor com várias conexões simultâneas e imprime o relatório.
+
+    Args:
+        endereco (str): Endereço do servidor
+        conexoes (int): Conexões simultâneas
+        pedidos (int): Pedidos por conexão
+        dificuldades (list): Códigos sorteados a cada pedido
+        semente (int | None): Semente do sorteio das dificuldades
+    """
+    rng = random.Random(semente)
+    latencias = []
+    inicio = time.perf_counter()
+    erros = await asyncio.gather(*(
+        _cliente_carga(endereco, dificuldades, pedidos, latencias, random.Random(rng.random()))
+        for _ in range(conexoes)
+    ))
+    duracao = time.perf_counter() - inicio
+    latencias.sort()
+    print(f"{len(latencias)} pedidos em {duracao:.2f} s: {len(latencias) / duracao:.0f} pedidos/s "
+          f"({conexoes} conexões, dificuldades {dificuldades}, {sum(erros)} erros)")
+    if latencias:
+        faixas = "  ".join(f"p{p:g} {percentil(latencias, p) * 1000:.2f}" for p in (50, 90, 99, 99.9))
+        print(f"  latência (ms): {faixas}  máx {latencias[-1] * 1000:.2f}")
+
+
+# ============================================================================
+# LINHA DE COMANDO
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor local de tabuleiros e gerador de carga")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    p_servir = comandos.add_parser("servir", help="sobe o servidor")
+    p_servir.add_argument("--endereco", default=consts.SERVIDOR_TABULEIROS,
+                          help=f"host:porta ou unix:/caminho (padrão: {consts.SERVIDOR_TABULEIROS})")
+    p_servir.add_argument("--processos", type=int, default=os.cpu_count() or 1,
+                          help="processos geradores (padrão: todos os núcleos)")
+    p_servir.add_argument("--fila", type=int, default=FILA_PADRAO,
+                          help=f"partidas prontas por dificuldade (padrão: {FILA_PADRAO})")
+    p_servir.add_argument("--lote", type=int, default=LOTE_PADRAO,
+                          help=f"partidas por chamada a um processo (padrão: {LOTE_PADRAO})")
+    p_servir.add_argument("--banco", default=None,
+                          help="JSON de palavras alternativo (mesmo formato do data/palavras.json)")
+
+    p_carga = comandos.add_parser("carga", help="mede pedidos/s e latência de um servidor no ar")
+    p_carga.add_argument("--endereco", default=consts.SERVIDOR_TABULEIROS,
+                         help=f"endereço do servidor (padrão: {consts.SERVIDOR_TABULEIROS})")
+    p_carga.add_argument("--conexoes", type=int, default=8, help="conexões simultâneas (padrão: 8)")
+    p_carga.add_argument("--pedidos", type=int, default=200, help="pedidos por conexão (padrão: 200)")
+    p_carga.add_argument("--dificuldades", type=int, nargs="+", default=[1, 2, 3],
+                         help="dificuldades pedidas, sorteadas a cada pedido (padrão: 1 2 3)")
+    p_carga.add_argument("--semente", type=int, default=None, help="semente do sorteio")
+    args = parser.parse_args()
+
+    consts.log_ativo = False
+    try:
+        if args.comando == "servir":
+            asyncio.run(servir(args.endereco, args.processos, args.fila, args.lote, args.banco))
+        else:
+            asyncio.run(carga(args.endereco, args.conexoes, args.pedidos, args.dificuldades, args.semente))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    except OSError as e:
+        print(f"erro: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,312 @@
+"""
+Simulador de partidas (Monte Carlo) para calibrar dificuldades e bancos de palavras.
+
+Gera tabuleiros com game.gerar e os joga sem interface com robôs de
+estratégia configurável, validando cada seleção pela SessaoJogo (as mesmas
+regras da TelaJogo). As partidas são distribuídas em um pool de processos e,
+no final, são impressas as distribuições de tempo de resolução por tamanho
+de tabuleiro e estratégia, e o tempo até achar cada palavra por tamanho da
+palavra.
+
+O tempo é medido em "passos" do robô, não em segundos:
+- 1 passo por célula lida durante a varredura
+- 1 passo por letra comparada ao tentar casar uma palavra a partir da célula
+- CUSTO_SELECAO passos por arrasto (certo ou errado)
+
+Estratégias no formato varredura:dicas:erro
+- varredura: linhas | colunas | aleatoria (ordem em que as células são lidas)
+- dicas: todas (lê todas as dicas e procura todas as palavras de uma vez),
+  demanda (lê uma dica, varre até achar a palavra, lê a próxima) ou
+  nenhuma (não lê dicas: procura qualquer palavra do banco)
+- erro: probabilidade de cada arrasto sair uma célula curto (0 a 1)
+
+    python simulador.py
+    python simulador.py --partidas 5000 --tamanhos 12 15 20 --estrategias linhas:todas:0 aleatoria:demanda:0.1
+    python simulador.py --banco novo_banco.json --processos 8
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from multiprocessing import Pool
+
+import consts
+from game import game
+from game.sessao import SessaoJogo, EVENTO_ENCONTRADA
+
+CUSTO_SELECAO = 20              # Passos gastos por arrasto (mover o mouse até o fim e soltar)
+VARREDURAS_SEM_PROGRESSO = 2    # Varreduras completas sem achar nada antes de o robô desistir
+ESTRATEGIAS_PADRAO = ("linhas:todas:0", "aleatoria:demanda:0.1", "linhas:nenhuma:0.05")
+VARREDURAS = ("linhas", "colunas", "aleatoria")
+MODOS_DICAS = ("todas", "demanda", "nenhuma")
+DIRECOES = ((0, 1), (1, 0), (1, 1), (-1, 1), (0, -1), (-1, 0), (-1, -1), (1, -1))
+
+_banco = []  # Textos das palavras do banco (por processo, definido em _iniciar_processo)
+
+
+class Estrategia:
+    """
+    Parâmetros de um robô jogador.
+    """
+
+    __slots__ = ("nome", "varredura", "dicas", "erro")
+
+    def __init__(self, texto):
+        """
+        Args:
+            texto (str): "varredura:dicas:erro" (ver docstring do módulo)
+
+        Raises:
+            ValueError: Se o texto não estiver no formato esperado
+        """
+        partes = texto.split(":")
+        if len(partes) != 3 or partes[0] not in VARREDURAS or partes[1] not in MODOS_DICAS:
+            raise ValueError(f"estratégia inválida: {texto!r}")
+        self.nome = texto
+        self.varredura, self.dicas = partes[0], partes[1]
+        self.erro = float(partes[2])
+        if not 0.0 <= self.erro < 1.0:
+            raise ValueError(f"erro fora de [0, 1): {texto!r}")
+
+
+# ============================================================================
+# ROBÔ JOGADOR
+# ============================================================================
+
+def _ordem_celulas(varredura, linhas, colunas, rng):
+    """
+    Células na ordem em que o robô as lê.
+
+    Returns:
+        list: Tuplas (linha, coluna)
+    """
+    if varredura == "colunas":
+        return [(i, j) for j in range(colunas) for i in range(linhas)]
+    ordem = [(i, j) for i in range(linhas) for j in range(colunas)]
+    if varredura == "aleatoria":
+        rng.shuffle(ordem)
+    return ordem
+
+
+def jogar(matriz, colocacoes, estrategia, rng):
+    """
+    Joga uma partida até o fim (ou até o robô desistir).
+
+    Args:
+        matriz (tuple): Linhas da matriz
+        colocacoes (list): Colocacao das palavras posicionadas
+        estrategia (Estrategia): Comportamento do robô
+        rng (random.Random): Sorteios do robô (ordem aleatória e erros)
+
+    Returns:
+        dict: passos, selecoes, erros, resolvida (bool) e achadas, uma lista
+              de (tamanho_palavra, passos_até_achar)
+    """
+    sessao = SessaoJogo(matriz, colocacoes)
+    linhas, colunas = sessao.linhas, sessao.colunas
+    passos = selecoes = erros = 0
+    achadas = []
+    achadas_idx = []
+
+    def ao_evento(evento, idx):
+        if evento == EVENTO_ENCONTRADA:
+            achadas.append((len(colocacoes[idx].palavra), passos))
+            achadas_idx.append(idx)
+    sessao.observar(ao_evento)
+
+    # Fila de palavras procuradas: cada item é um conjunto procurado de uma vez
+    if estrategia.dicas == "todas":
+        fila = [{c.palavra for c in colocacoes}]
+    elif estrategia.dicas == "demanda":
+        fila = [{c.palavra} for c in colocacoes]
+    else:
+        fila = [set(_banco)]
+
+    sem_progresso = 0
+    while fila and not sessao.completa() and sem_progresso < VARREDURAS_SEM_PROGRESSO:
+        # Palavras já achadas por outro caminho (lidas ao contrário) saem da fila
+        alvos = fila[0]
+        alvos.difference_update(colocacoes[idx].palavra for idx in achadas_idx)
+        if not alvos:
+            fila.pop(0)
+            continue
+        por_inicial = {}
+        for palavra in alvos:
+            por_inicial.setdefault(palavra[0], []).append(palavra)
+
+        achou = False
+        for i, j in _ordem_celulas(estrategia.varredura, linhas, colunas, rng):
+            passos += 1
+            candidatas = por_inicial.get(matriz[i][j])
+            if not candidatas:
+                continue
+            for palavra in tuple(candidatas):
+                for dx, dy in DIRECOES:
+                    # Compara letra a letra até a primeira diferença
+                    fim_i, fim_j = i + dx * (len(palavra) - 1), j + dy * (len(palavra) - 1)
+                    if not (0 <= fim_i < linhas and 0 <= fim_j < colunas):
+                        continue
+                    k = 1
+                    while k < len(palavra):
+                        passos += 1
+                        if matriz[i + dx * k][j + dy * k] != palavra[k]:
+                            break
+                        k += 1
+                    if k < len(palavra):
+                        continue
+
+                    # Arrasto: erra (uma célula curto) com a probabilidade da estratégia
+                    while rng.random() < estrategia.erro:
+                        selecoes += 1
+                        erros += 1
+                        passos += CUSTO_SELECAO
+                        sessao.selecionar((i, j), (fim_i - dx, fim_j - dy))
+                    selecoes += 1
+                    passos += CUSTO_SELECAO
+                    idx = sessao.selecionar((i, j), (fim_i, fim_j))
+                    if idx is not None:
+                        # A palavra achada pode ser outra lida ao contrário (ex.: AMOR/ROMA)
+                        achou = True
+                        encontrada = colocacoes[idx].palavra
+                        alvos.discard(encontrada)
+                        if encontrada in por_inicial.get(encontrada[0], ()):
+                            por_inicial[encontrada[0]].remove(encontrada)
+                        break
+            if not alvos:
+                break
+
+        if not alvos:
+            fila.pop(0)
+            sem_progresso = 0
+        else:
+            sem_progresso = 0 if achou else sem_progresso + 1
+
+    return {
+        "passos": passos,
+        "selecoes": selecoes,
+        "erros": erros,
+        "resolvida": sessao.completa(),
+        "achadas": achadas,
+    }
+
+
+# ============================================================================
+# POOL DE PROCESSOS
+# ============================================================================
+
+def _iniciar_processo(caminho_banco):
+    """Prepara um processo do pool: sem log e com o banco escolhido."""
+    global _banco
+    consts.log_ativo = False
+    if caminho_banco:
+        game.usar_banco(caminho_banco)
+    _banco = [p["palavra"] for p in game.carregar_palavras()]
+
+
+def _simular(tarefa):
+    """
+    Gera e joga uma partida (executado nos processos do pool).
+
+    Args:
+        tarefa (tuple): (semente, tamanho, texto_estrategia)
+
+    Returns:
+        tuple: (tamanho, texto_estrategia, resultado de jogar())
+    """
+    semente, tamanho, texto = tarefa
+    random.seed(semente)  # game.gerar usa o random global
+    matriz, colocacoes = game.gerar(tamanho)
+    resultado = jogar(matriz, colocacoes, Estrategia(texto), random.Random(semente))
+    return tamanho, texto, resultado
+
+
+# ============================================================================
+# AGREGAÇÃO E RELATÓRIO
+# ============================================================================
+
+def percentil(valores, p):
+    """
+    Percentil p (0-100) de uma lista já ordenada (vizinho mais próximo).
+    """
+    if not valores:
+        return 0
+    return valores[min(len(valores) - 1, int(p / 100 * len(valores)))]
+
+
+def imprimir_relatorio(resultados):
+    """
+    Imprime as distribuições agregadas.
+
+    Args:
+        resultados (list): Tuplas (tamanho, estrategia, resultado) de _simular
+    """
+    por_partida = {}
+    por_palavra = {}
+    for tamanho, estrategia, r in resultados:
+        por_partida.setdefault((tamanho, estrategia), []).append(r)
+        for comprimento, passos in r["achadas"]:
+            por_palavra.setdefault((tamanho, estrategia, comprimento), []).append(passos)
+
+    print("\nResolução por tamanho e estratégia (passos até a última palavra)")
+    print(f"{'tam':>4} {'estratégia':<24} {'partidas':>8} {'resolv.':>8} "
+          f"{'p10':>8} {'p50':>8} {'p90':>8} {'média':>9} {'erros':>6}")
+    for (tamanho, estrategia), lista in sorted(por_partida.items()):
+        resolvidas = sorted(r["passos"] for r in lista if r["resolvida"])
+        taxa = 100.0 * len(resolvidas) / len(lista)
+        media = sum(resolvidas) / len(resolvidas) if resolvidas else 0
+        erros = sum(r["erros"] for r in lista) / len(lista)
+        print(f"{tamanho:>4} {estrategia:<24} {len(lista):>8} {taxa:>7.1f}% "
+              f"{percentil(resolvidas, 10):>8} {percentil(resolvidas, 50):>8} "
+              f"{percentil(resolvidas, 90):>8} {media:>9.0f} {erros:>6.2f}")
+
+    print("\nTempo até achar cada palavra, por tamanho da palavra (passos)")
+    print(f"{'tam':>4} {'estratégia':<24} {'letras':>6} {'palavras':>8} {'p50':>8} {'p90':>8}")
+    for (tamanho, estrategia, comprimento), lista in sorted(por_palavra.items()):
+        lista.sort()
+        print(f"{tamanho:>4} {estrategia:<24} {comprimento:>6} {len(lista):>8} "
+              f"{percentil(lista, 50):>8} {percentil(lista, 90):>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulador de partidas com robôs jogadores")
+    parser.add_argument("--partidas", type=int, default=1000,
+                        help="partidas por tamanho e estratégia (padrão: 1000)")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[12, 15, 20],
+                        help="tamanhos de tabuleiro (padrão: 12 15 20)")
+    parser.add_argument("--estrategias", nargs="+", default=list(ESTRATEGIAS_PADRAO),
+                        help="estratégias varredura:dicas:erro (padrão: %(default)s)")
+    parser.add_argument("--banco", help="JSON de palavras no formato do data/palavras.json")
+    parser.add_argument("--processos", type=int, default=os.cpu_count() or 1,
+                        help="processos no pool (padrão: número de CPUs)")
+    parser.add_argument("--semente", type=int, default=0, help="semente base (padrão: 0)")
+    args = parser.parse_args()
+
+    for texto in args.estrategias:
+        try:
+            Estrategia(texto)
+        except ValueError as e:
+            parser.error(str(e))
+    if args.banco and not os.path.isfile(args.banco):
+        parser.error(f"banco não encontrado: {args.banco}")
+
+    tarefas = []
+    for tamanho in args.tamanhos:
+        for texto in args.estrategias:
+            for _ in range(args.partidas):
+                tarefas.append((args.semente + len(tarefas), tamanho, texto))
+
+    inicio = time.perf_counter()
+    with Pool(args.processos, initializer=_iniciar_processo, initargs=(args.banco,)) as pool:
+        lote = max(1, len(tarefas) // (args.processos * 16))
+        resultados = list(pool.imap_unordered(_simular, tarefas, chunksize=lote))
+    duracao = time.perf_counter() - inicio
+
+    print(f"{len(resultados)} partidas em {duracao:.1f} s "
+          f"({len(resultados) / duracao:.0f} partidas/s, {args.processos} processos)")
+    imprimir_relatorio(resultados)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
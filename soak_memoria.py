@@ -0,0 +1,196 @@
+"""
+Teste de memória (soak) do ciclo menu → dificuldade → jogo → ESC.
+
+Executa centenas de ciclos completos sem janela visível (plataforma Qt
+"offscreen") usando os mesmos callbacks do main.py e mede, a cada ciclo:
+- heap Python (tracemalloc)
+- quantidade de QObjects vivos (todos os widgets + descendentes da janela)
+- RSS do processo
+No fim, mostra também a taxa de acertos do atlas de glifos do tabuleiro
+nos ciclos medidos (células copiadas do atlas x desenhadas na hora).
+
+Depois de um aquecimento, calcula o crescimento por ciclo (regressão linear)
+e termina com código 1 se algum deles passar do limite. Pensado para rodar
+antes de publicar uma versão para os quiosques, que ficam horas ligados:
+
+    python soak_memoria.py
+    python soak_memoria.py --ciclos 500 --vitoria
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+# Sem janela: precisa ser definido antes de criar a QApplication
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt, QEvent, QObject, QTimer, QCoreApplication
+from PyQt6.QtGui import QKeyEvent
+
+# Limites de crescimento aceitáveis por ciclo (após o aquecimento)
+LIMITE_HEAP_BYTES = 2 * 1024
+LIMITE_QOBJECTS = 0.05
+LIMITE_RSS_BYTES = 32 * 1024
+
+
+def ler_rss():
+    """
+    Retorna o RSS atual do processo em bytes (0 se não for possível medir).
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil  # opcional (Windows/macOS)
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        return 0
+
+
+def contar_qobjects(app):
+    """
+    Conta os QObjects vivos alcançáveis pela aplicação.
+    """
+    total = 0
+    for w in app.topLevelWidgets():
+        total += 1 + len(w.findChildren(QObject))
+    return total
+
+
+def inclinacao(valores):
+    """
+    Crescimento médio por ciclo (coeficiente angular da regressão linear).
+    """
+    n = len(valores)
+    if n < 2:
+        return 0.0
+    media_x = (n - 1) / 2
+    media_y = sum(valores) / n
+    num = sum((x - media_x) * (y - media_y) for x, y in enumerate(valores))
+    den = sum((x - media_x) ** 2 for x in range(n))
+    return num / den
+
+
+def processar_eventos(app):
+    """
+    Esvazia a fila de eventos, incluindo os deleteLater() pendentes.
+    """
+    app.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+    app.processEvents()
+
+
+def fechar_popup_em_seguida():
+    """
+    Agenda o fechamento do próximo popup modal (vitória / como jogar).
+    """
+    def fechar():
+        popup = QApplication.activeModalWidget()
+        if popup is not None:
+            popup.done(0)
+        else:
+            QTimer.singleShot(1, fechar)
+    QTimer.singleShot(1, fechar)
+
+
+def teclar(widget, tecla):
+    """
+    Envia uma tecla para o widget, como se o jogador a tivesse pressionado.
+    """
+    evento = QKeyEvent(QEvent.Type.KeyPress, tecla, Qt.KeyboardModifier.NoModifier)
+    QApplication.sendEvent(widget, evento)
+
+
+def ciclo(app, main, indice, vitoria):
+    """
+    Um ciclo completo: menu → dificuldade → jogo → (vitória) → ESC → menu.
+    """
+    main.bnt_jogar_clicado()
+    processar_eventos(app)
+
+    # Alterna as dificuldades para exercitar também a reconstrução da grade
+    main.select_difficulty(indice % 3 + 1)
+    jogo = main.telas["jogo"]
+    while not jogo.pronto():  # A partida é montada em etapas pelo loop de eventos
+        processar_eventos(app)
+
+    # Popup "como jogar" da tela de jogo
+    fechar_popup_em_seguida()
+    teclar(jogo, Qt.Key.Key_C)
+
+    if vitoria:
+        # Desistir mostra o popup de vitória; fechar volta ao menu
+        fechar_popup_em_seguida()
+        teclar(jogo, Qt.Key.Key_D)
+    else:
+        teclar(jogo, Qt.Key.Key_Escape)
+    processar_eventos(app)
+
+    # Popup "como jogar" do menu
+    fechar_popup_em_seguida()
+    main.bnt_como_clicar()
+    processar_eventos(app)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de memória do ciclo menu/jogo")
+    parser.add_argument("--ciclos", type=int, default=300, help="ciclos medidos (padrão: 300)")
+    parser.add_argument("--aquecimento", type=int, default=150,
+                        help="ciclos ignorados no início, enquanto caches do Qt e do alocador crescem (padrão: 150)")
+    parser.add_argument("--vitoria", action="store_true", help="termina cada jogo pelo popup de vitória")
+    args = parser.parse_args()
+    if args.ciclos < 6:
+        parser.error("--ciclos precisa ser pelo menos 6 (duas rodadas)")
+
+    app = QApplication(sys.argv[:1])
+
+    import consts
+    consts.log_ativo = False  # Sem log por ciclo: não interfere na medição
+    import main as jogo_main
+
+    janela = jogo_main.criar_janela_principal()
+    janela.show()
+    processar_eventos(app)
+
+    for i in range(args.aquecimento):
+        ciclo(app, jogo_main, i, args.vitoria)
+
+    # Uma amostra por rodada (um ciclo de cada dificuldade): o tamanho da
+    # grade muda entre as dificuldades e distorceria a regressão
+    atlas = jogo_main.telas["jogo"].atlas()
+    atlas.zerar_contadores()
+    tracemalloc.start()
+    heap, qobjects, rss = [], [], []
+    for i in range(args.ciclos):
+        ciclo(app, jogo_main, i, args.vitoria)
+        if i % 3 != 2:
+            continue
+        gc.collect()
+        heap.append(tracemalloc.get_traced_memory()[0])
+        qobjects.append(contar_qobjects(app))
+        rss.append(ler_rss())
+    tracemalloc.stop()
+
+    resultados = [
+        ("heap Python", inclinacao(heap) / 3, LIMITE_HEAP_BYTES, "B/ciclo"),
+        ("QObjects vivos", inclinacao(qobjects) / 3, LIMITE_QOBJECTS, "obj/ciclo"),
+        ("RSS", inclinacao(rss) / 3, LIMITE_RSS_BYTES, "B/ciclo"),
+    ]
+    falhou = False
+    print(f"{args.ciclos} ciclos (+{args.aquecimento} de aquecimento)")
+    print(f"QObjects: {qobjects[0]} -> {qobjects[-1]}")
+    print(f"Atlas de glifos: {100.0 * atlas.taxa_acertos():.1f} % de acertos "
+          f"({atlas.acertos + atlas.faltas} células, {len(atlas.glifos)} pixmaps)")
+    for nome, valor, limite, unidade in resultados:
+        status = "OK" if valor <= limite else "VAZAMENTO"
+        falhou |= valor > limite
+        print(f"  {nome:<15} {valor:10.2f} {unidade:<10} (limite {limite}) {status}")
+    return 1 if falhou else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
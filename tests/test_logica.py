@@ -0,0 +1,235 @@
+"""
+TESTS/TEST_LOGICA.PY - Testes da Lógica do Jogo (sem interface)
+===============================================================
+Testes dos módulos que não dependem do Qt:
+- SessaoJogo: seleção nos dois sentidos, desistência e ordem dos eventos
+- IndiceDicas: filtro comparado com uma busca por substring direta
+- Lexico: ida e volta da compilação, contem() e palavras_no_tabuleiro()
+- Mensagem secreta: as células livres soletram a frase
+- Ladrilhos: toda palavra posicionada está escrita na grade
+
+Execução (na raiz do projeto):
+    python -m pytest -q
+"""
+
+import random
+
+import pytest
+
+import consts
+from dificult.dificult import Perfil
+from game import game, ladrilhos, mascaras, mensagem
+from game.indice_dicas import IndiceDicas, normalizar as normalizar_dica
+from game.lexico import Lexico, compilar_arquivo, normalizar, normalizar_grade
+from game.sessao import EVENTO_DESCOBERTA, EVENTO_ENCONTRADA, EVENTO_FIM, SessaoJogo
+
+consts.log_ativo = False
+
+
+def _checar_colocacoes(matriz, colocacoes):
+    """Cada palavra está escrita na grade, dentro dos limites, a partir da sua ponta."""
+    linhas, colunas = len(matriz), len(matriz[0])
+    for c in colocacoes:
+        for (i, j), letra in zip(c.posicoes(), c.palavra):
+            assert 0 <= i < linhas and 0 <= j < colunas, c
+            assert matriz[i][j] == letra, c
+
+
+# ============================================================================
+# SESSÃO
+# ============================================================================
+
+@pytest.fixture
+def sessao():
+    """Sessão de um tabuleiro 12x12 gerado e a lista dos eventos que ela emite."""
+    random.seed(3)
+    matriz, colocacoes = game.gerar(12, quantidade=6)
+    s = SessaoJogo(matriz, colocacoes)
+    eventos = []
+    s.observar(lambda evento, dados: eventos.append((evento, dados)))
+    return s, eventos
+
+
+def test_selecionar_nos_dois_sentidos(sessao):
+    s, eventos = sessao
+    primeira, segunda = s.colocacoes[:2]
+
+    assert s.selecionar((primeira.linha, primeira.coluna), primeira.fim()) == 0
+    assert primeira.encontrada and s.encontradas == 1
+    assert all(s.celula_encontrada(i, j) for i, j in primeira.posicoes())
+    # De trás para frente também vale
+    assert s.selecionar(segunda.fim(), (segunda.linha, segunda.coluna)) == 1
+    # Repetir uma palavra já encontrada não conta de novo
+    assert s.selecionar(primeira.fim(), (primeira.linha, primeira.coluna)) is None
+    assert s.encontradas == 2
+    assert eventos == [(EVENTO_ENCONTRADA, 0), (EVENTO_ENCONTRADA, 1)]
+
+
+def test_selecionar_tudo_termina_com_vitoria(sessao):
+    s, eventos = sessao
+    for c in s.colocacoes:
+        s.selecionar((c.linha, c.coluna), c.fim())
+
+    assert s.completa() and s.terminada
+    assert eventos == [(EVENTO_ENCONTRADA, i) for i in range(s.total)] + [(EVENTO_FIM, False)]
+    c = s.colocacoes[0]
+    assert s.selecionar((c.linha, c.coluna), c.fim()) is None  # Partida encerrada
+
+
+def test_desistir_marca_restantes_e_termina(sessao):
+    s, eventos = sessao
+    c = s.colocacoes[2]
+    s.selecionar((c.linha, c.coluna), c.fim())
+    s.desistir()
+
+    assert s.completa() and s.terminada
+    restantes = [(EVENTO_ENCONTRADA, i) for i in range(s.total) if i != 2]
+    assert eventos == [(EVENTO_ENCONTRADA, 2)] + restantes + [(EVENTO_FIM, True)]
+    s.desistir()  # Já terminada: nenhum evento novo
+    assert eventos[-1] == (EVENTO_FIM, True) and len(eventos) == s.total + 1
+
+
+def test_descoberta_livre_pelo_lexico():
+    matriz = ("GATOX", "XXXXX", "CASAX")
+    colocacoes = [game.Colocacao("GATO", "", 0, 0, (0, 1))]
+    s = SessaoJogo(matriz, colocacoes, Lexico.de_palavras(["GATO", "CASA"]))
+    eventos = []
+    s.observar(lambda evento, dados: eventos.append((evento, dados)))
+
+    assert s.selecionar((2, 3), (2, 0)) is None  # "ASAC" ao contrário: CASA
+    assert s.selecionar((2, 0), (2, 3)) is None  # A mesma descoberta não conta duas vezes
+    assert eventos == [(EVENTO_DESCOBERTA, ("CASA", (2, 3), (2, 0)))]
+    assert s.achaveis() == {((2, 0), (2, 3)): "CASA"}  # Posicionada (GATO) fica de fora
+
+
+# ============================================================================
+# ÍNDICE DAS DICAS
+# ============================================================================
+
+def test_filtrar_igual_a_busca_direta():
+    rng = random.Random(5)
+    silabas = ["ca", "sa", "ção", "lu", "ma", "pé", "ra", "to", "an", "é"]
+    textos = [" ".join("".join(rng.choice(silabas) for _ in range(rng.randint(1, 4)))
+                       for _ in range(rng.randint(1, 3))) for _ in range(400)]
+    tamanhos = [rng.randint(3, 8) for _ in textos]
+    estados = [rng.randint(0, 2) for _ in textos]
+    indice = IndiceDicas(textos, tamanhos, estados)
+    # Algumas mudanças de estado depois da construção
+    for i in rng.sample(range(len(textos)), 50):
+        novo = rng.randint(0, 2)
+        indice.mudar_estado(i, estados[i], novo)
+        estados[i] = novo
+
+    normalizados = [normalizar_dica(t) for t in textos]
+    consultas = ["", "a", "Ç", "ca", "cao", "ção", "masa", "lu ma", "zzz", "éra", "catoluma"]
+    for consulta in consultas:
+        alvo = normalizar_dica(consulta)
+        for estado in (None, 0, 1, 2):
+            for tamanho in (None, 3, 5):
+                esperado = [i for i, t in enumerate(normalizados)
+                            if alvo in t
+                            and (estado is None or estados[i] == estado)
+                            and (tamanho is None or tamanhos[i] == tamanho)]
+                assert indice.filtrar(consulta, estado, tamanho) == esperado, (consulta, estado, tamanho)
+
+
+# ============================================================================
+# LÉXICO
+# ============================================================================
+
+def test_lexico_ida_e_volta(tmp_path):
+    rng = random.Random(11)
+    silabas = ["BA", "CA", "DE", "FI", "GO", "LU", "MA", "NE", "CHA", "LHO", "TRA"]
+    palavras = {"".join(rng.choice(silabas) for _ in range(rng.randint(1, 5))) for _ in range(3000)}
+    origem = tmp_path / "lista.txt"
+    origem.write_text("\n".join(sorted(palavras) + ["Coração", "x-y"]), encoding="utf-8")
+    compilar_arquivo(str(origem), str(tmp_path / "lista.idx"))
+    lexico = Lexico.abrir(str(tmp_path / "lista.idx"))
+    try:
+        conhecidas = palavras | {"CORACAO"}
+        assert len(lexico) == len(conhecidas)
+        assert all(lexico.contem(p) for p in palavras)
+        assert lexico.contem("coração") and "Coracao" in lexico
+        assert not lexico.contem("x-y")
+        assert not any(lexico.contem(p + "Q") for p in palavras)
+        assert not any(lexico.contem(p[:-1]) for p in palavras if p[:-1] not in conhecidas)
+    finally:
+        lexico.fechar()
+
+
+def test_palavras_no_tabuleiro_igual_a_forca_bruta():
+    rng = random.Random(2)
+    palavras = {"MAR", "AMOR", "ROMA", "RAMO", "ARMA", "MORA", "OMA", "ARO"}
+    lexico = Lexico.de_palavras(palavras)
+    matriz = ["".join(rng.choice("AMOR") for _ in range(7)) for _ in range(6)]
+
+    # Todas as retas de 3+ letras, nas 8 direções
+    esperado = {}
+    for i in range(6):
+        for j in range(7):
+            for dx, dy in ((0, 1), (1, 0), (1, 1), (1, -1), (0, -1), (-1, 0), (-1, -1), (-1, 1)):
+                texto, x, y = "", i, j
+                while 0 <= x < 6 and 0 <= y < 7:
+                    texto += matriz[x][y]
+                    if len(texto) >= 3 and texto in palavras:
+                        esperado[((i, j), (x, y))] = texto
+                    x, y = x + dx, y + dy
+    achadas = lexico.palavras_no_tabuleiro(matriz)
+    assert achadas == esperado
+    linhas = normalizar_grade(matriz)
+    assert all(lexico.palavra_na_reta(linhas, a, b) == p for (a, b), p in achadas.items())
+    assert normalizar("Ação") == "ACAO" and normalizar("x-y") is None
+
+
+# ============================================================================
+# MENSAGEM SECRETA
+# ============================================================================
+
+@pytest.mark.parametrize("dados", [
+    {"linhas": 10, "palavras": 1, "tamanho_min": 3},
+    {"linhas": 12, "colunas": 9, "palavras": 1, "tamanho_min": 3, "direcoes": ["direita", "baixo"]},
+    {"linhas": 14, "palavras": 1, "tamanho_min": 3, "mascara": mascaras.nomes()[0]},
+])
+def test_celulas_livres_soletram_a_frase(dados):
+    random.seed(8)
+    perfil = Perfil(9, dados)
+    frase = "Olá, mundo secreto!"
+    resultado = game.gerar_com_mensagem(perfil, frase)
+    assert resultado is not None
+    matriz, colocacoes = resultado
+
+    _checar_colocacoes(matriz, colocacoes)
+    assert len({c.palavra for c in colocacoes}) == len(colocacoes)  # Sem palavra repetida
+    s = SessaoJogo(matriz, colocacoes)
+    assert "".join(matriz[i][j] for i, j in s.celulas_livres()) == mensagem.letras_da_frase(frase)
+
+
+def test_frase_maior_que_o_tabuleiro():
+    perfil = Perfil(9, {"linhas": 3, "palavras": 1})
+    with pytest.raises(ValueError):
+        game.gerar_com_mensagem(perfil, "uma frase longa demais para nove celulas")
+
+
+# ============================================================================
+# LADRILHOS
+# ============================================================================
+
+@pytest.mark.parametrize("linhas, colunas", [(200, 200), (129, 300)])
+def test_ladrilhos_colocacoes_batem_com_a_grade(linhas, colunas):
+    random.seed(7)
+    matriz, colocacoes, selecionadas = ladrilhos.gerar(linhas, colunas, 30, processos=1)
+
+    assert len(matriz) == linhas and all(len(linha) == colunas for linha in matriz)
+    assert not any(letra.islower() for linha in matriz for letra in linha)
+    assert [c.palavra for c in colocacoes] == [p["palavra"] for p in selecionadas][:len(colocacoes)]
+    _checar_colocacoes(matriz, colocacoes)
+
+
+def test_ladrilhos_em_paralelo_igual_ao_serial():
+    resultados = []
+    for processos in (1, 2):
+        random.seed(4)
+        matriz, colocacoes, _ = ladrilhos.gerar(260, 260, 20, processos=processos)
+        _checar_colocacoes(matriz, colocacoes)
+        resultados.append((matriz, [(c.palavra, c.linha, c.coluna, c.dx, c.dy) for c in colocacoes]))
+    assert resultados[0] == resultados[1]
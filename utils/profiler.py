@@ -0,0 +1,181 @@
+"""
+UTILS/PROFILER.PY - Modo de Perfil de Desempenho (--profile)
+============================================================
+Este módulo implementa o perfilador embutido acionado por `python main.py --profile`.
+Responsável por:
+- Envolver o loop de eventos do Qt com um perfilador determinístico (cProfile)
+  ou apenas por amostragem (thread que lê a pilha da thread principal)
+- Separar o relatório por tela (MenuInicial, DificultUI, TelaJogo)
+- Gravar, ao sair, um .pstats por tela e um arquivo de pilhas colapsadas
+  (formato aceito por flamegraph.pl / speedscope) ao lado do executável
+
+Modos:
+- "det": cProfile por tela + amostragem para o flamegraph (padrão)
+- "sample": somente amostragem, com custo mínimo sobre o jogo
+
+Arquivos gerados (na pasta retornada por consts.get_app_dir()):
+- perfil_<Tela>.pstats / perfil_<Tela>.txt  (somente modo "det")
+- perfil_total.pstats                        (somente modo "det")
+- perfil.collapsed                           (ambos os modos)
+
+Só usa a biblioteca padrão, então funciona igual no executável do PyInstaller.
+"""
+
+import atexit
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+
+from consts import get_app_dir, log
+
+MODOS = ("det", "sample")
+
+
+class PerfilTelas:
+    """
+    Perfilador do jogo com relatório separado por tela.
+
+    A tela ativa é informada pelo controlador (main.py) através de
+    marcar_tela(); todo o tempo gasto até a próxima troca é atribuído a ela.
+    """
+
+    def __init__(self, modo="det", intervalo_ms=5, pasta=None):
+        """
+        Args:
+            modo (str): "det" (cProfile + amostragem) ou "sample" (só amostragem)
+            intervalo_ms (int): Intervalo entre amostras da pilha principal
+            pasta (str, optional): Pasta de saída (padrão: ao lado do executável)
+        """
+        if modo not in MODOS:
+            raise ValueError(f"modo de perfil inválido: {modo!r} (use {', '.join(MODOS)})")
+        self.modo = modo
+        self.pasta = pasta or get_app_dir()
+        self._intervalo = max(1, intervalo_ms) / 1000.0
+        self._tela = "inicializacao"
+        self._perfis = {}                # {nome_tela: cProfile.Profile}
+        self._amostras = Counter()       # {"tela;f1;f2;...": contagem}
+        self._main_id = threading.main_thread().ident
+        self._parar = threading.Event()
+        self._thread = None
+        self._finalizado = False
+
+    # ============================================================================
+    # CICLO DE VIDA
+    # ============================================================================
+
+    def iniciar(self):
+        """Liga o perfilador e registra a gravação dos arquivos na saída do processo."""
+        if self.modo == "det":
+            self._perfil_atual().enable()
+        self._thread = threading.Thread(target=self._amostrar, name="perfil-amostragem", daemon=True)
+        self._thread.start()
+        # atexit cobre tanto o retorno de app.exec() quanto sys.exit() dentro de um slot
+        atexit.register(self.finalizar)
+        log("profiler", f"perfil ligado (modo={self.modo}), saída em {self.pasta}")
+
+    def marcar_tela(self, nome):
+        """
+        Passa a atribuir o tempo medido à tela indicada.
+
+        Args:
+            nome (str): Nome da tela (normalmente o nome da classe)
+        """
+        if nome == self._tela or self._finalizado:
+            return
+        if self.modo == "det":
+            self._perfil_atual().disable()
+        self._tela = nome
+        if self.modo == "det":
+            self._perfil_atual().enable()
+
+    def finalizar(self):
+        """Desliga o perfilador e grava os relatórios (chamadas repetidas são ignoradas)."""
+        if self._finalizado:
+            return
+        self._finalizado = True
+        if self.modo == "det":
+            self._perfil_atual().disable()
+        self._parar.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+
+        try:
+            os.makedirs(self.pasta, exist_ok=True)
+            if self.modo == "det":
+                self._gravar_pstats()
+            self._gravar_colapsado()
+        except OSError as e:
+            log("profiler", f"Erro ao gravar perfil: {e}")
+
+    # ============================================================================
+    # DETALHES INTERNOS
+    # ============================================================================
+
+    def _perfil_atual(self):
+        perfil = self._perfis.get(self._tela)
+        if perfil is None:
+            perfil = self._perfis[self._tela] = cProfile.Profile()
+        return perfil
+
+    def _amostrar(self):
+        """Thread de amostragem: lê a pilha da thread principal em intervalos fixos."""
+        while not self._parar.wait(self._intervalo):
+            frame = sys._current_frames().get(self._main_id)
+            if frame is None:
+                continue
+            pilha = []
+            while frame is not None:
+                code = frame.f_code
+                pilha.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            pilha.append(self._tela)
+            self._amostras[";".join(reversed(pilha))] += 1
+
+    def _gravar_pstats(self):
+        total = None
+        for tela, perfil in self._perfis.items():
+            try:
+                stats = pstats.Stats(perfil)
+            except TypeError:
+                continue  # tela sem nenhuma chamada registrada
+            stats.dump_stats(os.path.join(self.pasta, f"perfil_{tela}.pstats"))
+
+            resumo = io.StringIO()
+            pstats.Stats(perfil, stream=resumo).sort_stats("cumulative").print_stats(40)
+            with open(os.path.join(self.pasta, f"perfil_{tela}.txt"), "w", encoding="utf-8") as f:
+                f.write(resumo.getvalue())
+
+            if total is None:
+                total = stats
+            else:
+                total.add(stats)
+        if total is not None:
+            total.dump_stats(os.path.join(self.pasta, "perfil_total.pstats"))
+        log("profiler", f"pstats gravados para as telas: {', '.join(self._perfis)}")
+
+    def _gravar_colapsado(self):
+        caminho = os.path.join(self.pasta, "perfil.collapsed")
+        with open(caminho, "w", encoding="utf-8") as f:
+            for pilha, contagem in self._amostras.most_common():
+                f.write(f"{pilha} {contagem}\n")
+        log("profiler", f"{sum(self._amostras.values())} amostras gravadas em {caminho}")
+
+
+def iniciar_perfil(modo="det", intervalo_ms=5):
+    """
+    Cria e liga um PerfilTelas.
+
+    Args:
+        modo (str): "det" ou "sample"
+        intervalo_ms (int): Intervalo de amostragem em milissegundos
+
+    Returns:
+        PerfilTelas: Perfilador ativo (grava os arquivos automaticamente na saída)
+    """
+    perfil = PerfilTelas(modo=modo, intervalo_ms=intervalo_ms)
+    perfil.iniciar()
+    return perfil
@@ -0,0 +1,287 @@
+"""
+UTILS/RECURSOS.PY - Registro de Recursos Compartilhados
+=======================================================
+Este módulo é o registro único (por processo) dos recursos usados pelas telas.
+Responsável por:
+- Registrar a fonte "Press Start 2P" no Qt uma única vez por processo
+- Manter um cache de QFont por tamanho, compartilhado por todas as telas
+  (fonte pixel e fonte monoespaçada do HUD de desempenho)
+- Dar acesso ao banco de palavras já carregado (cache do game.py)
+- Centralizar as folhas de estilo (CSS) e as cores reutilizadas pelas telas
+- Ler o arquivo da fonte e o banco de palavras em segundo plano durante a
+  inicialização, enquanto a thread principal mostra o splash e monta o menu;
+  na mesma thread, montar as tabelas de geração de cada perfil de dificuldade
+
+Com isso, reconstruir MenuInicial/DificultUI/TelaJogo repetidas vezes não
+registra a fonte de novo nem cria novos objetos de fonte.
+
+Observação:
+- A leitura de arquivos acontece na thread auxiliar; o registro da fonte no
+  QFontDatabase e a criação de QFont são sempre feitos na thread principal
+"""
+
+import threading
+
+from PyQt6.QtCore import QByteArray
+from PyQt6.QtGui import QFontDatabase, QFont
+
+from consts import FONT_PATH, log
+
+_fonte_registrada = False   # Evita registrar a mesma fonte a cada tela construída
+_dados_fonte = None         # Bytes do TTF lidos pela thread de pré-carga
+_thread_pre_carga = None
+_fonte_lida = threading.Event()  # Sinaliza que a thread terminou de ler o TTF
+_fontes = {}                # Cache {tamanho: QFont} da fonte pixel
+_fontes_mono = {}           # Cache {tamanho: QFont} da fonte monoespaçada (HUD)
+
+NOME_FONTE = "Press Start 2P"
+NOME_FONTE_MONO = "Monospace"
+
+# ============================================================================
+# FOLHAS DE ESTILO COMPARTILHADAS
+# ============================================================================
+# Strings únicas reutilizadas por todas as telas (antes repetidas em cada módulo)
+ESTILOS = {
+    # Fundo escuro comum a todas as telas
+    "fundo": "background-color: #111018;",
+    "texto_branco": "color: white;",
+
+    # Tela de carregamento (utils.ui.mostrar_splash), antes da fonte pixel
+    "splash": "background-color: #111018; color: #ff8c00; font-size: 18px;",
+
+    # Botões padrão (utils.ui.criar_botao)
+    "botao": """
+        QPushButton {
+            background-color: #ff8c00;  /* Laranja padrão */
+            color: black;               /* Texto preto para contraste */
+            border-radius: 20px;        /* Bordas arredondadas */
+            font-size: 18px;           /* Tamanho da fonte */
+        }
+        QPushButton:hover {
+            background-color: #ffa733;  /* Laranja mais claro no hover */
+        }
+    """,
+
+    # Painéis da TelaJogo
+    "painel_matriz": """
+        QFrame {
+            background-color: #0c0c12;
+            border: 4px solid #0a0a0f;
+        }
+    """,
+    "painel_dicas": """
+        QFrame {
+            background-color: #0c0c12;
+            border-left: 6px solid #000;
+        }
+    """,
+    "filtro_dicas": """
+        QLineEdit, QComboBox {
+            background-color: #1a1a24;
+            color: white;
+            border: 1px solid #3a3a4a;
+            border-radius: 6px;
+            padding: 6px;
+        }
+        QLineEdit:focus { border: 1px solid #ff8c00; }
+        QComboBox::drop-down { border: none; width: 18px; }
+        QComboBox QAbstractItemView {
+            background-color: #1a1a24;
+            color: white;
+            selection-background-color: #2d3d5a;
+        }
+    """,
+    "tabuleiro": """
+        QAbstractScrollArea { border: none; background-color: #0c0c12; }
+        QScrollBar:vertical { background: #0c0c12; width: 12px; }
+        QScrollBar:horizontal { background: #0c0c12; height: 12px; }
+        QScrollBar::handle:vertical { background: #2a2a3a; min-height: 24px; border-radius: 6px; }
+        QScrollBar::handle:horizontal { background: #2a2a3a; min-width: 24px; border-radius: 6px; }
+        QScrollBar::add-line, QScrollBar::sub-line { width: 0; height: 0; }
+    """,
+    "lista_dicas": """
+        QListView { border: none; background: transparent; outline: none; }
+        QScrollBar:vertical { background: #0c0c12; width: 12px; }
+        QScrollBar::handle:vertical { background: #2a2a3a; min-height: 24px; border-radius: 6px; }
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }
+    """,
+
+    # Popup "Como Jogar" do menu principal
+    "popup_como_jogar": """
+        QMessageBox {
+            background-color: #111018;  /* Fundo escuro */
+        }
+        QMessageBox QLabel {
+            color: white;               /* Texto branco */
+            font-family: 'Press Start 2P';  /* Fonte pixel */
+            font-size: 14px;
+        }
+        QLabel {
+            color: white;
+            font-family: 'Press Start 2P';
+        }
+        QPushButton {
+            background-color: #ff8c00;  /* Botão laranja */
+            color: black;
+            border-radius: 10px;
+            padding: 8px 16px;
+            font-family: 'Press Start 2P';
+        }
+        QPushButton:hover {
+            background-color: #ffa733;  /* Hover laranja claro */
+        }
+    """,
+
+    # Popups (vitória / como jogar) da TelaJogo
+    "popup_jogo": (
+        "QMessageBox { background-color: #111018; }"
+        "QLabel { color: white; font-family: 'Press Start 2P'; }"
+    ),
+    "hud": (
+        "QLabel { background-color: rgba(0, 0, 0, 190); color: #7CFC00;"
+        " border: 1px solid #45c165; padding: 6px; }"
+    ),
+    "popup_como_jogar_jogo": (
+        "QMessageBox { background-color: #111018; }"
+        "QMessageBox QLabel { color: white; font-family: 'Press Start 2P'; }"
+        "QLabel { color: white; font-family: 'Press Start 2P'; }"
+        "QPushButton { background-color: #2a2a3a; color: white; }"
+    ),
+}
+
+# Cores das células da matriz (TelaJogo), desenhadas por game/tabuleiro_ui.py:
+# {estado: (fundo, texto, borda)}
+CORES_CELULAS = {
+    "normal": ("#1a1a24", "#ffffff", "#2a2a3a"),
+    "selecionada": ("#2d3d5a", "#ffffff", "#4b6aa8"),
+    "encontrada": ("#2f8f46", "#ffffff", "#45c165"),
+    "descoberta": ("#7a5a1e", "#ffffff", "#c9963a"),
+}
+
+# Cores dos itens da lista de dicas (TelaJogo), desenhados pelo delegate em
+# game/dicas_ui.py: {estado: (fundo, texto, borda)}
+CORES_DICAS = {
+    "oculta": ("#2a2a3a", "#cccccc", "#3a3a4a"),
+    "revelada": ("#ff8c00", "#000000", "#cc6f00"),
+    "encontrada": ("#2f8f46", "#ffffff", "#45c165"),
+    "descoberta": ("#7a5a1e", "#ffffff", "#c9963a"),
+}
+
+
+def pre_carregar():
+    """
+    Inicia a leitura da fonte, do banco de palavras e dos perfis de
+    dificuldade (com as tabelas de geração de cada um) em segundo plano.
+
+    Chamadas repetidas não criam novas threads.
+    """
+    global _thread_pre_carga
+    if _thread_pre_carga is not None:
+        return
+
+    def trabalho():
+        global _dados_fonte
+        try:
+            with open(FONT_PATH, "rb") as f:
+                _dados_fonte = f.read()
+        except OSError as e:
+            log("recursos", f"Erro ao ler fonte: {e}")
+        finally:
+            _fonte_lida.set()
+        # Importação tardia: o módulo do jogo não é necessário para o menu
+        from game import game
+        from dificult import dificult
+        game.carregar_palavras()
+        # Tabelas de geração de cada dificuldade: a primeira partida não as monta
+        game.preparar_perfis(dificult.carregar_perfis().values())
+
+    _thread_pre_carga = threading.Thread(target=trabalho, name="pre-carga", daemon=True)
+    _thread_pre_carga.start()
+
+
+def registrar_fonte():
+    """
+    Registra a fonte pixel no QFontDatabase (apenas na primeira chamada).
+
+    Se a pré-carga estiver em andamento, aguarda apenas a leitura do TTF; se
+    ela não foi iniciada, o Qt lê o arquivo diretamente.
+
+    Returns:
+        bool: True se a fonte está registrada
+    """
+    global _fonte_registrada, _dados_fonte
+    if _fonte_registrada:
+        return True
+
+    if _thread_pre_carga is not None:
+        _fonte_lida.wait()  # Não espera o banco de palavras, só o arquivo da fonte
+    if _dados_fonte is not None:
+        font_id = QFontDatabase.addApplicationFontFromData(QByteArray(_dados_fonte))
+        _dados_fonte = None  # O Qt mantém a própria cópia
+    else:
+        font_id = QFontDatabase.addApplicationFont(FONT_PATH)
+
+    _fonte_registrada = font_id != -1
+    if not _fonte_registrada:
+        log("recursos", f"Não foi possível registrar a fonte {FONT_PATH}")
+    return _fonte_registrada
+
+
+def fonte(tamanho):
+    """
+    Retorna a QFont da fonte pixel no tamanho pedido, criando-a só uma vez.
+
+    Args:
+        tamanho (int): Tamanho da fonte (ex: FONT_PIXEL_SIZE, FONT_PIXEL_BIG_SIZE)
+
+    Returns:
+        QFont: Instância compartilhada; setFont() copia o valor, então quem
+               chama não deve modificá-la diretamente
+    """
+    f = _fontes.get(tamanho)
+    if f is None:
+        registrar_fonte()
+        f = _fontes[tamanho] = QFont(NOME_FONTE, tamanho)
+    return f
+
+
+def fonte_mono(tamanho):
+    """
+    Retorna a QFont monoespaçada (HUD de desempenho) no tamanho pedido,
+    criando-a só uma vez.
+
+    Args:
+        tamanho (int): Tamanho da fonte em pontos
+
+    Returns:
+        QFont: Instância compartilhada (não deve ser modificada por quem chama)
+    """
+    f = _fontes_mono.get(tamanho)
+    if f is None:
+        f = _fontes_mono[tamanho] = QFont(NOME_FONTE_MONO, tamanho)
+        f.setStyleHint(QFont.StyleHint.TypeWriter)
+    return f
+
+
+def estilo(nome):
+    """
+    Retorna uma folha de estilo compartilhada.
+
+    Args:
+        nome (str): Chave em ESTILOS (ex: "fundo", "painel_dicas")
+
+    Returns:
+        str: CSS pronto para setStyleSheet()
+    """
+    return ESTILOS[nome]
+
+
+def banco_palavras():
+    """
+    Retorna o banco de palavras, lido do JSON apenas uma vez por processo.
+
+    Returns:
+        list: Lista de {'palavra', 'dica'} (não deve ser modificada)
+    """
+    from game import game
+    return game.carregar_palavras()
@@ -0,0 +1,72 @@
+"""
+UTILS/STARTUP.PY - Medição do Tempo de Inicialização
+====================================================
+Este módulo registra marcos da inicialização do jogo e imprime o relatório.
+Responsável por:
+- Guardar o instante de cada etapa (imports, QApplication, splash, fontes, menu)
+- Detectar o primeiro frame pintado do menu (menu realmente visível)
+- Imprimir a divisão de tempo entre as etapas via consts.log
+
+Uso:
+    from utils import startup
+    startup.marcar("qapplication")
+    ...
+    startup.relatar_quando_visivel(menu)
+
+Os tempos são relativos ao primeiro import deste módulo, que main.py faz
+antes de qualquer outro import pesado (PyQt6, telas).
+"""
+
+import time
+
+from consts import log
+
+_inicio = time.perf_counter()
+_marcos = []  # Lista de (nome_etapa, instante)
+
+
+def marcar(etapa):
+    """
+    Registra o fim de uma etapa da inicialização.
+
+    Args:
+        etapa (str): Nome curto da etapa (ex: "imports", "menu construido")
+    """
+    _marcos.append((etapa, time.perf_counter()))
+
+
+def relatorio():
+    """
+    Monta o texto com a duração de cada etapa e o total.
+
+    Returns:
+        str: Relatório de uma etapa por linha
+    """
+    linhas = []
+    anterior = _inicio
+    for etapa, instante in _marcos:
+        linhas.append(f"  {etapa:<22} +{(instante - anterior) * 1000:7.1f} ms  (t={(instante - _inicio) * 1000:7.1f} ms)")
+        anterior = instante
+    return "\n".join(linhas)
+
+
+def relatar_quando_visivel(widget):
+    """
+    Imprime o relatório quando o widget pintar pela primeira vez.
+
+    Args:
+        widget (QWidget): Primeira janela "útil" (o menu principal)
+    """
+    from PyQt6.QtCore import QObject, QEvent
+
+    class _PrimeiroFrame(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint:
+                obj.removeEventFilter(self)
+                marcar("menu visivel")
+                log("startup", "tempo de inicialização:\n" + relatorio())
+                self.deleteLater()
+            return False
+
+    # Parent no widget mantém o filtro vivo até o primeiro Paint
+    widget.installEventFilter(_PrimeiroFrame(widget))
@@ -6,9 +6,12 @@ Responsável por:
 - Padronizar a criação de botões em todo o jogo
 - Manter consistência visual entre as telas
 - Centralizar estilos CSS dos componentes reutilizáveis
+- Exibir o splash de inicialização
 """
 
-from PyQt6.QtWidgets import QPushButton
+from PyQt6.QtWidgets import QPushButton, QLabel, QApplication
+from PyQt6.QtCore import Qt
+from utils.recursos import estilo
 
 
 def criar_botao(texto, func, font_pixel=None):
@@ -50,17 +53,32 @@ def criar_botao(texto, func, font_pixel=None):
     if func:
         btn.clicked.connect(func)
     
-    # Aplicar estilo CSS padronizado
-    btn.setStyleSheet("""
-        QPushButton {
-            background-color: #ff8c00;  /* Laranja padrão */
-            color: black;               /* Texto preto para contraste */
-            border-radius: 20px;        /* Bordas arredondadas */
-            font-size: 18px;           /* Tamanho da fonte */
-        }
-        QPushButton:hover {
-            background-color: #ffa733;  /* Laranja mais claro no hover */
-        }
-    """)
+    # Aplicar estilo CSS padronizado (compartilhado via utils.recursos)
+    btn.setStyleSheet(estilo("botao"))
     
-    return btn
\ No newline at end of file
+    return btn
+
+def mostrar_splash():
+    """
+    Exibe imediatamente uma tela de carregamento do tamanho das janelas do jogo.
+
+    O splash não depende da fonte pixel nem de nenhuma tela do jogo, então pode
+    ser mostrado logo após a criação da QApplication, enquanto o restante da
+    inicialização acontece.
+
+    Usa um QLabel simples em vez de QSplashScreen, cujo show() pode bloquear
+    esperando a exposição da janela.
+
+    Returns:
+        QLabel: Splash visível; fechar com close() quando o menu abrir
+    """
+    splash = QLabel("carregando...")
+    splash.setWindowFlags(Qt.WindowType.SplashScreen | Qt.WindowType.FramelessWindowHint)
+    splash.setFixedSize(1280, 720)  # Mesmo tamanho das telas: transição sem "piscar"
+    splash.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    splash.setStyleSheet(estilo("splash"))
+    splash.show()
+
+    # Processa os eventos pendentes para que o splash seja pintado agora
+    QApplication.processEvents()
+    return splash
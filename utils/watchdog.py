@@ -0,0 +1,161 @@
+"""
+UTILS/WATCHDOG.PY - Detector de Travamentos do Loop de Eventos
+==============================================================
+Este módulo implementa o "cão de guarda" acionado por `python main.py --watchdog`.
+Responsável por:
+- Detectar quando a thread principal do Qt fica bloqueada acima de um limite
+  (ex: geração em select_difficulty, construção da TelaJogo, loops de restyle)
+- Capturar a pilha Python da thread principal no momento do travamento
+- Registrar a duração e a pilha via consts.log e em travamentos.log
+
+Funcionamento:
+- Um QTimer na thread principal atualiza um "batimento" a cada limite/2 ms
+- Uma thread auxiliar verifica o batimento; se ele atrasar mais que o limite,
+  lê a pilha da thread principal com sys._current_frames()
+- Quando o loop volta a responder, o próximo batimento enfileira a duração
+  total do travamento junto com a pilha capturada
+- A thread auxiliar formata a pilha (lê o código-fonte via linecache) fora
+  do lock e grava os travamentos enfileirados: a thread principal não
+  espera por disco nem pela formatação
+"""
+
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+from PyQt6.QtCore import QCoreApplication, QTimer, Qt
+
+from consts import get_app_dir, log
+
+LIMITE_PADRAO_MS = 50  # Travamentos acima disto são registrados
+ESPERA_PARAR_S = 2.0   # Espera máxima pela thread auxiliar ao desligar (gravação dos pendentes)
+
+
+class WatchdogLoop:
+    """
+    Detecta travamentos da thread principal acima de um limite configurável.
+
+    Deve ser criado na thread principal depois da QApplication.
+    """
+
+    def __init__(self, limite_ms=LIMITE_PADRAO_MS, arquivo=None):
+        """
+        Args:
+            limite_ms (int): Duração mínima (ms) para um bloqueio ser registrado
+            arquivo (str, optional): Arquivo de log dos travamentos
+                                     (padrão: travamentos.log ao lado do executável)
+        """
+        self.limite = max(1, int(limite_ms)) / 1000.0
+        self.arquivo = arquivo or os.path.join(get_app_dir(), "travamentos.log")
+        self.total_travamentos = 0
+        self._main_id = threading.main_thread().ident
+        self._ultimo_batimento = time.perf_counter()
+        self._captura = None            # {"pilha": texto} do travamento atual (preenchida pela thread auxiliar)
+        self._pendentes = deque()       # (duração ms, captura) a gravar pela thread auxiliar
+        self._lock = threading.Lock()
+        self._parar = threading.Event()
+
+        # Batimento na thread principal: só roda quando o loop está livre
+        self._timer = QTimer()
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(max(1, int(limite_ms) // 2))
+        self._timer.timeout.connect(self._batimento)
+
+        self._thread = threading.Thread(target=self._vigiar, name="watchdog-loop", daemon=True)
+
+    def iniciar(self):
+        """Liga o batimento e a thread de vigilância."""
+        self._ultimo_batimento = time.perf_counter()
+        self._timer.start()
+        self._thread.start()
+        log("watchdog", f"vigiando travamentos acima de {self.limite * 1000:.0f} ms")
+
+    def parar(self):
+        """
+        Desliga o watchdog e espera a thread auxiliar gravar os pendentes e terminar.
+
+        Ligado ao aboutToQuit da aplicação por iniciar_watchdog: a thread é
+        daemon e, sem esta espera, morreria na saída com travamentos ainda
+        na fila.
+        """
+        self._timer.stop()
+        self._parar.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=ESPERA_PARAR_S)
+
+    # ============================================================================
+    # THREAD PRINCIPAL
+    # ============================================================================
+
+    def _batimento(self):
+        """Executado pelo loop do Qt; registra o travamento anterior se houve."""
+        agora = time.perf_counter()
+        with self._lock:
+            anterior = self._ultimo_batimento
+            captura = self._captura
+            self._ultimo_batimento = agora
+            self._captura = None
+        if captura is not None:
+            self.total_travamentos += 1
+            self._pendentes.append(((agora - anterior) * 1000.0, captura))
+
+    # ============================================================================
+    # THREAD DE VIGILÂNCIA
+    # ============================================================================
+
+    def _registrar(self, duracao_ms, pilha):
+        """Registra um travamento no log e em travamentos.log (thread auxiliar)."""
+        log("watchdog", f"loop de eventos travado por {duracao_ms:.0f} ms; pilha no travamento:\n{pilha}")
+        try:
+            with open(self.arquivo, "a", encoding="utf-8") as f:
+                f.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] travamento de {duracao_ms:.0f} ms\n")
+                f.write(pilha)
+                f.write("\n")
+        except OSError:
+            pass  # Sem permissão de escrita: fica só no log do console
+
+    def _gravar_pendentes(self):
+        """Registra os travamentos enfileirados pelo batimento."""
+        while self._pendentes:
+            duracao_ms, captura = self._pendentes.popleft()
+            self._registrar(duracao_ms, captura["pilha"])
+
+    def _vigiar(self):
+        """Verifica o batimento, captura a pilha principal quando ele atrasa e grava os travamentos."""
+        while not self._parar.wait(self.limite / 2):
+            self._gravar_pendentes()
+            with self._lock:
+                atrasado = time.perf_counter() - self._ultimo_batimento > self.limite
+                if not atrasado or self._captura is not None:
+                    continue
+                frame = sys._current_frames().get(self._main_id)
+                if frame is None:
+                    continue
+                captura = self._captura = {"pilha": ""}
+            # Formatar lê o código-fonte (linecache): fora do lock, para não
+            # segurar o batimento. Esta mesma thread grava os pendentes, então
+            # a pilha está pronta antes de o travamento ser gravado
+            captura["pilha"] = "".join(traceback.format_stack(frame))
+            del frame
+        self._gravar_pendentes()
+
+
+def iniciar_watchdog(limite_ms=LIMITE_PADRAO_MS):
+    """
+    Cria e liga um WatchdogLoop, desligado (com os pendentes gravados) no
+    aboutToQuit da aplicação.
+
+    Args:
+        limite_ms (int): Limite de travamento em milissegundos
+
+    Returns:
+        WatchdogLoop: Watchdog ativo (manter a referência enquanto a app roda)
+    """
+    watchdog = WatchdogLoop(limite_ms)
+    watchdog.iniciar()
+    # Grava os travamentos pendentes antes de a aplicação sair
+    QCoreApplication.instance().aboutToQuit.connect(watchdog.parar)
+    return watchdog